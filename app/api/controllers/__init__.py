@@ -7,6 +7,8 @@ from .todos import router as todos_router
 from .routines import router as routines_router
 from .habits import router as habits_router
 from .task import router as task_router
+from .imports import router as imports_router
+from .metrics import router as metrics_router
 
 
 router = APIRouter()
@@ -19,3 +21,5 @@ router.include_router(todos_router)
 router.include_router(routines_router)
 router.include_router(habits_router)
 router.include_router(task_router)
+router.include_router(imports_router)
+router.include_router(metrics_router)
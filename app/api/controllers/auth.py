@@ -8,9 +8,9 @@ from fastapi import (
     Cookie,
 )
 
-from ..dao import get_auth_dao
+from ..dao import get_async_auth_dao
 from ..dao.auth_dao import AuthDAO
-from app.database.db import tx_manager
+from app.database.db import async_tx_manager
 
 from app.schemas.auth import (
     LoginInput,
@@ -29,13 +29,13 @@ router = APIRouter(prefix="/auth", tags=["auth"])
     status_code=status.HTTP_201_CREATED,
     operation_id="signup",
 )
-def signup(
+async def signup(
     data: SignupInput,
-    auth_dao: AuthDAO = Depends(get_auth_dao),
-    tx_manager: None = Depends(tx_manager),
+    auth_dao: AuthDAO = Depends(get_async_auth_dao),
+    tx_manager: None = Depends(async_tx_manager),
 ):
-    with tx_manager:
-        auth_dao.sign_up(data)
+    async with tx_manager:
+        await auth_dao.sign_up(data)
 
     return None
 
@@ -46,14 +46,14 @@ def signup(
     status_code=status.HTTP_200_OK,
     operation_id="login",
 )
-def login(
+async def login(
     data: LoginInput,
     response: FastAPIResponse,
-    auth_dao: AuthDAO = Depends(get_auth_dao),
-    tx_manager: None = Depends(tx_manager),
+    auth_dao: AuthDAO = Depends(get_async_auth_dao),
+    tx_manager: None = Depends(async_tx_manager),
 ):
-    with tx_manager:
-        refresh_token, access_token, user = auth_dao.login(
+    async with tx_manager:
+        refresh_token, access_token, user = await auth_dao.login(
             data.username, data.password
         )
 
@@ -103,7 +103,7 @@ async def refresh(
     response: FastAPIResponse,
     include_user_info: bool = False,
     refresh_token: Annotated[str | None, Cookie()] = None,
-    auth_dao: AuthDAO = Depends(get_auth_dao),
+    auth_dao: AuthDAO = Depends(get_async_auth_dao),
 ):
     if not refresh_token:
         headers = {
@@ -118,7 +118,7 @@ async def refresh(
 
     try:
         if include_user_info:
-            access_token, user = auth_dao.refresh_with_user_info(
+            access_token, user = await auth_dao.refresh_with_user_info(
                 refresh_token=refresh_token
             )
             return RefreshOutput(
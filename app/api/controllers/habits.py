@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.errors import DATA_DOES_NOT_EXIST
 from app.core.auth import verify_access_token
+from app.core.responses import FastJSONResponse
 from app.database.db import tx_manager
 from app.exceptions.exceptions import DataNotFoundError
 from ..repositories import get_habit_repository
@@ -13,6 +14,7 @@ from app.schemas.habit import (
     HabitLogPublic,
     HabitPublic,
     HabitListGetParams,
+    HabitStatsPublic,
     HabitUpdateInput,
     HabitWithLog,
 )
@@ -37,6 +39,7 @@ def create_habit(
 ):
     with tx_manager:
         habit = repository.create_habit(data)
+        repository.invalidate_task_cache()
 
     return HabitPublic.from_orm(habit)
 
@@ -53,7 +56,28 @@ def get_habits(
 ):
     habits_with_logs = repository.get_habits_with_date_logs(**params.dict())
 
-    return habits_with_logs
+    return FastJSONResponse(habits_with_logs)
+
+
+@router.get(
+    "/{habit_id}/stats",
+    response_model=HabitStatsPublic,
+    status_code=status.HTTP_200_OK,
+    operation_id="getHabitStats",
+)
+def get_habit_stats(
+    habit_id: int,
+    repository: HabitRepository = Depends(get_habit_repository),
+):
+    try:
+        stats = repository.get_habit_stats(habit_id=habit_id)
+    except DataNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=DATA_DOES_NOT_EXIST,
+        )
+
+    return stats
 
 
 @router.delete(
@@ -72,6 +96,7 @@ def delete_habit(
             repository.delete_habit(
                 habit_id=habit_id,
             )
+            repository.invalidate_task_cache()
         except DataNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -97,6 +122,7 @@ def achieve_habit(
             log = repository.achieve_habit(
                 habit_id=habit_id,
             )
+            repository.invalidate_task_cache()
         except DataNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -123,6 +149,7 @@ def update_habit(
             habit = repository.update_habit(
                 habit_id=habit_id, update_input=data
             )
+            repository.invalidate_task_cache()
         except DataNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1,8 +1,27 @@
 from fastapi import APIRouter
 
+from app.core.cache import task_cache
+from app.database.db import get_pool_stats
+
+# /metrics 와 마찬가지로 프로브와 수집기가 토큰 없이 부르도록 일부러 인증을
+# 걸지 않는다. 사용자 데이터 없이 집계값만 내보내며, 외부에 노출하지 않으려면
+# 리버스 프록시에서 /health/health 만 열고 나머지는 내부망에서만 받는다.
 router = APIRouter(prefix="/health", tags=["health"])
 
 
 @router.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+
+@router.get("/pool", include_in_schema=False)
+def pool_stats():
+    return get_pool_stats()
+
+
+@router.get("/cache", include_in_schema=False)
+def cache_stats():
+    if task_cache is None:
+        return {"backend": None}
+
+    return task_cache.stats()
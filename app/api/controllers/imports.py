@@ -0,0 +1,108 @@
+from contextlib import contextmanager
+from typing import IO, Callable
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.errors import UNSUPPORTED_MEDIA_TYPE
+from app.core.auth import verify_access_token
+from app.core.imports import import_format, spool_request_body
+from app.database.db import tx_manager
+
+from ..repositories import get_import_repository
+from ..repositories.import_repository import ImportRepository
+
+from app.schemas.imports import ImportResult
+
+router = APIRouter(
+    prefix="/import",
+    tags=["import"],
+    dependencies=[Depends(verify_access_token)],
+)
+
+IMPORT_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/x-ndjson": {"schema": {"type": "string"}},
+            "text/csv": {"schema": {"type": "string"}},
+        },
+    }
+}
+
+
+async def _run_import(
+    request: Request,
+    repository: ImportRepository,
+    import_rows: Callable[[IO[bytes], str], ImportResult],
+    tx_manager: contextmanager,
+) -> ImportResult:
+    body_format = import_format(request.headers.get("content-type"))
+    if body_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=UNSUPPORTED_MEDIA_TYPE,
+        )
+
+    body = await spool_request_body(request)
+
+    # 검증과 COPY 는 동기 세션을 쓰므로 스레드풀에서 실행한다
+    def run() -> ImportResult:
+        with body, tx_manager:
+            result = import_rows(body, body_format)
+            if result.imported:
+                repository.invalidate_task_cache()
+
+        return result
+
+    return await run_in_threadpool(run)
+
+
+@router.post(
+    "/todos",
+    response_model=ImportResult,
+    status_code=status.HTTP_200_OK,
+    operation_id="importTodos",
+    openapi_extra=IMPORT_REQUEST_BODY,
+)
+async def import_todos(
+    request: Request,
+    repository: ImportRepository = Depends(get_import_repository),
+    tx_manager: contextmanager = Depends(tx_manager),
+):
+    return await _run_import(
+        request, repository, repository.import_todos, tx_manager
+    )
+
+
+@router.post(
+    "/habits",
+    response_model=ImportResult,
+    status_code=status.HTTP_200_OK,
+    operation_id="importHabits",
+    openapi_extra=IMPORT_REQUEST_BODY,
+)
+async def import_habits(
+    request: Request,
+    repository: ImportRepository = Depends(get_import_repository),
+    tx_manager: contextmanager = Depends(tx_manager),
+):
+    return await _run_import(
+        request, repository, repository.import_habits, tx_manager
+    )
+
+
+@router.post(
+    "/routines",
+    response_model=ImportResult,
+    status_code=status.HTTP_200_OK,
+    operation_id="importRoutines",
+    openapi_extra=IMPORT_REQUEST_BODY,
+)
+async def import_routines(
+    request: Request,
+    repository: ImportRepository = Depends(get_import_repository),
+    tx_manager: contextmanager = Depends(tx_manager),
+):
+    return await _run_import(
+        request, repository, repository.import_routines, tx_manager
+    )
@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import collect, render
+
+router = APIRouter(tags=["metrics"])
+
+
+# 지표는 이벤트 루프 스레드에서만 다루므로 async 로 둔다
+@router.get(
+    "/metrics", response_class=PlainTextResponse, include_in_schema=False
+)
+async def metrics():
+    return PlainTextResponse(
+        render(collect()),
+        media_type="text/plain; version=0.0.4",
+    )
@@ -1,13 +1,22 @@
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import date, datetime
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pytz import timezone
 
+from app.api.errors import (
+    INVALID_VALUE_RANGE,
+    START_DATE_GREATER_THAN_END_DATE,
+)
 from app.core.auth import verify_access_token
+from app.core.config import ROUTINE_HISTORY_MAX_DAYS
+from app.core.responses import FastJSONResponse
 
 from ..dao import get_routine_dao, get_routine_log_dao
-from ..repositories import get_routine_repository
+from ..repositories import (
+    get_async_routine_repository,
+    get_routine_repository,
+)
 from ..repositories.routine_repository import RoutineRepository
 
 from ..dao.routine_dao import RoutineDAO
@@ -17,6 +26,7 @@ from app.database.db import tx_manager
 
 from app.schemas.routine import (
     RoutineCreateInput,
+    RoutineDailySummaryPublic,
     RoutinePublic,
     RoutineLogPutInput,
     RoutineUpdateInput,
@@ -42,6 +52,7 @@ def create_routine(
 ):
     with tx_manager:
         routine = repository.create_routine(data)
+        repository.invalidate_task_cache()
 
     return routine
 
@@ -52,14 +63,14 @@ def create_routine(
     status_code=status.HTTP_200_OK,
     operation_id="getRoutineList",
 )
-def get_routine_list(
-    repository: RoutineRepository = Depends(get_routine_repository),
+async def get_routine_list(
+    repository: RoutineRepository = Depends(get_async_routine_repository),
 ):
-    routine_list = repository.get_routine_list(
+    routine_list = await repository.get_routine_list(
         datetime.now(timezone("Asia/Seoul")).date()
     )
 
-    return routine_list
+    return FastJSONResponse(routine_list)
 
 
 @router.get(
@@ -76,6 +87,34 @@ def get_routine(routine_id: int, dao: RoutineDAO = Depends(get_routine_dao)):
     return routine
 
 
+@router.get(
+    "/{routine_id}/history",
+    response_model=List[RoutineDailySummaryPublic],
+    status_code=status.HTTP_200_OK,
+    operation_id="getRoutineHistory",
+)
+def get_routine_history(
+    routine_id: int,
+    start_date: date = Query(alias="from"),
+    end_date: date = Query(alias="to"),
+    routine_log_dao: RoutineLogDAO = Depends(get_routine_log_dao),
+):
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=START_DATE_GREATER_THAN_END_DATE,
+        )
+    elif (end_date - start_date).days >= ROUTINE_HISTORY_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=INVALID_VALUE_RANGE,
+        )
+
+    return routine_log_dao.get_daily_summaries(
+        routine_id=routine_id, start_date=start_date, end_date=end_date
+    )
+
+
 @router.delete(
     "/{routine_id}",
     response_model=None,
@@ -89,6 +128,7 @@ def delete_routine(
 ):
     with tx_manager:
         dao.delete_routine(routine_id)
+        dao.invalidate_task_cache()
 
     return None
 
@@ -107,6 +147,7 @@ def put_routine_log(
 ):
     with tx_manager:
         routine_log_dao.put_logs(routine_id=routine_id, logs=data.logs)
+        routine_log_dao.invalidate_task_cache()
 
     return None
 
@@ -127,5 +168,6 @@ def update_routine(
         routine = repository.update_routine(
             routine_id=routine_id, routine=data
         )
+        repository.invalidate_task_cache()
 
-    return RoutinePublic.from_routine(routine, routine.routine_elements)
+    return routine
@@ -1,8 +1,11 @@
 from datetime import date
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from app.core.auth import verify_access_token
-from ..repositories import get_task_repository
+from app.core.cache import task_cache
+from app.core.config import TASK_AGGREGATED_QUERY
+from app.core.responses import FastJSONResponse
+from ..repositories import get_async_task_repository
 from ..repositories.task_repository import TaskRepository
 
 from app.schemas.task import TaskPublic
@@ -21,10 +24,29 @@ router = APIRouter(
     status_code=status.HTTP_200_OK,
     operation_id="getAllDailyTask",
 )
-def get_today_all_task(
+async def get_today_all_task(
     date: date,
-    task_repository: TaskRepository = Depends(get_task_repository),
+    task_repository: TaskRepository = Depends(get_async_task_repository),
 ):
-    all_task = task_repository.get_all_task_by_date(date)
+    user_id = task_repository.user_id
 
-    return all_task
+    generation = None
+    if task_cache is not None:
+        generation, cached = await task_cache.run(
+            task_cache.lookup, user_id, date
+        )
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+    if TASK_AGGREGATED_QUERY:
+        all_task = await task_repository.get_all_task_by_date_aggregated(date)
+    else:
+        all_task = await task_repository.get_all_task_by_date(date)
+
+    response = FastJSONResponse(all_task)
+    if generation is not None:
+        await task_cache.run(
+            task_cache.set, user_id, date, generation, response.body
+        )
+
+    return response
@@ -3,10 +3,11 @@ from datetime import date, datetime, timedelta
 from pytz import timezone
 
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.core.auth import verify_access_token
-from ..dao import get_todo_dao
+from app.core.responses import FastJSONResponse
+from ..dao import get_async_todo_dao, get_todo_dao
 from ..dao.todo_dao import TodoDAO
 from app.database.db import tx_manager
 
@@ -57,6 +58,7 @@ def create_todo(
             target_date=data.target_date,
             order=data.order,
         )
+        dao.invalidate_task_cache()
 
     return TodoPublic.from_orm(todo)
 
@@ -76,6 +78,7 @@ def update_todo_list_order(
         dao.update_todo_list_order(
             todo_list=data.todo_list,
         )
+        dao.invalidate_task_cache()
 
     return None
 
@@ -100,6 +103,7 @@ def update_todo(
             completed=data.completed,
             content=data.content,
         )
+        todo_dao.invalidate_task_cache()
 
     return TodoPublic.from_orm(todo)
 
@@ -119,6 +123,7 @@ def delete_todo(
         todo_dao.delete_todo(
             todo_id=todo_id,
         )
+        todo_dao.invalidate_task_cache()
 
     return None
 
@@ -129,20 +134,30 @@ def delete_todo(
     status_code=status.HTTP_200_OK,
     operation_id="getTodoList",
 )
-def get_todo_list(
-    limit: int = 30,
+async def get_todo_list(
+    limit: int = Query(30, ge=1, le=100),
     offset: int = 0,
     completed: bool = False,
     start_date: date | None = None,
     end_date: date | None = None,
-    todo_dao: TodoDAO = Depends(get_todo_dao),
+    cursor: str | None = None,
+    todo_dao: TodoDAO = Depends(get_async_todo_dao),
 ):
-    todo_list = todo_dao.get_todo_list(
+    todo_list = await todo_dao.get_todo_list(
         completed=completed,
         limit=limit,
         offset=offset,
         start_date=start_date,
         end_date=end_date,
+        cursor=cursor,
+    )
+
+    response = FastJSONResponse(
+        [TodoPublic.from_orm(todo) for todo in todo_list]
     )
 
-    return [TodoPublic.from_orm(todo) for todo in todo_list]
+    next_cursor = todo_dao.get_next_cursor(todo_list, limit, completed)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return response
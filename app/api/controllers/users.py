@@ -1,11 +1,15 @@
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 
 from app.core.auth import verify_access_token
+from app.core.config import EXPORT_BATCH_SIZE
+from app.core.utils import gzip_chunks
 
-from ..dao import get_user_dao
+from ..dao import get_async_export_dao, get_async_user_dao
+from ..dao.export_dao import ExportDAO
 from ..dao.user_dao import UserDAO
-from app.database.db import tx_manager
+from app.database.db import async_tx_manager
 
 from app.schemas.user import UserData, UserUpdateInput
 
@@ -22,10 +26,8 @@ router = APIRouter(
     status_code=status.HTTP_200_OK,
     operation_id="getMe",
 )
-def get_me(
-    user_dao: UserDAO = Depends(get_user_dao)
-):
-    return UserData.from_orm(user_dao.get_me())
+async def get_me(user_dao: UserDAO = Depends(get_async_user_dao)):
+    return UserData.from_orm(await user_dao.get_me())
 
 
 @router.put(
@@ -34,12 +36,44 @@ def get_me(
     status_code=status.HTTP_200_OK,
     operation_id="updateMe",
 )
-def update_me(
+async def update_me(
     data: UserUpdateInput,
-    user_dao: UserDAO = Depends(get_user_dao),
-    tx_manager: contextmanager = Depends(tx_manager),
+    user_dao: UserDAO = Depends(get_async_user_dao),
+    tx_manager: asynccontextmanager = Depends(async_tx_manager),
 ):
-    with tx_manager:
-        user = user_dao.update_me(data)
+    async with tx_manager:
+        user = await user_dao.update_me(data)
 
     return UserData.from_orm(user)
+
+
+@router.get(
+    "/me/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    operation_id="exportMe",
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}, "application/gzip": {}},
+            "description": "One JSON record per line",
+        }
+    },
+)
+async def export_me(
+    gzip: bool = False,
+    export_dao: ExportDAO = Depends(get_async_export_dao),
+):
+    chunks = export_dao.stream_export(batch_size=EXPORT_BATCH_SIZE)
+    filename = "taskie-export.ndjson"
+    media_type = "application/x-ndjson"
+
+    if gzip:
+        chunks = gzip_chunks(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
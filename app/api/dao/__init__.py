@@ -1,13 +1,15 @@
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.core.auth import verify_access_token
 
-from app.database.db import get_db
+from app.database.db import get_async_db, get_db
 from .routine_dao import RoutineDAO
 from .routine_element_dao import RoutineElementDAO
 from .todo_dao import TodoDAO
 from .auth_dao import AuthDAO
 from .user_dao import UserDAO
+from .export_dao import ExportDAO
 from .routine_log_dao import RoutineLogDAO
 
 
@@ -30,18 +32,33 @@ def get_todo_dao(
     return TodoDAO(db=db, user_id=id)
 
 
-def get_auth_dao(
-    session: Session = Depends(get_db),
+def get_async_todo_dao(
+    db: AsyncSession = Depends(get_async_db),
+    id: int = Depends(verify_access_token),
+) -> TodoDAO:
+    return TodoDAO(db=db, user_id=id)
+
+
+def get_async_auth_dao(
+    session: AsyncSession = Depends(get_async_db),
 ) -> AuthDAO:
     return AuthDAO(db=session)
 
 
-def get_user_dao(
-    session: Session = Depends(get_db), id: int = Depends(verify_access_token)
+def get_async_user_dao(
+    session: AsyncSession = Depends(get_async_db),
+    id: int = Depends(verify_access_token),
 ) -> UserDAO:
     return UserDAO(db=session, user_id=id)
 
 
+def get_async_export_dao(
+    session: AsyncSession = Depends(get_async_db),
+    id: int = Depends(verify_access_token),
+) -> ExportDAO:
+    return ExportDAO(db=session, user_id=id)
+
+
 def get_routine_log_dao(
     session: Session = Depends(get_db), id: int = Depends(verify_access_token)
 ) -> RoutineLogDAO:
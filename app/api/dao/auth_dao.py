@@ -1,5 +1,6 @@
 from typing import Tuple
 from fastapi import HTTPException, status
+from sqlalchemy import select
 from app.api.errors import (
     EMAIL_ALREADY_EXISTS,
     INCORRECT_USERNAME_OR_PASSWORD,
@@ -9,9 +10,8 @@ from app.api.errors import (
 from app.core.auth import (
     create_access_token,
     create_refresh_token,
-    get_password_hash,
+    password_hasher,
     refresh_token_decode,
-    verify_password,
 )
 
 from app.models.models import User
@@ -22,63 +22,68 @@ from .base import BaseDAO
 
 class AuthDAO(BaseDAO):
 
-    def check_existing_email(self, email: str) -> bool:
-        return self.db.query(User).filter_by(email=email).first() is not None
+    async def check_existing_email(self, email: str) -> bool:
+        user = await self.db.scalar(select(User).filter_by(email=email))
 
-    def check_existing_username(self, username: str) -> bool:
-        return (
-            self.db.query(User).filter_by(username=username).first()
-            is not None
-        )
+        return user is not None
 
-    def sign_up(self, data: SignupInput) -> User:
-        password_hash = get_password_hash(data.password)
+    async def check_existing_username(self, username: str) -> bool:
+        user = await self.db.scalar(select(User).filter_by(username=username))
 
-        user = User(
-            username=data.username,
-            password=password_hash,
-            email=data.email,
-            nickname=data.nickname or data.username,
-            profile_image="",
-        )
+        return user is not None
 
-        if self.check_existing_username(user.username):
+    async def sign_up(self, data: SignupInput) -> User:
+        if await self.check_existing_username(data.username):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=USERNAME_ALREADY_EXISTS,
             )
 
-        if self.check_existing_email(user.email):
+        if await self.check_existing_email(data.email):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=EMAIL_ALREADY_EXISTS,
             )
 
+        password_hash = await password_hasher.hash(data.password)
+
+        user = User(
+            username=data.username,
+            password=password_hash,
+            email=data.email,
+            nickname=data.nickname or data.username,
+            profile_image="",
+        )
+
         self.db.add(user)
 
         return user
 
-    def authenticate_user(self, username: str, password: str):
-        user = self.get_user_by_username(username)
+    async def authenticate_user(self, username: str, password: str):
+        user = await self.get_user_by_username(username)
 
         if not user:
             return False
-        if not verify_password(password, user.password):
+        if not await password_hasher.verify(password, user.password):
             return False
         return user
 
-    def get_user_by_username(self, username: str) -> User | None:
-        user = self.db.query(User).filter(User.username == username).first()
+    async def get_user_by_username(self, username: str) -> User | None:
+        user = await self.db.scalar(
+            select(User).filter(User.username == username)
+        )
 
         return user
-    
-    def get_user_by_id(self, id: int) -> User | None:
-        user = self.db.query(User).filter(User.id == id).first()
+
+    async def get_user_by_id(self, id: int) -> User | None:
+        user = await self.db.scalar(select(User).filter(User.id == id))
 
         return user
 
-    def login(self, username: str, password: str) -> Tuple[str, str, User]:
-        user = self.authenticate_user(username, password)
+    async def login(
+        self, username: str, password: str
+    ) -> Tuple[str, str, User]:
+        user = await self.authenticate_user(username, password)
 
         if not user:
             raise HTTPException(
@@ -98,17 +103,18 @@ class AuthDAO(BaseDAO):
 
         return access_token
 
-    def refresh_with_user_info(self, refresh_token: str) -> Tuple[str, User]:
+    async def refresh_with_user_info(
+        self, refresh_token: str
+    ) -> Tuple[str, User]:
         id: int = refresh_token_decode(refresh_token)
         access_token = create_access_token(id)
-        
-        user = self.get_user_by_id(id)
+
+        user = await self.get_user_by_id(id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=USER_NOT_FOUND,
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        
+
         return access_token, user
-    
\ No newline at end of file
@@ -1,13 +1,19 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cache import mark_task_cache_dirty
+
 
 class BaseDAO:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session | AsyncSession):
         self.db = db
 
 
 class ProtectedBaseDAO(BaseDAO):
-    def __init__(self, db: Session, user_id: int):
+    def __init__(self, db: Session | AsyncSession, user_id: int):
         super().__init__(db)
 
         self.user_id = user_id
+
+    def invalidate_task_cache(self):
+        mark_task_cache_dirty(self.db, self.user_id)
@@ -0,0 +1,102 @@
+import json
+from datetime import date
+from typing import AsyncIterator
+
+from sqlalchemy import Select, select
+
+from app.models.models import (
+    Habit,
+    HabitLog,
+    Routine,
+    RoutineElement,
+    RoutineLog,
+    Todo,
+    User,
+)
+
+from .base import ProtectedBaseDAO
+
+
+def _json_default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def encode_record(record_type: str, row: dict) -> bytes:
+    line = json.dumps(
+        {"type": record_type, "data": row},
+        default=_json_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+    return line.encode() + b"\n"
+
+
+class ExportDAO(ProtectedBaseDAO):
+    def export_queries(self) -> list[tuple[str, Select]]:
+        user_columns = [
+            column
+            for column in User.__table__.columns
+            if column.name != "password"
+        ]
+
+        return [
+            ("user", select(*user_columns).where(User.id == self.user_id)),
+            (
+                "todo",
+                select(Todo.__table__)
+                .where(Todo.user_id == self.user_id)
+                .order_by(Todo.id),
+            ),
+            (
+                "habit",
+                select(Habit.__table__)
+                .where(Habit.user_id == self.user_id)
+                .order_by(Habit.id),
+            ),
+            (
+                "habit_log",
+                select(HabitLog.__table__)
+                .join(Habit, Habit.id == HabitLog.habit_id)
+                .where(Habit.user_id == self.user_id)
+                .order_by(HabitLog.id),
+            ),
+            (
+                "routine",
+                select(Routine.__table__)
+                .where(Routine.user_id == self.user_id)
+                .order_by(Routine.id),
+            ),
+            (
+                "routine_element",
+                select(RoutineElement.__table__)
+                .where(RoutineElement.user_id == self.user_id)
+                .order_by(RoutineElement.id),
+            ),
+            (
+                "routine_log",
+                select(RoutineLog.__table__)
+                .join(Routine, Routine.id == RoutineLog.routine_id)
+                .where(Routine.user_id == self.user_id)
+                .order_by(RoutineLog.id),
+            ),
+        ]
+
+    async def stream_export(self, batch_size: int) -> AsyncIterator[bytes]:
+        # 여러 테이블을 같은 스냅숏에서 읽어 내보낸 데이터끼리 어긋나지 않게 한다
+        await self.db.connection(
+            execution_options={"isolation_level": "REPEATABLE READ"}
+        )
+
+        for record_type, query in self.export_queries():
+            # 서버 측 커서로 batch_size 행씩 받아 메모리 사용량을 일정하게 유지한다
+            result = await self.db.stream(
+                query.execution_options(yield_per=batch_size)
+            )
+            async for rows in result.mappings().partitions():
+                yield b"".join(
+                    encode_record(record_type, dict(row)) for row in rows
+                )
@@ -0,0 +1,171 @@
+from typing import IO
+
+from sqlalchemy import (
+    TIMESTAMP,
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+
+from app.models.models import Habit, Routine, RoutineElement, Todo
+
+from .base import ProtectedBaseDAO
+
+# 가져오기 전용 임시 테이블로, 트랜잭션이 끝나면 사라진다
+staging_metadata = MetaData()
+
+
+def _staging_table(name: str, *columns: Column) -> Table:
+    return Table(
+        name,
+        staging_metadata,
+        Column("line", Integer, nullable=False),
+        *columns,
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
+
+
+todo_staging = _staging_table(
+    "import_todo",
+    Column("title", Text),
+    Column("order", Integer),
+    Column("target_date", TIMESTAMP(timezone=True)),
+    Column("content", Text),
+)
+
+habit_staging = _staging_table(
+    "import_habit",
+    Column("title", Text),
+    Column("start_time_minutes", Integer),
+    Column("end_time_minutes", Integer),
+    Column("repeat_time_minutes", Integer),
+    Column("repeat_days", Text),
+)
+
+routine_staging = _staging_table(
+    "import_routine",
+    Column("id", Integer),
+    Column("title", Text),
+    Column("start_time_minutes", Integer),
+    Column("repeat_days", Text),
+)
+
+routine_element_staging = _staging_table(
+    "import_routine_element",
+    Column("title", Text),
+    Column("order", Integer),
+    Column("duration_minutes", Integer),
+)
+
+
+class ImportDAO(ProtectedBaseDAO):
+    def _copy_into_staging(self, table: Table, rows: IO[str]) -> None:
+        connection = self.db.connection()
+        table.create(connection)
+
+        columns = ", ".join(
+            f'"{column.name}"'
+            for column in table.columns
+            if column.name != "id"
+        )
+        cursor = connection.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({columns}) FROM STDIN", rows
+            )
+        finally:
+            cursor.close()
+
+    def _insert_from_staging(
+        self, model, table: Table, columns: list[str]
+    ) -> int:
+        # 소유자는 요청한 사용자로만 채운다
+        result = self.db.execute(
+            insert(model).from_select(
+                columns + ["user_id"],
+                select(
+                    *[table.c[column] for column in columns],
+                    literal(self.user_id),
+                ).order_by(table.c.line),
+            )
+        )
+
+        return result.rowcount
+
+    def import_todos(self, rows: IO[str]) -> int:
+        self._copy_into_staging(todo_staging, rows)
+
+        return self._insert_from_staging(
+            Todo, todo_staging, ["title", "order", "target_date", "content"]
+        )
+
+    def import_habits(self, rows: IO[str]) -> int:
+        self._copy_into_staging(habit_staging, rows)
+
+        return self._insert_from_staging(
+            Habit,
+            habit_staging,
+            [
+                "title",
+                "start_time_minutes",
+                "end_time_minutes",
+                "repeat_time_minutes",
+                "repeat_days",
+            ],
+        )
+
+    def import_routines(
+        self, routine_rows: IO[str], routine_element_rows: IO[str]
+    ) -> int:
+        self._copy_into_staging(routine_staging, routine_rows)
+        self._copy_into_staging(routine_element_staging, routine_element_rows)
+
+        # 요소가 자기 루틴을 줄 번호로 찾을 수 있도록 id 를 먼저 정한다
+        self.db.execute(
+            update(routine_staging).values(
+                id=func.nextval(func.pg_get_serial_sequence("routine", "id"))
+            )
+        )
+        imported = self._insert_from_staging(
+            Routine,
+            routine_staging,
+            ["id", "title", "start_time_minutes", "repeat_days"],
+        )
+
+        self.db.execute(
+            insert(RoutineElement).from_select(
+                [
+                    "routine_id",
+                    "title",
+                    "order",
+                    "duration_minutes",
+                    "user_id",
+                ],
+                select(
+                    routine_staging.c.id,
+                    routine_element_staging.c.title,
+                    routine_element_staging.c.order,
+                    routine_element_staging.c.duration_minutes,
+                    literal(self.user_id),
+                )
+                .select_from(routine_element_staging)
+                .join(
+                    routine_staging,
+                    routine_staging.c.line == routine_element_staging.c.line,
+                )
+                .order_by(
+                    routine_element_staging.c.line,
+                    routine_element_staging.c.order,
+                ),
+            )
+        )
+
+        return imported
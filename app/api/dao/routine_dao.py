@@ -1,17 +1,23 @@
 from datetime import date
 from typing import List
 from fastapi import HTTPException, status
-from sqlalchemy import asc, func
+from sqlalchemy import and_, asc, select
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 from app.api.errors import DATA_DOES_NOT_EXIST
+from app.core.utils import on_date
 from app.schemas.routine import RoutineItem, RoutinePublic
 from .base import ProtectedBaseDAO
 from app.models.models import Routine, RoutineLog
 
 
 class RoutineDAO(ProtectedBaseDAO):
-    def get_routine_by_id(self, routine_id: int) -> Routine:
+    def get_routine_by_id(
+        self, routine_id: int, *options: LoaderOption
+    ) -> Routine:
         routine = (
             self.db.query(Routine)
+            .options(*options)
             .filter(Routine.id == routine_id, Routine.user_id == self.user_id)
             .first()
         )
@@ -24,54 +30,46 @@ class RoutineDAO(ProtectedBaseDAO):
 
         return routine
 
-    def get_routines(self) -> List[Routine]:
-        routines = (
-            self.db.query(Routine)
-            .filter(
+    async def get_routines(self) -> List[Routine]:
+        result = await self.db.scalars(
+            select(Routine)
+            .options(selectinload(Routine.routine_elements))
+            .where(
                 Routine.user_id == self.user_id,
             )
-            .order_by(Routine.start_time_minutes)
-            .all()
+            .order_by(Routine.start_time_minutes, Routine.id)
         )
 
-        return routines
+        return result.all()
 
-    def get_routines_by_weekday(self, weekday: int) -> List[Routine]:
-        routines = (
-            self.db.query(Routine)
-            .filter(
-                Routine.user_id == self.user_id,
-                Routine.repeat_days.contains(str(weekday)),
-            )
-            .order_by(Routine.start_time_minutes)
-            .all()
+    def routines_by_weekday_filter(self, weekday: int):
+        return and_(
+            Routine.user_id == self.user_id,
+            Routine.repeats_on(weekday),
+        )
+
+    async def get_routines_by_weekday(self, weekday: int) -> List[Routine]:
+        result = await self.db.scalars(
+            select(Routine)
+            .options(selectinload(Routine.routine_elements))
+            .where(self.routines_by_weekday_filter(weekday))
+            .order_by(Routine.start_time_minutes, Routine.id)
         )
 
-        return routines
+        return result.all()
 
     def get_routine_with_elements_by_id(
         self, routine_id: int, date: date
     ) -> RoutinePublic:
-        routine = (
-            self.db.query(Routine)
-            .filter(
-                Routine.id == routine_id,
-                Routine.user_id == self.user_id,
-            )
-            .first()
+        routine = self.get_routine_by_id(
+            routine_id, joinedload(Routine.routine_elements)
         )
 
-        if not routine:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=DATA_DOES_NOT_EXIST,
-            )
-
         routine_logs = (
             self.db.query(RoutineLog)
             .filter(
                 RoutineLog.routine_id == routine_id,
-                func.date(RoutineLog.completed_at) == date,
+                on_date(RoutineLog.completed_at, date),
             )
             .order_by(
                 asc(RoutineLog.routine_element_id),
@@ -107,7 +105,9 @@ class RoutineDAO(ProtectedBaseDAO):
         start_time_minutes: int | None,
         repeat_days: List[int] | None,
     ) -> Routine:
-        routine = self.get_routine_by_id(routine_id)
+        routine = self.get_routine_by_id(
+            routine_id, joinedload(Routine.routine_elements)
+        )
 
         routine.title = title or routine.title
         routine.start_time_minutes = (
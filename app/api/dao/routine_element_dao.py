@@ -1,5 +1,16 @@
 from fastapi import HTTPException, status
-from sqlalchemy import asc
+from sqlalchemy import (
+    Integer,
+    String,
+    any_,
+    asc,
+    column,
+    func,
+    insert,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import array
 
 from .base import ProtectedBaseDAO
 from app.api.errors import DATA_DOES_NOT_EXIST
@@ -14,6 +25,7 @@ class RoutineElementDAO(ProtectedBaseDAO):
             .filter(
                 RoutineElement.id == routine_element_id,
                 RoutineElement.user_id == self.user_id,
+                RoutineElement.deleted_at.is_(None),
             )
             .first()
         )
@@ -34,6 +46,7 @@ class RoutineElementDAO(ProtectedBaseDAO):
             .filter(
                 RoutineElement.routine_id == routine_id,
                 RoutineElement.user_id == self.user_id,
+                RoutineElement.deleted_at.is_(None),
             )
             .order_by(asc(RoutineElement.order))
             .all()
@@ -74,7 +87,7 @@ class RoutineElementDAO(ProtectedBaseDAO):
         return routine_element_result
 
     def delete_routine_element(self, routine_element: RoutineElement) -> None:
-        self.db.delete(routine_element)
+        routine_element.deleted_at = func.now()
 
     def delete_routine_element_by_id(self, routine_element_id: int) -> None:
         routine_element = self.get_routine_element_by_id(routine_element_id)
@@ -108,30 +121,30 @@ class RoutineElementDAO(ProtectedBaseDAO):
         routine_elements_dict = {
             routine_element.id: routine_element
             for routine_element in routine_elements
+            if routine_element.routine_id == routine_id
         }
 
+        updates = []
+        inserts = []
         for index, update_routine_element in enumerate(
             updates_routine_elements
         ):
-            routine_element = routine_elements_dict.get(
-                update_routine_element.id
-            )
+            title = update_routine_element.title
+            duration_minutes = update_routine_element.duration_minutes
 
-            if routine_element and routine_id == routine_element.routine_id:
-                self.update_routine_element(
-                    routine_element=routine_element,
-                    title=update_routine_element.title,
-                    order=index,
-                    duration_minutes=update_routine_element.duration_minutes,
+            if routine_elements_dict.pop(update_routine_element.id, None):
+                updates.append(
+                    (update_routine_element.id, title, index, duration_minutes)
                 )
-
-                routine_elements_dict.pop(update_routine_element.id)
             elif update_routine_element.id is None:
-                self.create_routine_element(
-                    routine_id=routine_id,
-                    title=update_routine_element.title,
-                    order=index,
-                    duration_minutes=update_routine_element.duration_minutes,
+                inserts.append(
+                    dict(
+                        user_id=self.user_id,
+                        routine_id=routine_id,
+                        title=title,
+                        order=index,
+                        duration_minutes=duration_minutes,
+                    )
                 )
             else:
                 raise HTTPException(
@@ -139,10 +152,65 @@ class RoutineElementDAO(ProtectedBaseDAO):
                     detail=DATA_DOES_NOT_EXIST,
                 )
 
-        for routine_element in routine_elements_dict.values():
-            self.delete_routine_element(routine_element)
+        # 남은 요소는 요청에서 빠진 것이므로 삭제 표시만 한다
+        delete_ids = list(routine_elements_dict)
+
+        result = []
+        if updates:
+            result.extend(self._update_routine_elements(routine_id, updates))
+        if inserts:
+            result.extend(
+                self.db.scalars(
+                    insert(RoutineElement).returning(RoutineElement), inserts
+                )
+            )
+        if delete_ids:
+            self.db.execute(
+                update(RoutineElement)
+                .where(
+                    RoutineElement.id == any_(array(delete_ids)),
+                    RoutineElement.user_id == self.user_id,
+                )
+                .values(deleted_at=func.now())
+                .execution_options(synchronize_session=False)
+            )
 
-        return self.get_routine_elements_by_routine_id(routine_id)
+        return sorted(result, key=lambda element: element.order)
+
+    def _update_routine_elements(
+        self, routine_id: int, updates: list[tuple]
+    ) -> list[RoutineElement]:
+        update_values = values(
+            column("id", Integer),
+            column("title", String),
+            column("order", Integer),
+            column("duration_minutes", Integer),
+            name="updates",
+        ).data(updates)
+
+        return self.db.scalars(
+            update(RoutineElement)
+            .where(
+                RoutineElement.id == update_values.c.id,
+                RoutineElement.routine_id == routine_id,
+                RoutineElement.user_id == self.user_id,
+                RoutineElement.deleted_at.is_(None),
+            )
+            # 한 건씩 고칠 때처럼 빈 제목과 0분은 기존 값을 유지한다
+            .values(
+                title=func.coalesce(
+                    func.nullif(update_values.c.title, ""),
+                    RoutineElement.title,
+                ),
+                order=update_values.c.order,
+                duration_minutes=func.coalesce(
+                    func.nullif(update_values.c.duration_minutes, 0),
+                    RoutineElement.duration_minutes,
+                ),
+            )
+            .returning(RoutineElement)
+            .execution_options(synchronize_session="fetch")
+        ).all()
 
     def create_routine_elements(
         self,
@@ -1,12 +1,55 @@
-from datetime import date
+from datetime import date, datetime
 from typing import List
-
-from sqlalchemy import func
+from fastapi import HTTPException, status
+from sqlalchemy import (
+    TIMESTAMP,
+    Boolean,
+    Integer,
+    column,
+    func,
+    literal,
+    select,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
 
 from .base import ProtectedBaseDAO
-from app.models.models import RoutineLog
+from app.api.errors import DATA_DOES_NOT_EXIST
+from app.core.utils import STORAGE_TIMEZONE, on_date
+from app.models.models import (
+    Routine,
+    RoutineDailySummary,
+    RoutineElement,
+    RoutineLog,
+)
 from app.schemas.routine import RoutineLogBase
 
+DAILY_SUMMARY_COLUMNS = [
+    "routine_id",
+    "log_date",
+    "log_count",
+    "completed_count",
+    "skipped_count",
+    "total_duration_seconds",
+]
+
+
+def daily_summary_select(*filters):
+    skipped = func.count().filter(RoutineLog.is_skipped)
+
+    return (
+        select(
+            RoutineLog.routine_id,
+            RoutineLog.log_date,
+            func.count(),
+            func.count() - skipped,
+            skipped,
+            func.sum(RoutineLog.duration_seconds),
+        )
+        .where(*filters)
+        .group_by(RoutineLog.routine_id, RoutineLog.log_date)
+    )
+
 
 class RoutineLogDAO(ProtectedBaseDAO):
     def get_routine_logs_by_date(
@@ -16,22 +59,134 @@ class RoutineLogDAO(ProtectedBaseDAO):
             self.db.query(RoutineLog)
             .filter(
                 RoutineLog.routine_id == routine_id,
-                target_date == func.date(RoutineLog.completed_at),
+                on_date(RoutineLog.completed_at, target_date),
             )
             .all()
         )
 
         return log
 
-    def put_logs(self, routine_id: int, logs: List[RoutineLogBase]):
-        for log in logs:
-            routine_log = RoutineLog(
-                routine_id=routine_id,
-                routine_element_id=log.routine_item_id,
-                duration_seconds=log.duration_seconds,
-                is_skipped=bool(log.is_skipped),
+    def put_logs(
+        self, routine_id: int, logs: List[RoutineLogBase]
+    ) -> List[int]:
+        # 같은 요소가 여러 번 오면 마지막 값을 쓴다
+        log_map = {log.routine_item_id: log for log in logs}
+
+        if not log_map:
+            return []
+
+        completed_at = datetime.now(STORAGE_TIMEZONE).replace(tzinfo=None)
+        log_values = values(
+            column("routine_element_id", Integer),
+            column("duration_seconds", Integer),
+            column("is_skipped", Boolean),
+            name="logs",
+        ).data(
+            [
+                (log.routine_item_id, log.duration_seconds, log.is_skipped)
+                for log in log_map.values()
+            ]
+        )
+        # 루틴과 사용자에 속한 요소만 골라 넣어 소유권 확인을 한 번에 한다
+        owned_logs = (
+            select(
+                RoutineElement.routine_id,
+                RoutineElement.id,
+                log_values.c.duration_seconds,
+                log_values.c.is_skipped,
+                literal(completed_at, TIMESTAMP),
+            )
+            .join(
+                log_values,
+                log_values.c.routine_element_id == RoutineElement.id,
+            )
+            .join(Routine, Routine.id == RoutineElement.routine_id)
+            .where(
+                RoutineElement.routine_id == routine_id,
+                RoutineElement.deleted_at.is_(None),
+                Routine.user_id == self.user_id,
+            )
+        )
+        statement = insert(RoutineLog).from_select(
+            [
+                "routine_id",
+                "routine_element_id",
+                "duration_seconds",
+                "is_skipped",
+                "completed_at",
+            ],
+            owned_logs,
+        )
+
+        statement = statement.on_conflict_do_update(
+            index_elements=[
+                RoutineLog.routine_element_id,
+                RoutineLog.log_date,
+            ],
+            set_={
+                name: statement.excluded[name]
+                for name in ["duration_seconds", "is_skipped", "completed_at"]
+            },
+        )
+
+        with self.db.begin_nested():
+            log_ids = self.db.scalars(statement.returning(RoutineLog.id)).all()
+
+            if len(log_ids) != len(log_map):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=DATA_DOES_NOT_EXIST,
+                )
+
+            self._refresh_daily_summary(routine_id, completed_at.date())
+
+        return log_ids
+
+    def _refresh_daily_summary(self, routine_id: int, log_date: date):
+        # 덮어쓴 기록이 있을 수 있어 그날 요약은 원본에서 다시 계산한다
+        statement = insert(RoutineDailySummary).from_select(
+            DAILY_SUMMARY_COLUMNS,
+            daily_summary_select(
+                RoutineLog.routine_id == routine_id,
+                on_date(RoutineLog.completed_at, log_date),
+            ),
+        )
+
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    RoutineDailySummary.routine_id,
+                    RoutineDailySummary.log_date,
+                ],
+                set_={
+                    name: statement.excluded[name]
+                    for name in DAILY_SUMMARY_COLUMNS[2:]
+                }
+                | {"updated_at": func.now()},
             )
+        )
 
-            self.db.add(routine_log)
+    def get_daily_summaries(
+        self, routine_id: int, start_date: date, end_date: date
+    ) -> List[RoutineDailySummary]:
+        routine_id = self.db.scalar(
+            select(Routine.id).where(
+                Routine.id == routine_id, Routine.user_id == self.user_id
+            )
+        )
 
-        return routine_log
+        if routine_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=DATA_DOES_NOT_EXIST,
+            )
+
+        return self.db.scalars(
+            select(RoutineDailySummary)
+            .where(
+                RoutineDailySummary.routine_id == routine_id,
+                RoutineDailySummary.log_date >= start_date,
+                RoutineDailySummary.log_date <= end_date,
+            )
+            .order_by(RoutineDailySummary.log_date)
+        ).all()
@@ -2,8 +2,26 @@ from datetime import date, datetime
 from pytz import timezone
 from typing import List
 from fastapi import HTTPException, status
-from sqlalchemy import asc, desc, and_, func, nullsfirst, or_
-from app.api.errors import DATA_DOES_NOT_EXIST
+from sqlalchemy import (
+    Integer,
+    asc,
+    column,
+    desc,
+    and_,
+    nullsfirst,
+    or_,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from app.api.errors import DATA_DOES_NOT_EXIST, INVALID_CURSOR
+from app.core.utils import (
+    decode_cursor,
+    encode_cursor,
+    get_date_range,
+    on_date,
+)
 from app.models.models import Todo
 from app.schemas.todo import TodoOrderUpdate
 
@@ -97,64 +115,160 @@ class TodoDAO(ProtectedBaseDAO):
         return None
 
     def update_todo_list_order(self, todo_list: List[TodoOrderUpdate]) -> None:
-        for todo in todo_list:
-            target_todo = self.get_todo_by_id(todo_id=todo.id)
+        # 같은 id 가 여러 번 오면 마지막 값을 쓴다
+        orders = {todo.id: todo.order for todo in todo_list}
 
-            target_todo.order = todo.order
+        if not orders:
+            return None
+
+        order_values = values(
+            column("id", Integer), column("order", Integer), name="orders"
+        ).data(list(orders.items()))
+
+        with self.db.begin_nested():
+            updated_ids = self.db.scalars(
+                update(Todo)
+                .where(
+                    Todo.id == order_values.c.id,
+                    Todo.user_id == self.user_id,
+                )
+                .values(order=order_values.c.order)
+                .returning(Todo.id)
+                .execution_options(synchronize_session="fetch")
+            ).all()
+
+            if len(updated_ids) != len(orders):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=DATA_DOES_NOT_EXIST,
+                )
 
         return None
 
-    def get_todo_list(
+    def get_next_cursor(
+        self, todo_list: List[Todo], limit: int, completed: bool
+    ) -> str | None:
+        if not todo_list or len(todo_list) < limit:
+            return None
+
+        last = todo_list[-1]
+        if completed:
+            after = [last.completed_at.isoformat(), last.id]
+        else:
+            after = [
+                last.target_date.isoformat(),
+                last.order,
+                last.updated_at.isoformat(),
+                last.id,
+            ]
+
+        return encode_cursor({"completed": completed, "after": after})
+
+    def _todo_list_after(self, cursor: str, completed: bool):
+        try:
+            values = decode_cursor(cursor)
+            if values.get("completed") != completed:
+                raise ValueError("cursor does not match ordering")
+
+            if completed:
+                completed_at, id = values["after"]
+                completed_at = datetime.fromisoformat(completed_at)
+
+                return tuple_(Todo.completed_at, Todo.id) < (
+                    completed_at,
+                    int(id),
+                )
+
+            target_date, order, updated_at, id = values["after"]
+            target_date = datetime.fromisoformat(target_date)
+            order, id = int(order), int(id)
+            updated_at = datetime.fromisoformat(updated_at)
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=INVALID_CURSOR,
+            )
+
+        # updated_at 만 역순이라 행 비교는 앞의 두 컬럼까지만 인덱스에 태운다
+        return and_(
+            tuple_(Todo.target_date, Todo.order) >= (target_date, order),
+            or_(
+                tuple_(Todo.target_date, Todo.order) > (target_date, order),
+                Todo.updated_at < updated_at,
+                and_(Todo.updated_at == updated_at, Todo.id > id),
+            ),
+        )
+
+    async def get_todo_list(
         self,
         limit: int,
         offset: int,
         completed: bool = False,
         start_date: date = None,
         end_date: date = None,
+        cursor: str | None = None,
     ) -> List[Todo]:
-        query = self.db.query(Todo).filter(Todo.user_id == self.user_id)
+        query = select(Todo).where(Todo.user_id == self.user_id)
 
         if completed:
-            query = query.filter(Todo.completed_at.is_not(None))
+            query = query.where(Todo.completed_at.is_not(None))
         else:
-            query = query.filter(Todo.completed_at.is_(None))
+            query = query.where(Todo.completed_at.is_(None))
 
         if start_date:
-            query = query.filter(func.date(Todo.target_date) >= start_date)
+            start, _ = get_date_range(start_date)
+            query = query.where(Todo.target_date >= start)
         if end_date:
-            query = query.filter(func.date(Todo.target_date) <= end_date)
+            _, end = get_date_range(end_date)
+            query = query.where(Todo.target_date < end)
 
         if completed:
-            query = query.order_by(desc(Todo.completed_at))
+            query = query.order_by(desc(Todo.completed_at), desc(Todo.id))
         else:
             query = query.order_by(
-                asc(Todo.target_date), asc(Todo.order), desc(Todo.updated_at)
+                asc(Todo.target_date),
+                asc(Todo.order),
+                desc(Todo.updated_at),
+                asc(Todo.id),
             )
 
-        return query.limit(limit).offset(offset).all()
+        if cursor:
+            query = query.where(self._todo_list_after(cursor, completed))
+        else:
+            query = query.offset(offset)
+
+        result = await self.db.scalars(query.limit(limit))
+
+        return result.all()
 
-    def get_todo_list_by_date(
+    def todo_list_by_date_filter(self, date: date):
+        start, _ = get_date_range(date)
+
+        return and_(
+            Todo.user_id == self.user_id,
+            or_(
+                on_date(Todo.target_date, date),
+                and_(Todo.target_date <= start, Todo.completed_at.is_(None)),
+                on_date(Todo.completed_at, date),
+            ),
+        )
+
+    def todo_list_by_date_order(self):
+        return (
+            nullsfirst(desc(Todo.completed_at)),
+            asc(Todo.target_date),
+            desc(Todo.updated_at),
+            asc(Todo.id),
+        )
+
+    async def get_todo_list_by_date(
         self,
         date: date,
     ) -> List[Todo]:
-        todo = (
-            self.db.query(Todo)
-            .filter(
-                Todo.user_id == self.user_id,
-                or_(
-                    func.date(Todo.target_date) == date,
-                    and_(
-                        Todo.target_date <= date, Todo.completed_at.is_(None)
-                    ),
-                    func.date(Todo.completed_at) == date,
-                ),
-            )
-            .order_by(
-                nullsfirst(desc(Todo.completed_at)),
-                asc(Todo.target_date),
-                desc(Todo.updated_at),
-            )
-            .all()
+        result = await self.db.scalars(
+            select(Todo)
+            .where(self.todo_list_by_date_filter(date))
+            .order_by(*self.todo_list_by_date_order())
         )
 
-        return todo
+        return result.all()
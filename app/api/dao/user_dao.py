@@ -1,10 +1,11 @@
 from fastapi import HTTPException, status
+from sqlalchemy import select
 
 from app.api.errors import (
     INCORRECT_USERNAME_OR_PASSWORD,
     USERNAME_CANNOT_BE_CHANGED,
 )
-from app.core.auth import verify_password
+from app.core.auth import password_hasher
 from app.models.models import User
 from app.schemas.user import UserUpdateInput
 
@@ -12,8 +13,8 @@ from .base import ProtectedBaseDAO
 
 
 class UserDAO(ProtectedBaseDAO):
-    def update_me(self, data: UserUpdateInput) -> User:
-        user = self.get_me()
+    async def update_me(self, data: UserUpdateInput) -> User:
+        user = await self.get_me()
 
         if data.username != user.username:
             raise HTTPException(
@@ -21,7 +22,7 @@ class UserDAO(ProtectedBaseDAO):
                 detail=USERNAME_CANNOT_BE_CHANGED,
             )
 
-        if not verify_password(data.password, user.password):
+        if not await password_hasher.verify(data.password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=INCORRECT_USERNAME_OR_PASSWORD,
@@ -34,6 +35,6 @@ class UserDAO(ProtectedBaseDAO):
             user.nickname = data.nickname
 
         return user
-    
-    def get_me(self) -> User:
-        return self.db.query(User).filter_by(id=self.user_id).first()
+
+    async def get_me(self) -> User:
+        return await self.db.scalar(select(User).filter_by(id=self.user_id))
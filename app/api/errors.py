@@ -7,6 +7,10 @@ INVALID_VALUE_RANGE = "INVALID_VALUE_RANGE"
 DUPLICATED_VALUE = "DUPLICATED_VALUE"
 VALUE_MUST_BE_ALPHANUM = "VALUE_MUST_BE_ALPHANUM"
 START_DATE_GREATER_THAN_END_DATE = "START_DATE_GREATER_THAN_END_DATE"
+INVALID_CURSOR = "INVALID_CURSOR"
+INVALID_ROW_FORMAT = "INVALID_ROW_FORMAT"
+UNSUPPORTED_MEDIA_TYPE = "UNSUPPORTED_MEDIA_TYPE"
+PAYLOAD_TOO_LARGE = "PAYLOAD_TOO_LARGE"
 
 
 USERNAME_ALREADY_EXISTS = "USERNAME_ALREADY_EXISTS"
@@ -16,6 +20,7 @@ INCORRECT_USERNAME_OR_PASSWORD = "INCORRECT_USERNAME_OR_PASSWORD"
 INVALID_CREDENTIAL = "INVALID_CREDENTIAL"
 EXPIRED_TOKEN = "EXPIRED_TOKEN"
 USER_NOT_FOUND = "USER_NOT_FOUND"
+TOO_MANY_REQUESTS = "TOO_MANY_REQUESTS"
 
 DATA_DOES_NOT_EXIST = "DATA_DOES_NOT_EXIST"
 
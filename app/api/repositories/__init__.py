@@ -1,9 +1,11 @@
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.auth import verify_access_token
-from app.database.db import get_db
+from app.database.db import get_async_db, get_db
 from .habit_repository import HabitRepository
+from .import_repository import ImportRepository
 from .task_repository import TaskRepository
 from .routine_repository import RoutineRepository
 
@@ -14,6 +16,13 @@ def get_routine_repository(
     return RoutineRepository(db=db, user_id=id)
 
 
+def get_async_routine_repository(
+    db: AsyncSession = Depends(get_async_db),
+    id: int = Depends(verify_access_token),
+):
+    return RoutineRepository(db=db, user_id=id)
+
+
 def get_habit_repository(
     db: Session = Depends(get_db), id: int = Depends(verify_access_token)
 ):
@@ -24,3 +33,16 @@ def get_task_repository(
     db: Session = Depends(get_db), id: int = Depends(verify_access_token)
 ):
     return TaskRepository(db=db, user_id=id)
+
+
+def get_async_task_repository(
+    db: AsyncSession = Depends(get_async_db),
+    id: int = Depends(verify_access_token),
+):
+    return TaskRepository(db=db, user_id=id)
+
+
+def get_import_repository(
+    db: Session = Depends(get_db), id: int = Depends(verify_access_token)
+):
+    return ImportRepository(db=db, user_id=id)
@@ -1,11 +1,18 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Optional
-from sqlalchemy import desc, func
+from sqlalchemy import and_, desc, select
+from sqlalchemy.dialects.postgresql import insert
 from pytest import Session
 
+from app.core.utils import STORAGE_TIMEZONE, on_date
 from app.exceptions.exceptions import DataNotFoundError
-from app.models.models import Habit, HabitLog
-from app.schemas.habit import HabitCreateInput, HabitUpdateInput, HabitWithLog
+from app.models.models import Habit, HabitLog, HabitStats
+from app.schemas.habit import (
+    HabitCreateInput,
+    HabitStatsPublic,
+    HabitUpdateInput,
+    HabitWithLog,
+)
 
 from .base import ProtectedBaseRepository
 
@@ -47,20 +54,24 @@ class HabitRepository(ProtectedBaseRepository):
 
         return habits
 
+    def _habit_logs_by_date_query(self, habit_ids: list[str], date: date):
+        return (
+            select(HabitLog)
+            .where(
+                on_date(HabitLog.completed_at, date),
+                HabitLog.habit_id.in_(habit_ids),
+            )
+            .order_by(desc(HabitLog.id))
+        )
+
     def get_habit_logs_by_date(
         self,
         habit_ids: list[str],
         date: date,
     ):
-        logs = (
-            self.db.query(HabitLog)
-            .filter(
-                func.date(HabitLog.completed_at) == date,
-                HabitLog.habit_id.in_(habit_ids),
-            )
-            .order_by(desc(HabitLog.id))
-            .all()
-        )
+        logs = self.db.scalars(
+            self._habit_logs_by_date_query(habit_ids, date)
+        ).all()
 
         return logs
 
@@ -113,27 +124,33 @@ class HabitRepository(ProtectedBaseRepository):
 
         return sorted(habit_list, key=sort_key)
 
-    def get_habits_by_weekday(self, weekday: int):
-        habits = (
-            self.db.query(Habit)
-            .filter(
-                Habit.user_id == self.user_id,
-                Habit.activated,
-                Habit.repeat_days.contains(weekday),
-            )
+    def habits_by_weekday_filter(self, weekday: int):
+        return and_(
+            Habit.user_id == self.user_id,
+            Habit.activated,
+            Habit.repeats_on(weekday),
+        )
+
+    async def get_habits_by_weekday(self, weekday: int):
+        habits = await self.db.scalars(
+            select(Habit)
+            .where(self.habits_by_weekday_filter(weekday))
             .order_by(desc(Habit.id))
-            .all()
         )
 
-        return habits
+        return habits.all()
 
-    def get_habits_with_log_by_date(self, target: date) -> list[HabitWithLog]:
-        habits = self.get_habits_by_weekday(target.weekday())
+    async def get_habits_with_log_by_date(
+        self, target: date
+    ) -> list[HabitWithLog]:
+        habits = await self.get_habits_by_weekday(target.weekday())
         habit_ids = [habit.id for habit in habits]
 
-        habits_logs = self.get_habit_logs_by_date(habit_ids, target)
+        habits_logs = await self.db.scalars(
+            self._habit_logs_by_date_query(habit_ids, target)
+        )
         habit_with_log = self._combine_habits_and_logs(
-            habits, habits_logs, target.weekday()
+            habits, habits_logs.all(), target.weekday()
         )
         return habit_with_log
 
@@ -179,8 +196,46 @@ class HabitRepository(ProtectedBaseRepository):
         if not habit:
             raise DataNotFoundError()
 
-        log = HabitLog(habit_id=habit_id)
+        completed_at = datetime.now(STORAGE_TIMEZONE).replace(tzinfo=None)
+        log = HabitLog(habit_id=habit_id, completed_at=completed_at)
 
         self.db.add(log)
 
+        stats = self._get_habit_stats_for_update(habit_id)
+        stats.record_completion(habit, completed_at.date())
+
         return log
+
+    def _get_habit_stats_for_update(self, habit_id: int) -> HabitStats:
+        self.db.execute(
+            insert(HabitStats)
+            .values(habit_id=habit_id)
+            .on_conflict_do_nothing(index_elements=[HabitStats.habit_id])
+        )
+
+        return self.db.scalars(
+            select(HabitStats)
+            .where(HabitStats.habit_id == habit_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).one()
+
+    def get_habit_stats(self, habit_id: int) -> HabitStatsPublic:
+        habit = self.get_habit_by_id(habit_id)
+
+        if not habit:
+            raise DataNotFoundError()
+
+        stats = self.db.get(HabitStats, habit_id)
+        if stats is None:
+            return HabitStatsPublic(habit_id=habit_id)
+
+        today = datetime.now(STORAGE_TIMEZONE).date()
+
+        return HabitStatsPublic(
+            habit_id=habit_id,
+            current_streak=stats.current_streak_on(habit, today),
+            best_streak=stats.best_streak,
+            total_completions=stats.total_completions,
+            last_completed_date=stats.last_completed_date,
+        )
@@ -0,0 +1,172 @@
+from typing import IO, Callable, Iterable, Type
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import Session
+
+from app.api.dao.import_dao import ImportDAO
+from app.api.errors import INVALID_ROW_FORMAT
+from app.core.config import IMPORT_MAX_ERRORS
+from app.core.imports import StagingFile, iter_records
+from app.models.models import Habit, Routine
+from app.schemas.habit import HabitCreateInput
+from app.schemas.imports import ImportResult, ImportRowError
+from app.schemas.routine import RoutineCreateInput
+from app.schemas.todo import TodoCreateInput
+
+from .base import ProtectedBaseRepository
+
+
+def _row_errors(line: int, error: ValidationError) -> list[ImportRowError]:
+    # 요청 검증 오류 응답과 같은 error_type 을 쓴다
+    row_errors = []
+    for detail in error.errors():
+        if detail["type"] == "value_error":
+            error_type = detail["msg"]
+        elif detail["type"] == "value_error.missing":
+            error_type = "REQUIRED_VALUE"
+        else:
+            error_type = detail["type"].upper().replace(".", "_")
+
+        row_errors.append(
+            ImportRowError(
+                line=line,
+                error_type=error_type,
+                location=".".join(str(loc) for loc in detail["loc"]),
+            )
+        )
+
+    return row_errors
+
+
+class ImportRepository(ProtectedBaseRepository):
+    def __init__(self, db: Session, user_id: int):
+        super().__init__(db, user_id)
+
+        self.import_dao = ImportDAO(db=db, user_id=user_id)
+
+    def _stage_rows(
+        self,
+        body: IO[bytes],
+        body_format: str,
+        schema: Type[BaseModel],
+        stage: Callable[[int, BaseModel], None],
+        json_fields: Iterable[str] = (),
+    ) -> tuple[int, list[ImportRowError]]:
+        failed = 0
+        errors = []
+
+        for line, record in iter_records(body, body_format, json_fields):
+            if record is None:
+                row_errors = [
+                    ImportRowError(line=line, error_type=INVALID_ROW_FORMAT)
+                ]
+            else:
+                try:
+                    item = schema.parse_obj(record)
+                except ValidationError as error:
+                    row_errors = _row_errors(line, error)
+                else:
+                    stage(line, item)
+                    continue
+
+            failed += 1
+            errors.extend(row_errors[: IMPORT_MAX_ERRORS - len(errors)])
+
+        return failed, errors
+
+    def import_todos(self, body: IO[bytes], body_format: str) -> ImportResult:
+        todos = StagingFile()
+        try:
+            failed, errors = self._stage_rows(
+                body,
+                body_format,
+                TodoCreateInput,
+                lambda line, todo: todos.write(
+                    [
+                        line,
+                        todo.title,
+                        todo.order,
+                        todo.target_date,
+                        todo.content,
+                    ]
+                ),
+            )
+            imported = (
+                self.import_dao.import_todos(todos.rewind())
+                if todos.count
+                else 0
+            )
+        finally:
+            todos.close()
+
+        return ImportResult(imported=imported, failed=failed, errors=errors)
+
+    def import_habits(self, body: IO[bytes], body_format: str) -> ImportResult:
+        habits = StagingFile()
+        try:
+            failed, errors = self._stage_rows(
+                body,
+                body_format,
+                HabitCreateInput,
+                lambda line, habit: habits.write(
+                    [
+                        line,
+                        habit.title,
+                        habit.start_time_minutes,
+                        habit.end_time_minutes,
+                        habit.repeat_time_minutes,
+                        Habit.repeat_days_to_string(habit.repeat_days),
+                    ]
+                ),
+                json_fields=["repeat_days"],
+            )
+            imported = (
+                self.import_dao.import_habits(habits.rewind())
+                if habits.count
+                else 0
+            )
+        finally:
+            habits.close()
+
+        return ImportResult(imported=imported, failed=failed, errors=errors)
+
+    def import_routines(
+        self, body: IO[bytes], body_format: str
+    ) -> ImportResult:
+        routines = StagingFile()
+        routine_elements = StagingFile()
+
+        def stage(line: int, routine: RoutineCreateInput):
+            routines.write(
+                [
+                    line,
+                    routine.title,
+                    routine.start_time_minutes,
+                    Routine.repeat_days_to_string(routine.repeat_days),
+                ]
+            )
+            for order, element in enumerate(routine.routine_elements):
+                routine_elements.write(
+                    [line, element.title, order, element.duration_minutes]
+                )
+
+        try:
+            failed, errors = self._stage_rows(
+                body,
+                body_format,
+                RoutineCreateInput,
+                stage,
+                json_fields=["repeat_days", "routine_elements"],
+            )
+            imported = (
+                self.import_dao.import_routines(
+                    routines.rewind(), routine_elements.rewind()
+                )
+                if routines.count
+                else 0
+            )
+        finally:
+            routines.close()
+            routine_elements.close()
+
+        return ImportResult(imported=imported, failed=failed, errors=errors)
@@ -1,10 +1,12 @@
 from datetime import date
-from sqlalchemy import asc, desc, func
+from sqlalchemy import asc, desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.dao.routine_dao import RoutineDAO
 from app.api.dao.routine_element_dao import RoutineElementDAO
 from app.api.dao.routine_log_dao import RoutineLogDAO
+from app.core.utils import on_date
 from app.models.models import Routine, RoutineLog
 from app.schemas.routine import (
     RoutineCreateInput,
@@ -17,7 +19,7 @@ from .base import ProtectedBaseRepository
 
 
 class RoutineRepository(ProtectedBaseRepository):
-    def __init__(self, db: Session, user_id: int):
+    def __init__(self, db: Session | AsyncSession, user_id: int):
         super().__init__(db, user_id)
 
         self.routine_dao = RoutineDAO(db=db, user_id=user_id)
@@ -26,7 +28,7 @@ class RoutineRepository(ProtectedBaseRepository):
 
     def update_routine(
         self, routine_id: int, routine: RoutineUpdateInput
-    ) -> Routine:
+    ) -> RoutinePublic:
         updated_routine = self.routine_dao.update_routine(
             routine_id=routine_id,
             title=routine.title,
@@ -34,15 +36,18 @@ class RoutineRepository(ProtectedBaseRepository):
             repeat_days=routine.repeat_days,
         )
 
-        self.routine_element_dao.update_routine_elements(
+        routine_elements = self.routine_element_dao.update_routine_elements(
             routine_id=routine_id,
             routine_elements=updated_routine.routine_elements or [],
             updates_routine_elements=routine.routine_elements or [],
         )
 
         self.db.flush()
+        self.db.expire(updated_routine, ["routine_elements"])
 
-        return updated_routine
+        return RoutinePublic.from_routine(
+            routine=updated_routine, routine_elements=routine_elements
+        )
 
     def create_routine(self, routine: RoutineCreateInput) -> RoutinePublic:
         new_routine = self.routine_dao.create_routine(
@@ -64,22 +69,22 @@ class RoutineRepository(ProtectedBaseRepository):
             routine=new_routine, routine_elements=routine_elements
         )
 
-    def _get_routines_with_logs(
+    async def _get_routines_with_logs(
         self, routines: list[Routine], target: date
     ) -> list[RoutinePublic]:
         routine_ids = [routine.id for routine in routines]
-        routine_logs = (
-            self.db.query(RoutineLog)
-            .filter(
+        routine_logs = await self.db.scalars(
+            select(RoutineLog)
+            .where(
                 RoutineLog.routine_id.in_(routine_ids),
-                func.date(RoutineLog.completed_at) == target,
+                on_date(RoutineLog.completed_at, target),
             )
             .order_by(
                 desc(RoutineLog.routine_id),
                 asc(RoutineLog.routine_element_id),
                 asc(RoutineLog.completed_at),
+                asc(RoutineLog.id),
             )
-            .all()
         )
 
         routine_log_map = {}
@@ -115,12 +120,12 @@ class RoutineRepository(ProtectedBaseRepository):
 
         return result_routine_list
 
-    def get_routine_list(self, target: date) -> list[RoutinePublic]:
-        routines = self.routine_dao.get_routines()
-        return self._get_routines_with_logs(routines, target)
+    async def get_routine_list(self, target: date) -> list[RoutinePublic]:
+        routines = await self.routine_dao.get_routines()
+        return await self._get_routines_with_logs(routines, target)
 
-    def get_routine_by_date(self, target: date) -> list[RoutinePublic]:
-        routines = self.routine_dao.get_routines_by_weekday(
+    async def get_routine_by_date(self, target: date) -> list[RoutinePublic]:
+        routines = await self.routine_dao.get_routines_by_weekday(
             weekday=target.weekday()
         )
-        return self._get_routines_with_logs(routines, target)
+        return await self._get_routines_with_logs(routines, target)
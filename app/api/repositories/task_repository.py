@@ -1,13 +1,43 @@
 from datetime import date
 from pytest import Session
+from sqlalchemy import JSON, desc, false, func, literal_column, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
 from .base import ProtectedBaseRepository
 
 from app.api.dao.todo_dao import TodoDAO
+from app.core.utils import on_date
+from app.models.models import (
+    Habit,
+    HabitLog,
+    Routine,
+    RoutineElement,
+    RoutineLog,
+    Todo,
+)
 from .routine_repository import RoutineRepository
 from .habit_repository import HabitRepository
+from app.schemas.habit import HabitWithLog
 from app.schemas.task import TaskPublic
 
 
+def _json_object(**columns):
+    # asyncpg 는 json_build_object 의 키 타입을 추론하지 못해 리터럴로 넣는다
+    args = []
+    for key, column in columns.items():
+        args.extend((literal_column(f"'{key}'"), column))
+
+    return func.json_build_object(*args)
+
+
+def _json_list(element, *order_by):
+    return func.coalesce(
+        func.json_agg(aggregate_order_by(element, *order_by)),
+        literal_column("'[]'::json"),
+        type_=JSON,
+    )
+
+
 class TaskRepository(ProtectedBaseRepository):
     def __init__(self, db: Session, user_id: int):
         super().__init__(db, user_id)
@@ -16,13 +46,142 @@ class TaskRepository(ProtectedBaseRepository):
         self.todo_dao = TodoDAO(db=db, user_id=user_id)
         self.habit_repository = HabitRepository(db=db, user_id=user_id)
 
-    def get_all_task_by_date(self, date: date) -> TaskPublic:
-        todo_list = self.todo_dao.get_todo_list_by_date(date)
-        routine_list = self.routine_repository.get_routine_by_date(date)
-        habit_list = self.habit_repository.get_habits_with_log_by_date(date)
+    async def get_all_task_by_date(self, date: date) -> TaskPublic:
+        todo_list = await self.todo_dao.get_todo_list_by_date(date)
+        routine_list = await self.routine_repository.get_routine_by_date(date)
+        habit_list = await self.habit_repository.get_habits_with_log_by_date(
+            date
+        )
 
         return TaskPublic(
             todo_list=todo_list,
             routine_list=routine_list,
             habit_list=habit_list,
         )
+
+    def _todo_list_query(self, date: date):
+        todo = _json_object(
+            id=Todo.id,
+            title=Todo.title,
+            order=Todo.order,
+            target_date=Todo.target_date,
+            content=Todo.content,
+            created_at=Todo.created_at,
+            updated_at=Todo.updated_at,
+            completed_at=Todo.completed_at,
+        )
+
+        return (
+            select(_json_list(todo, *self.todo_dao.todo_list_by_date_order()))
+            .where(self.todo_dao.todo_list_by_date_filter(date))
+            .scalar_subquery()
+        )
+
+    def _routine_list_query(self, date: date):
+        # 요소별로 해당 날짜의 가장 마지막 기록 하나만 붙인다
+        latest_log = (
+            select(
+                RoutineLog.completed_at,
+                RoutineLog.duration_seconds,
+                RoutineLog.is_skipped,
+            )
+            .where(
+                RoutineLog.routine_id == RoutineElement.routine_id,
+                RoutineLog.routine_element_id == RoutineElement.id,
+                on_date(RoutineLog.completed_at, date),
+            )
+            .order_by(desc(RoutineLog.completed_at), desc(RoutineLog.id))
+            .limit(1)
+            .lateral()
+        )
+        routine_element = _json_object(
+            id=RoutineElement.id,
+            title=RoutineElement.title,
+            duration_minutes=RoutineElement.duration_minutes,
+            created_at=RoutineElement.created_at,
+            updated_at=RoutineElement.updated_at,
+            completed_at=latest_log.c.completed_at,
+            completed_duration_seconds=latest_log.c.duration_seconds,
+            is_skipped=func.coalesce(latest_log.c.is_skipped, false()),
+        )
+        routine_elements = (
+            select(
+                _json_list(
+                    routine_element, RoutineElement.order, RoutineElement.id
+                )
+            )
+            .select_from(RoutineElement)
+            .outerjoin(latest_log, true())
+            .where(
+                RoutineElement.routine_id == Routine.id,
+                RoutineElement.deleted_at.is_(None),
+            )
+            .scalar_subquery()
+        )
+        routine = _json_object(
+            id=Routine.id,
+            title=Routine.title,
+            start_time_minutes=Routine.start_time_minutes,
+            repeat_days=Routine.repeat_days,
+            created_at=Routine.created_at,
+            updated_at=Routine.updated_at,
+            routine_elements=routine_elements,
+        )
+        routine_dao = self.routine_repository.routine_dao
+
+        return (
+            select(_json_list(routine, Routine.start_time_minutes, Routine.id))
+            .where(routine_dao.routines_by_weekday_filter(date.weekday()))
+            .scalar_subquery()
+        )
+
+    def _habit_list_query(self, date: date):
+        habit_log = _json_object(
+            id=HabitLog.id, completed_at=HabitLog.completed_at
+        )
+        log_list = (
+            select(_json_list(habit_log, desc(HabitLog.id)))
+            .where(
+                HabitLog.habit_id == Habit.id,
+                on_date(HabitLog.completed_at, date),
+            )
+            .scalar_subquery()
+        )
+        habit = _json_object(
+            id=Habit.id,
+            title=Habit.title,
+            start_time_minutes=Habit.start_time_minutes,
+            end_time_minutes=Habit.end_time_minutes,
+            repeat_time_minutes=Habit.repeat_time_minutes,
+            repeat_days=Habit.repeat_days,
+            activated=Habit.activated,
+            created_at=Habit.created_at,
+            updated_at=Habit.updated_at,
+            log_list=log_list,
+        )
+        habit_repository = self.habit_repository
+
+        return (
+            select(_json_list(habit, desc(Habit.id)))
+            .where(habit_repository.habits_by_weekday_filter(date.weekday()))
+            .scalar_subquery()
+        )
+
+    async def get_all_task_by_date_aggregated(self, date: date) -> TaskPublic:
+        result = await self.db.execute(
+            select(
+                self._todo_list_query(date).label("todo_list"),
+                self._routine_list_query(date).label("routine_list"),
+                self._habit_list_query(date).label("habit_list"),
+            )
+        )
+        row = result.one()
+
+        return TaskPublic(
+            todo_list=row.todo_list,
+            routine_list=row.routine_list,
+            habit_list=[
+                HabitWithLog.from_dict_with_weekday(habit, date.weekday())
+                for habit in row.habit_list
+            ],
+        )
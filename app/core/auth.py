@@ -1,5 +1,9 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from fastapi import Depends, HTTPException, status
 import jwt
+import multiprocessing
+import time
 from datetime import datetime, timedelta
 from pytz import timezone
 from pydantic import BaseModel
@@ -8,19 +12,30 @@ from jwt.exceptions import InvalidTokenError
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
 
-from app.api.errors import EXPIRED_TOKEN, INVALID_CREDENTIAL
+from app.api.errors import (
+    EXPIRED_TOKEN,
+    INVALID_CREDENTIAL,
+    TOO_MANY_REQUESTS,
+)
 from app.models.models import User
 
+from .cache import LRUCacheBackend
 from .config import (
+    ACCESS_TOKEN_CACHE_SIZE,
     JWT_SECRET_KEY,
     JWT_ALGORITHM,
     JWT_ACCESS_TOKEN_EXPIRES,
     JWT_REFRESH_TOKEN_EXPIRES,
+    PASSWORD_HASHER_MAX_PENDING,
+    PASSWORD_HASHER_WORKERS,
 )
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security_scheme = HTTPBearer()
 
+# 검증된 토큰 -> 유저 id, 토큰의 exp 시각에 만료된다
+access_token_cache = LRUCacheBackend(ACCESS_TOKEN_CACHE_SIZE)
+
 
 class TokenData(BaseModel):
     id: int | None = None
@@ -35,6 +50,58 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHasher:
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 스레드가 떠 있는 프로세스를 fork 하지 않도록 spawn 을 쓴다
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        return self._executor
+
+    async def _run(self, func, *args):
+        if self.pending >= self.max_pending:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=TOO_MANY_REQUESTS,
+                headers={"Retry-After": "1"},
+            )
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(
+            verify_password, plain_password, hashed_password
+        )
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    PASSWORD_HASHER_WORKERS, PASSWORD_HASHER_MAX_PENDING
+)
+
+
 def create_jwt_token(data: dict, expires_delta: timedelta):
     to_encode = data.copy()
     expire = datetime.now(timezone("Asia/Seoul")) + expires_delta
@@ -88,8 +155,13 @@ def refresh_token_decode(refresh_token: str) -> User:
 def verify_access_token(
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
 ) -> int:
+    token = credentials.credentials
+    cached_id = access_token_cache.get(token)
+
+    if cached_id is not None:
+        return cached_id
+
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
         id: int | None = payload.get("id")
         type: str | None = payload.get("type")
@@ -105,5 +177,9 @@ def verify_access_token(
         )
     except InvalidTokenError:
         raise credentials_exception
-    
+
+    exp: int | None = payload.get("exp")
+    if exp is not None:
+        access_token_cache.set(token, id, exp - time.time())
+
     return id
@@ -0,0 +1,225 @@
+from collections import OrderedDict
+from datetime import date
+from threading import Lock
+import time
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    TASK_CACHE_BACKEND,
+    TASK_CACHE_MAX_SIZE,
+    TASK_CACHE_REDIS_TIMEOUT,
+    TASK_CACHE_REDIS_URL,
+    TASK_CACHE_TTL,
+)
+
+DIRTY_USERS_KEY = "task_cache_dirty_users"
+
+
+class LRUCacheBackend:
+    blocking = False
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = Lock()
+        self._items: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        # 세대 번호는 LRU 에서 밀려나면 안 되므로 따로 보관한다
+        self._counters: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> object | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                self.misses += 1
+                return None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: object, ttl: float):
+        with self._lock:
+            self._items[key] = (time.monotonic() + ttl, value)
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._counters.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Redis 가 느리거나 죽어 있으면 캐시를 건너뛰고 DB 에서 읽도록, 요청 경로의
+# 메서드는 오류 대신 None 을 돌려준다
+class RedisCacheBackend:
+    blocking = True
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "tsk:",
+        timeout: float = TASK_CACHE_REDIS_TIMEOUT,
+    ):
+        import redis
+
+        self.client = redis.Redis.from_url(
+            url, socket_timeout=timeout, socket_connect_timeout=timeout
+        )
+        self.errors = redis.RedisError
+        self.prefix = prefix
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self.client.get(self.prefix + key)
+        except self.errors:
+            return None
+
+    def set(self, key: str, value: bytes, ttl: int):
+        try:
+            self.client.set(self.prefix + key, value, ex=ttl)
+        except self.errors:
+            pass
+
+    def get_counter(self, key: str) -> int | None:
+        try:
+            return int(self.client.get(self.prefix + key) or 0)
+        except self.errors:
+            return None
+
+    # 무효화에 실패하고 넘어가면 옛 데이터가 TTL 동안 남으므로 오류를 그대로 올린다
+    def incr(self, key: str) -> int:
+        return self.client.incr(self.prefix + key)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+class TaskCache:
+    def __init__(self, backend: LRUCacheBackend | RedisCacheBackend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _generation_key(self, user_id: int) -> str:
+        return f"task:generation:{user_id}"
+
+    def _key(self, user_id: int, target: date, generation: int) -> str:
+        # 사용자의 세대 번호가 바뀌면 이전 날짜별 항목은 모두 무효가 된다
+        return f"task:{user_id}:{generation}:{target.isoformat()}"
+
+    # 조회 전에 한 번 읽어 get 과 set 에 같이 넘긴다. 조회 도중 커밋된 쓰기가
+    # 세대를 올리면 이전 데이터는 더 이상 읽히지 않는 옛 세대에 저장된다.
+    # 세대를 읽지 못하면 None 이고, 이때는 캐시를 쓰지 않는다.
+    def generation(self, user_id: int) -> int | None:
+        return self.backend.get_counter(self._generation_key(user_id))
+
+    def lookup(
+        self, user_id: int, target: date
+    ) -> tuple[int | None, bytes | None]:
+        generation = self.generation(user_id)
+        if generation is None:
+            return None, None
+
+        return generation, self.get(user_id, target, generation)
+
+    # 네트워크를 타는 백엔드는 이벤트 루프를 막지 않도록 스레드에서 부른다
+    async def run(self, function, *args):
+        if self.backend.blocking:
+            return await run_in_threadpool(function, *args)
+
+        return function(*args)
+
+    def get(self, user_id: int, target: date, generation: int) -> bytes | None:
+        value = self.backend.get(self._key(user_id, target, generation))
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    def set(self, user_id: int, target: date, generation: int, value: bytes):
+        self.backend.set(
+            self._key(user_id, target, generation), value, self.ttl
+        )
+
+    def invalidate(self, user_id: int):
+        self.backend.incr(self._generation_key(user_id))
+        self.invalidations += 1
+
+    def clear(self):
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+def create_task_cache() -> TaskCache | None:
+    if TASK_CACHE_BACKEND == "memory":
+        return TaskCache(LRUCacheBackend(TASK_CACHE_MAX_SIZE), TASK_CACHE_TTL)
+    elif TASK_CACHE_BACKEND == "redis":
+        return TaskCache(
+            RedisCacheBackend(TASK_CACHE_REDIS_URL), TASK_CACHE_TTL
+        )
+
+    return None
+
+
+task_cache = create_task_cache()
+
+
+def mark_task_cache_dirty(session: Session | AsyncSession, user_id: int):
+    session.info.setdefault(DIRTY_USERS_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_dirty_task_cache(session: Session):
+    user_ids = session.info.pop(DIRTY_USERS_KEY, set())
+
+    if task_cache is None:
+        return
+
+    for user_id in user_ids:
+        task_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_dirty_task_cache(session: Session):
+    session.info.pop(DIRTY_USERS_KEY, None)
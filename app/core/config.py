@@ -5,8 +5,74 @@ import dotenv
 dotenv.load_dotenv()
 
 DATABASE_URI = os.environ.get("TSK_DB_URL")
+ASYNC_DATABASE_URI = os.environ.get("TSK_ASYNC_DB_URL") or (
+    DATABASE_URI
+    and DATABASE_URI.replace("postgresql://", "postgresql+asyncpg://", 1)
+)
 JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY")
 
+DB_POOL_SIZE = int(os.environ.get("TSK_DB_POOL_SIZE", 5))
+DB_POOL_MAX_OVERFLOW = int(os.environ.get("TSK_DB_POOL_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.environ.get("TSK_DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.environ.get("TSK_DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = (
+    os.environ.get("TSK_DB_POOL_PRE_PING", "true").lower() == "true"
+)
+DB_POOL_USE_LIFO = (
+    os.environ.get("TSK_DB_POOL_USE_LIFO", "false").lower() == "true"
+)
+
+TASK_AGGREGATED_QUERY = (
+    os.environ.get("TSK_TASK_AGGREGATED_QUERY", "true").lower() == "true"
+)
+
+ACCESS_TOKEN_CACHE_SIZE = int(
+    os.environ.get("TSK_ACCESS_TOKEN_CACHE_SIZE", 10000)
+)
+
+PASSWORD_HASHER_WORKERS = int(
+    os.environ.get("TSK_PASSWORD_HASHER_WORKERS", os.cpu_count() or 1)
+)
+PASSWORD_HASHER_MAX_PENDING = int(
+    os.environ.get("TSK_PASSWORD_HASHER_MAX_PENDING", 32)
+)
+
+# memory | redis | none
+# memory 는 워커마다 따로 두는 캐시라서 다른 워커가 처리한 쓰기로는 무효화되지
+# 않는다. uvicorn 워커가 둘 이상이면 redis 를 쓴다.
+TASK_CACHE_BACKEND = os.environ.get("TSK_TASK_CACHE_BACKEND", "memory")
+TASK_CACHE_REDIS_URL = os.environ.get(
+    "TSK_TASK_CACHE_REDIS_URL", "redis://localhost:6379/0"
+)
+# Redis 가 응답하지 않을 때 요청이 캐시를 포기하고 DB 로 넘어가기까지의 시간
+TASK_CACHE_REDIS_TIMEOUT = float(
+    os.environ.get("TSK_TASK_CACHE_REDIS_TIMEOUT", 0.2)
+)
+TASK_CACHE_TTL = int(os.environ.get("TSK_TASK_CACHE_TTL", 300))
+TASK_CACHE_MAX_SIZE = int(os.environ.get("TSK_TASK_CACHE_MAX_SIZE", 10000))
+
+ROUTINE_HISTORY_MAX_DAYS = int(
+    os.environ.get("TSK_ROUTINE_HISTORY_MAX_DAYS", 366)
+)
+ROUTINE_ELEMENT_RETENTION_DAYS = int(
+    os.environ.get("TSK_ROUTINE_ELEMENT_RETENTION_DAYS", 30)
+)
+
+EXPORT_BATCH_SIZE = int(os.environ.get("TSK_EXPORT_BATCH_SIZE", 1000))
+
+IMPORT_MAX_BYTES = int(os.environ.get("TSK_IMPORT_MAX_BYTES", 50 * 2**20))
+IMPORT_SPOOL_MEMORY_BYTES = int(
+    os.environ.get("TSK_IMPORT_SPOOL_MEMORY_BYTES", 2**20)
+)
+IMPORT_MAX_ERRORS = int(os.environ.get("TSK_IMPORT_MAX_ERRORS", 1000))
+
+REQUEST_LOG = os.environ.get("TSK_REQUEST_LOG", "true").lower() == "true"
+
+# uvicorn 워커가 여러 개면 모든 워커가 쓸 수 있는 빈 디렉터리를 지정한다.
+# 배포할 때마다 비워야 이전 프로세스의 누적값이 섞이지 않는다.
+METRICS_MULTIPROC_DIR = os.environ.get("TSK_METRICS_MULTIPROC_DIR")
+METRICS_WRITE_INTERVAL = float(os.environ.get("TSK_METRICS_WRITE_INTERVAL", 5))
+
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
 JWT_ALGORITHM = "HS256"
@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from typing import IO, Iterable, Iterator
+
+from fastapi import HTTPException, Request, status
+
+from app.api.errors import PAYLOAD_TOO_LARGE
+from app.core.config import IMPORT_MAX_BYTES, IMPORT_SPOOL_MEMORY_BYTES
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+IMPORT_MEDIA_TYPES = {
+    "application/x-ndjson": NDJSON,
+    "application/ndjson": NDJSON,
+    "text/csv": CSV,
+}
+
+
+def import_format(content_type: str | None) -> str | None:
+    media_type = (content_type or "").split(";")[0].strip().lower()
+
+    return IMPORT_MEDIA_TYPES.get(media_type)
+
+
+async def spool_request_body(request: Request) -> IO[bytes]:
+    body = SpooledTemporaryFile(max_size=IMPORT_SPOOL_MEMORY_BYTES)
+    size = 0
+
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > IMPORT_MAX_BYTES:
+            body.close()
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=PAYLOAD_TOO_LARGE,
+            )
+
+        body.write(chunk)
+
+    body.seek(0)
+
+    return body
+
+
+# 한 행씩 (줄 번호, 레코드)를 돌려주고, 파싱할 수 없는 행은 레코드가 None 이다.
+# CSV 에서 json_fields 에 속한 칸은 "[0, 1, 2]" 같은 JSON 값으로 읽는다.
+def iter_records(
+    body: IO[bytes], body_format: str, json_fields: Iterable[str] = ()
+) -> Iterator[tuple[int, dict | None]]:
+    text = io.TextIOWrapper(body, encoding="utf-8", errors="replace")
+
+    if body_format == NDJSON:
+        for line_number, line in enumerate(text, 1):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+
+            yield line_number, record if isinstance(record, dict) else None
+
+        return
+
+    reader = csv.DictReader(text)
+    for row in reader:
+        # 빈 칸은 값이 없는 것으로 보고 스키마 기본값을 따른다
+        record = {
+            key: value
+            for key, value in row.items()
+            if key is not None and value not in (None, "")
+        }
+
+        try:
+            for field in json_fields:
+                if field in record:
+                    record[field] = json.loads(record[field])
+        except ValueError:
+            record = None
+
+        yield reader.line_num, record
+
+
+def _copy_value(value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        value = value.isoformat()
+
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+# COPY ... FROM STDIN 의 text 형식으로 행을 모아 둔다
+class StagingFile:
+    def __init__(self):
+        self.file = SpooledTemporaryFile(
+            max_size=IMPORT_SPOOL_MEMORY_BYTES, mode="w+", encoding="utf-8"
+        )
+        self.count = 0
+
+    def write(self, row: Iterable):
+        self.file.write("\t".join(_copy_value(value) for value in row))
+        self.file.write("\n")
+        self.count += 1
+
+    def rewind(self) -> IO[str]:
+        self.file.seek(0)
+
+        return self.file
+
+    def close(self):
+        self.file.close()
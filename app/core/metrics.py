@@ -0,0 +1,320 @@
+import asyncio
+import bisect
+import json
+import os
+from collections import defaultdict
+
+from anyio import to_thread
+
+from app.core.auth import access_token_cache
+from app.core.cache import task_cache
+from app.core.config import METRICS_MULTIPROC_DIR, METRICS_WRITE_INTERVAL
+from app.database.db import get_pool_stats
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+REQUEST_LABELS = ("method", "route", "operation_id", "status")
+
+METRICS = {
+    "taskie_http_request_duration_seconds": (
+        "histogram",
+        "HTTP request latency by route and operation_id.",
+    ),
+    "taskie_http_request_db_queries_total": (
+        "counter",
+        "SQL queries issued by requests.",
+    ),
+    "taskie_http_request_db_seconds_total": (
+        "counter",
+        "Time spent in SQL queries by requests.",
+    ),
+    "taskie_http_requests_in_flight": (
+        "gauge",
+        "HTTP requests being served.",
+    ),
+    "taskie_threadpool_tokens_in_use": (
+        "gauge",
+        "Worker threads borrowed by sync endpoints and dependencies.",
+    ),
+    "taskie_threadpool_tokens_total": (
+        "gauge",
+        "Worker thread limit of the threadpool.",
+    ),
+    "taskie_db_pool_size": ("gauge", "Configured connection pool size."),
+    "taskie_db_pool_checked_out": ("gauge", "Connections checked out."),
+    "taskie_db_pool_overflow": ("gauge", "Overflow connections open."),
+    "taskie_db_pool_checkouts_total": ("counter", "Connection checkouts."),
+    "taskie_db_pool_timeouts_total": ("counter", "Checkout timeouts."),
+    "taskie_db_pool_wait_seconds_total": (
+        "counter",
+        "Time spent waiting for a connection.",
+    ),
+    "taskie_cache_hits_total": ("counter", "Cache hits."),
+    "taskie_cache_misses_total": ("counter", "Cache misses."),
+}
+
+
+class _Series:
+    __slots__ = ("buckets", "sum", "db_queries", "db_seconds")
+
+    def __init__(self, bucket_count: int):
+        # 마지막 칸은 +Inf 버킷이다
+        self.buckets = [0] * (bucket_count + 1)
+        self.sum = 0.0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+
+
+# 요청 지표는 이벤트 루프 스레드에서만 갱신하고 읽으므로 잠금 없이 다룬다
+class RequestMetrics:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.bucket_bounds = buckets
+        self.series: dict[tuple[str, ...], _Series] = {}
+        self.in_flight = 0
+
+    def observe(
+        self,
+        labels: tuple[str, ...],
+        seconds: float,
+        db_queries: int = 0,
+        db_seconds: float = 0.0,
+    ):
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = _Series(len(self.bucket_bounds))
+
+        series.buckets[bisect.bisect_left(self.bucket_bounds, seconds)] += 1
+        series.sum += seconds
+        series.db_queries += db_queries
+        series.db_seconds += db_seconds
+
+    def clear(self):
+        self.series.clear()
+        self.in_flight = 0
+
+
+request_metrics = RequestMetrics()
+
+
+def _sample(name: str, value: float, **labels: str) -> list:
+    return [name, labels, value]
+
+
+def _process_samples() -> tuple[list, list]:
+    counters = []
+    gauges = [
+        _sample("taskie_http_requests_in_flight", request_metrics.in_flight)
+    ]
+
+    limiter = to_thread.current_default_thread_limiter()
+    gauges.append(
+        _sample("taskie_threadpool_tokens_in_use", limiter.borrowed_tokens)
+    )
+    gauges.append(
+        _sample("taskie_threadpool_tokens_total", limiter.total_tokens)
+    )
+
+    for engine, stats in get_pool_stats().items():
+        for name, key in [
+            ("taskie_db_pool_size", "pool_size"),
+            ("taskie_db_pool_checked_out", "checked_out"),
+            ("taskie_db_pool_overflow", "overflow"),
+        ]:
+            gauges.append(_sample(name, stats[key], engine=engine))
+        counters.extend(
+            [
+                _sample(
+                    "taskie_db_pool_checkouts_total",
+                    stats["checkouts"],
+                    engine=engine,
+                ),
+                _sample(
+                    "taskie_db_pool_timeouts_total",
+                    stats["timeouts"],
+                    engine=engine,
+                ),
+                _sample(
+                    "taskie_db_pool_wait_seconds_total",
+                    stats["wait_seconds_total"],
+                    engine=engine,
+                ),
+            ]
+        )
+
+    caches = [("access_token", access_token_cache)]
+    if task_cache is not None:
+        caches.append(("task", task_cache))
+    for cache, source in caches:
+        counters.append(
+            _sample("taskie_cache_hits_total", source.hits, cache=cache)
+        )
+        counters.append(
+            _sample("taskie_cache_misses_total", source.misses, cache=cache)
+        )
+
+    return counters, gauges
+
+
+def snapshot() -> dict:
+    counters, gauges = _process_samples()
+
+    return {
+        "pid": os.getpid(),
+        "buckets": list(request_metrics.bucket_bounds),
+        "requests": [
+            [
+                list(labels),
+                series.buckets,
+                series.sum,
+                series.db_queries,
+                series.db_seconds,
+            ]
+            for labels, series in request_metrics.series.items()
+        ],
+        "counters": counters,
+        "gauges": gauges,
+    }
+
+
+def _snapshot_path(directory: str, pid: int) -> str:
+    return os.path.join(directory, f"metrics-{pid}.json")
+
+
+def write_snapshot(directory: str) -> None:
+    # 다른 워커가 반쯤 쓰인 파일을 읽지 않도록 임시 파일을 바꿔치기한다
+    path = _snapshot_path(directory, os.getpid())
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(snapshot(), file)
+    os.replace(temporary_path, path)
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+def read_snapshots(directory: str) -> list[dict]:
+    snapshots = []
+    for name in os.listdir(directory):
+        if not (name.startswith("metrics-") and name.endswith(".json")):
+            continue
+
+        try:
+            with open(os.path.join(directory, name)) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            continue
+
+        # 종료된 워커의 누적값은 남기고, 순간값인 게이지는 버린다
+        if data["pid"] != os.getpid() and not _is_alive(data["pid"]):
+            data["gauges"] = []
+        snapshots.append(data)
+
+    return snapshots
+
+
+def collect() -> list[dict]:
+    if not METRICS_MULTIPROC_DIR:
+        return [snapshot()]
+
+    write_snapshot(METRICS_MULTIPROC_DIR)
+
+    return read_snapshots(METRICS_MULTIPROC_DIR)
+
+
+async def write_snapshots_periodically():
+    while True:
+        await asyncio.sleep(METRICS_WRITE_INTERVAL)
+        write_snapshot(METRICS_MULTIPROC_DIR)
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+
+    pairs = ",".join(
+        '{}="{}"'.format(
+            key,
+            str(value)
+            .replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n"),
+        )
+        for key, value in labels.items()
+    )
+
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(snapshots: list[dict]) -> str:
+    requests = {}
+    samples = defaultdict(dict)
+
+    for data in snapshots:
+        bounds = data["buckets"]
+        for labels, buckets, total, queries, seconds in data["requests"]:
+            merged = requests.setdefault(
+                tuple(labels), [bounds, [0] * len(buckets), 0.0, 0, 0.0]
+            )
+            merged[1] = [a + b for a, b in zip(merged[1], buckets)]
+            merged[2] += total
+            merged[3] += queries
+            merged[4] += seconds
+
+        for name, labels, value in data["counters"] + data["gauges"]:
+            key = tuple(sorted(labels.items()))
+            samples[name][key] = samples[name].get(key, 0) + value
+
+    for labels, (_, _, _, queries, seconds) in requests.items():
+        label_map = tuple(zip(REQUEST_LABELS, labels))
+        samples["taskie_http_request_db_queries_total"][label_map] = queries
+        samples["taskie_http_request_db_seconds_total"][label_map] = seconds
+
+    lines = []
+    for name, (metric_type, help_text) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+        if metric_type == "histogram":
+            for labels, (bounds, buckets, total, _, _) in requests.items():
+                label_map = dict(zip(REQUEST_LABELS, labels))
+                cumulative = 0
+                for bound, count in zip(list(bounds) + ["+Inf"], buckets):
+                    cumulative += count
+                    bucket_labels = _format_labels(
+                        {**label_map, "le": str(bound)}
+                    )
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                formatted = _format_labels(label_map)
+                lines.append(f"{name}_sum{formatted} {_format_value(total)}")
+                lines.append(f"{name}_count{formatted} {cumulative}")
+            continue
+
+        for labels, value in samples[name].items():
+            lines.append(
+                f"{name}{_format_labels(dict(labels))} {_format_value(value)}"
+            )
+
+    return "\n".join(lines) + "\n"
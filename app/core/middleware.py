@@ -0,0 +1,161 @@
+import json
+import logging
+import time
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import request_metrics
+from app.database.query_stats import QueryStats, current_query_stats
+
+logger = logging.getLogger("app.requests")
+
+
+def route_of(scope: Scope) -> APIRoute | None:
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is None or app is None:
+        return None
+
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.endpoint is endpoint:
+            return route
+
+    return None
+
+
+def operation_id_of(scope: Scope) -> str | None:
+    route = route_of(scope)
+    if route is None:
+        return None
+
+    return route.operation_id or route.unique_id
+
+
+def server_timing(stats: QueryStats, total_seconds: float) -> str:
+    return (
+        f'db;dur={stats.seconds * 1000:.3f};desc="queries={stats.count} '
+        f'rows={stats.rows}", total;dur={total_seconds * 1000:.3f}'
+    )
+
+
+# 요청마다 SQL 쿼리 수, DB 시간, 행 수를 모아 Server-Timing 헤더로 돌려주고
+# operation_id 를 키로 한 JSON 한 줄로 로그를 남긴다
+class QueryStatsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._operation_ids: dict[object, str | None] = {}
+
+    def _operation_id(self, scope: Scope) -> str | None:
+        endpoint = scope.get("endpoint")
+        if endpoint not in self._operation_ids:
+            self._operation_ids[endpoint] = operation_id_of(scope)
+
+        return self._operation_ids[endpoint]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message):
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    server_timing(stats, time.perf_counter() - started),
+                )
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+
+            if logger.isEnabledFor(logging.INFO):
+                self._log(scope, status_code, started, stats)
+
+    def _log(
+        self, scope: Scope, status_code: int, started: float, stats: QueryStats
+    ):
+        # 스트리밍 응답은 헤더를 보낸 뒤에도 쿼리가 이어지므로 로그는
+        # 응답이 끝난 뒤의 값으로 남긴다
+        logger.info(
+            json.dumps(
+                {
+                    "operation_id": self._operation_id(scope),
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round(
+                        (time.perf_counter() - started) * 1000, 3
+                    ),
+                    "db_queries": stats.count,
+                    "db_ms": round(stats.seconds * 1000, 3),
+                    "db_rows": stats.rows,
+                }
+            )
+        )
+
+
+# 라우트 템플릿과 operation_id 별로 지연 시간, 동시 요청 수, DB 쿼리 수를
+# 모은다. QueryStatsMiddleware 안쪽에 두어야 요청의 QueryStats 를 읽을 수
+# 있다.
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._labels: dict[object, tuple[str, str]] = {}
+
+    def _route_labels(self, scope: Scope) -> tuple[str, str]:
+        endpoint = scope.get("endpoint")
+        if endpoint not in self._labels:
+            route = route_of(scope)
+            # 매칭되지 않은 경로를 그대로 라벨로 쓰면 시계열이 끝없이 는다
+            self._labels[endpoint] = (
+                ("unmatched", "")
+                if route is None
+                else (route.path, route.operation_id or route.unique_id)
+            )
+
+        return self._labels[endpoint]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_metrics.in_flight += 1
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            request_metrics.in_flight -= 1
+
+            route, operation_id = self._route_labels(scope)
+            stats = current_query_stats.get() or QueryStats()
+            request_metrics.observe(
+                (scope["method"], route, operation_id, str(status_code)),
+                time.perf_counter() - started,
+                stats.count,
+                stats.seconds,
+            )
@@ -0,0 +1,28 @@
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any):
+    if isinstance(value, BaseModel):
+        return value.dict()
+
+    return jsonable_encoder(value)
+
+
+# 핸들러가 이미 response_model 타입의 객체를 돌려줄 때 이 응답으로 감싸면
+# FastAPI 의 재검증과 jsonable_encoder 를 건너뛴다. orjson 이 없으면
+# 기존 JSONResponse 와 같은 경로로 직렬화한다.
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+
+        return orjson.dumps(content, default=_default)
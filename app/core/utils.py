@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+import zlib
+from datetime import date, datetime, time, timedelta
+from pytz import timezone
+from pytz.tzinfo import BaseTzInfo
+from typing import AsyncIterator
+from sqlalchemy import ColumnElement, and_
+
+# TIMESTAMP 컬럼에는 이 타임존 기준의 벽시계 시간이 저장된다.
+STORAGE_TIMEZONE = timezone("Asia/Seoul")
+
+
+def get_date_range(
+    target: date, tz: BaseTzInfo = STORAGE_TIMEZONE
+) -> tuple[datetime, datetime]:
+    start = tz.localize(datetime.combine(target, time.min))
+    end = tz.localize(datetime.combine(target + timedelta(days=1), time.min))
+
+    return (
+        start.astimezone(STORAGE_TIMEZONE).replace(tzinfo=None),
+        end.astimezone(STORAGE_TIMEZONE).replace(tzinfo=None),
+    )
+
+
+def on_date(
+    column: ColumnElement, target: date, tz: BaseTzInfo = STORAGE_TIMEZONE
+) -> ColumnElement[bool]:
+    start, end = get_date_range(target, tz)
+
+    return and_(column >= start, column < end)
+
+
+def encode_cursor(values: dict) -> str:
+    data = json.dumps(values, separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(data)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError("invalid cursor")
+
+    if not isinstance(values, dict):
+        raise ValueError("invalid cursor")
+
+    return values
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+
+    yield compressor.flush()
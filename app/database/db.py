@@ -1,13 +1,57 @@
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from fastapi import Depends
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-from app.core.config import DATABASE_URI
+from app.core.config import (
+    ASYNC_DATABASE_URI,
+    DATABASE_URI,
+    DB_POOL_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_POOL_USE_LIFO,
+)
 
-engine = create_engine(DATABASE_URI)
+from .pool import instrumented_pool_class, listen_pool_stats
+from .query_stats import listen_query_stats
+
+pool_options = dict(
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_POOL_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    pool_use_lifo=DB_POOL_USE_LIFO,
+)
+
+engine = create_engine(
+    DATABASE_URI,
+    poolclass=instrumented_pool_class(QueuePool),
+    **pool_options,
+)
+listen_pool_stats(engine)
+listen_query_stats(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URI,
+    poolclass=instrumented_pool_class(AsyncAdaptedQueuePool),
+    **pool_options,
+)
+listen_pool_stats(async_engine.sync_engine)
+listen_query_stats(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
@@ -22,6 +66,16 @@ def initialize_database():
         print("Database is already initialized.")
 
 
+def get_pool_stats() -> dict:
+    sync_pool = engine.pool
+    async_pool = async_engine.sync_engine.pool
+
+    return {
+        "sync": sync_pool.stats.snapshot(sync_pool),
+        "async": async_pool.stats.snapshot(async_pool),
+    }
+
+
 def get_db() -> Session:
     session = SessionLocal()
     try:
@@ -33,6 +87,17 @@ def get_db() -> Session:
         session.close()
 
 
+async def get_async_db() -> AsyncSession:
+    session = AsyncSessionLocal()
+    try:
+        yield session
+    except Exception as e:
+        await session.rollback()
+        raise e
+    finally:
+        await session.close()
+
+
 @contextmanager
 def tx_manager(session: Session = Depends(get_db)) -> None:
     try:
@@ -41,3 +106,15 @@ def tx_manager(session: Session = Depends(get_db)) -> None:
         yield
     finally:
         session.commit()
+
+
+@asynccontextmanager
+async def async_tx_manager(
+    session: AsyncSession = Depends(get_async_db),
+) -> None:
+    try:
+        if not session.in_transaction():
+            await session.begin()
+        yield
+    finally:
+        await session.commit()
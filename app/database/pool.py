@@ -0,0 +1,130 @@
+import time
+from contextvars import ContextVar
+from threading import Lock
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.pool import Pool
+
+# 비동기 엔진은 한 스레드에서 여러 체크아웃이 번갈아 돌기 때문에 스레드
+# 로컬 대신 컨텍스트 변수를 쓴다
+_measuring_wait: ContextVar[bool] = ContextVar(
+    "_measuring_wait", default=False
+)
+
+
+class PoolStats:
+    def __init__(self):
+        self._lock = Lock()
+
+        self.checked_out = 0
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+
+        self.max_checked_out = 0
+        self.max_overflow = 0
+
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, dbapi_connection, connection_record, proxy):
+        with self._lock:
+            self.checked_out += 1
+            self.checkouts += 1
+            self.max_checked_out = max(self.max_checked_out, self.checked_out)
+
+    def on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checked_out -= 1
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def record_wait(self, seconds: float, overflow: int):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self.max_overflow = max(self.max_overflow, overflow)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool: Pool) -> dict:
+        with self._lock:
+            return {
+                "pool_size": pool.size(),
+                "checked_out": self.checked_out,
+                "overflow": max(pool.overflow(), 0),
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "max_checked_out": self.max_checked_out,
+                "max_overflow": self.max_overflow,
+                "wait_count": self.wait_count,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+
+
+def instrumented_pool_class(pool_class: type[Pool]) -> type[Pool]:
+    # 풀 이벤트에는 "체크아웃 대기 시작" 시점이 없어서 _do_get()을 감싸 큐
+    # 대기 시간을 잰다. pre-ping 은 _do_get() 뒤에 일어나므로 빠지고, 새
+    # 연결을 여는 시간은 연결 레코드에 남겨 두었다가 뺀다. 나머지 카운터는
+    # 이벤트 리스너로 집계한다.
+    stats = PoolStats()
+
+    class InstrumentedPool(pool_class):
+        def _create_connection(self):
+            started = time.perf_counter()
+            record = super()._create_connection()
+            record.connect_seconds = time.perf_counter() - started
+
+            return record
+
+        def _do_get(self):
+            # QueuePool 은 오버플로 경합이 나면 _do_get()을 다시 부르므로
+            # 바깥 호출에서만 한 번 기록한다
+            if _measuring_wait.get():
+                return super()._do_get()
+
+            token = _measuring_wait.set(True)
+            started = time.perf_counter()
+            try:
+                record = super()._do_get()
+            except exc.TimeoutError:
+                stats.record_timeout()
+                raise
+            finally:
+                _measuring_wait.reset(token)
+
+            waited = time.perf_counter() - started
+            waited -= record.__dict__.pop("connect_seconds", 0.0)
+            stats.record_wait(max(waited, 0.0), self.overflow())
+
+            return record
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    InstrumentedPool.stats = stats
+
+    return InstrumentedPool
+
+
+def listen_pool_stats(engine: Engine) -> PoolStats:
+    stats: PoolStats = engine.pool.stats
+
+    event.listen(engine, "connect", stats.on_connect)
+    event.listen(engine, "checkout", stats.on_checkout)
+    event.listen(engine, "checkin", stats.on_checkin)
+    event.listen(engine, "invalidate", stats.on_invalidate)
+
+    return stats
@@ -0,0 +1,54 @@
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import Engine, event
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.rows = 0
+
+    def record(self, seconds: float, rows: int):
+        self.count += 1
+        self.seconds += seconds
+        self.rows += max(rows, 0)
+
+
+# 요청마다 새 QueryStats 를 넣는다. 스레드풀로 넘어간 동기 엔드포인트도
+# 컨텍스트를 복사해 가므로 같은 객체에 집계된다.
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    if current_query_stats.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    stats = current_query_stats.get()
+    started = conn.info.get("query_started")
+    if stats is None or not started:
+        return
+
+    stats.record(time.perf_counter() - started.pop(), cursor.rowcount)
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리의 시작 시각이 다음 쿼리에 섞이지 않도록 버린다
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def listen_query_stats(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,102 @@
+"""
+Rebuild habit_stats from habit_log.
+
+    TSK_DB_URL=... JWT_SECRET_KEY=... python -m app.jobs.backfill_habit_stats
+"""
+import argparse
+from collections import defaultdict
+
+from sqlalchemy import Date, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.database.db import SessionLocal
+from app.models.models import Habit, HabitLog, HabitStats
+
+STATS_COLUMNS = [
+    "current_streak",
+    "best_streak",
+    "total_completions",
+    "last_completed_date",
+    "streak_last_date",
+]
+
+
+def _build_stats(habit: Habit, completions: list) -> dict:
+    stats = HabitStats(
+        habit_id=habit.id, current_streak=0, best_streak=0, total_completions=0
+    )
+
+    for completed_date, count in completions:
+        for _ in range(count):
+            stats.record_completion(habit, completed_date)
+
+    return {column: getattr(stats, column) for column in STATS_COLUMNS}
+
+
+def backfill_habit_stats(session: Session, batch_size: int = 500) -> int:
+    last_id = 0
+    total = 0
+
+    while True:
+        habits = session.scalars(
+            select(Habit)
+            .where(Habit.id > last_id)
+            .order_by(Habit.id)
+            .limit(batch_size)
+        ).all()
+        if not habits:
+            break
+
+        # 습관별 하루 단위 달성 횟수만 가져와 날짜 순서대로 다시 계산한다
+        completed_date = cast(HabitLog.completed_at, Date)
+        rows = session.execute(
+            select(HabitLog.habit_id, completed_date, func.count())
+            .where(HabitLog.habit_id.in_([habit.id for habit in habits]))
+            .group_by(HabitLog.habit_id, completed_date)
+            .order_by(HabitLog.habit_id, completed_date)
+        ).all()
+
+        completions = defaultdict(list)
+        for habit_id, day, count in rows:
+            completions[habit_id].append((day, count))
+
+        values = [
+            {
+                "habit_id": habit.id,
+                **_build_stats(habit, completions[habit.id]),
+            }
+            for habit in habits
+        ]
+        statement = insert(HabitStats).values(values)
+        session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[HabitStats.habit_id],
+                set_={
+                    column: statement.excluded[column]
+                    for column in STATS_COLUMNS
+                }
+                | {"updated_at": func.now()},
+            )
+        )
+        session.commit()
+
+        last_id = habits[-1].id
+        total += len(habits)
+
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        total = backfill_habit_stats(session, batch_size=args.batch_size)
+
+    print(f"backfilled {total} habits")
+
+
+if __name__ == "__main__":
+    main()
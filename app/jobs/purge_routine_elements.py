@@ -0,0 +1,78 @@
+"""
+Hard-delete routine elements that were soft-deleted before the retention
+period and have no routine logs. Tombstones that still have logs are kept,
+since deleting them would cascade to the logs that
+rebuild_routine_daily_summary recomputes the per-day totals from.
+
+    TSK_DB_URL=... JWT_SECRET_KEY=... \
+        python -m app.jobs.purge_routine_elements [--retention-days N]
+"""
+import argparse
+from datetime import timedelta
+
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import ROUTINE_ELEMENT_RETENTION_DAYS
+from app.database.db import SessionLocal
+from app.models.models import RoutineElement, RoutineLog
+
+
+def purge_routine_elements(
+    session: Session,
+    retention_days: int = ROUTINE_ELEMENT_RETENTION_DAYS,
+    batch_size: int = 1000,
+) -> int:
+    cutoff = func.now() - timedelta(days=retention_days)
+    total = 0
+
+    while True:
+        # 배치마다 커밋해 잠금을 짧게 유지하고, 다른 트랜잭션이 잡은 행은 건너뛴다.
+        # 로그가 남은 요소는 지우면 로그까지 CASCADE 로 사라지므로 남겨 둔다.
+        batch = (
+            select(RoutineElement.id)
+            .where(
+                RoutineElement.deleted_at < cutoff,
+                ~exists().where(
+                    RoutineLog.routine_element_id == RoutineElement.id
+                ),
+            )
+            .order_by(RoutineElement.deleted_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = session.execute(
+            delete(RoutineElement)
+            .where(RoutineElement.id.in_(batch.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+
+        if result.rowcount == 0:
+            break
+
+        total += result.rowcount
+
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--retention-days", type=int, default=ROUTINE_ELEMENT_RETENTION_DAYS
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        total = purge_routine_elements(
+            session,
+            retention_days=args.retention_days,
+            batch_size=args.batch_size,
+        )
+
+    print(f"purged {total} routine elements")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Rebuild routine_daily_summary from routine_log.
+
+    TSK_DB_URL=... JWT_SECRET_KEY=... \
+        python -m app.jobs.rebuild_routine_daily_summary [--from D --to D]
+"""
+import argparse
+from datetime import date
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.api.dao.routine_log_dao import (
+    DAILY_SUMMARY_COLUMNS,
+    daily_summary_select,
+)
+from app.core.utils import get_date_range
+from app.database.db import SessionLocal
+from app.models.models import RoutineDailySummary, RoutineLog
+
+
+def rebuild_routine_daily_summary(
+    session: Session,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> int:
+    summary_filters = []
+    log_filters = []
+    if start_date is not None:
+        summary_filters.append(RoutineDailySummary.log_date >= start_date)
+        log_filters.append(
+            RoutineLog.completed_at >= get_date_range(start_date)[0]
+        )
+    if end_date is not None:
+        summary_filters.append(RoutineDailySummary.log_date <= end_date)
+        log_filters.append(
+            RoutineLog.completed_at < get_date_range(end_date)[1]
+        )
+
+    session.execute(delete(RoutineDailySummary).where(*summary_filters))
+
+    result = session.execute(
+        RoutineDailySummary.__table__.insert().from_select(
+            DAILY_SUMMARY_COLUMNS, daily_summary_select(*log_filters)
+        )
+    )
+    session.commit()
+
+    return result.rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--from", dest="start_date", type=date.fromisoformat)
+    parser.add_argument("--to", dest="end_date", type=date.fromisoformat)
+    args = parser.parse_args()
+
+    with SessionLocal() as session:
+        total = rebuild_routine_daily_summary(
+            session, start_date=args.start_date, end_date=args.end_date
+        )
+
+    print(f"rebuilt {total} daily summaries")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,26 @@
+import asyncio
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.controllers import router as api_router
-from app.database.db import initialize_database
+from app.core.auth import password_hasher
+from app.core.config import METRICS_MULTIPROC_DIR, REQUEST_LOG
+from app.core.metrics import write_snapshot, write_snapshots_periodically
+from app.core.middleware import (
+    MetricsMiddleware,
+    QueryStatsMiddleware,
+    logger as request_logger,
+)
+from app.core.responses import FastJSONResponse
+from app.database.db import async_engine, initialize_database
 from app.schemas.response import ErrorResponse
 from app.api.error_handlers import validation_exception_handler
 
 app = FastAPI(
     title="Taskie backend",
+    default_response_class=FastJSONResponse,
     responses={
         422: {"model": ErrorResponse, "description": "Validation Error"},
     },
@@ -18,6 +31,22 @@ app = FastAPI(
 async def startup_event():
     initialize_database()
 
+    # 워커마다 자기 지표를 파일로 내보내 다른 워커의 /metrics 에서 합친다
+    if METRICS_MULTIPROC_DIR:
+        app.state.metrics_writer = asyncio.create_task(
+            write_snapshots_periodically()
+        )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if METRICS_MULTIPROC_DIR:
+        app.state.metrics_writer.cancel()
+        write_snapshot(METRICS_MULTIPROC_DIR)
+
+    await async_engine.dispose()
+    password_hasher.shutdown()
+
 
 # CORS 설정
 origins = [
@@ -32,8 +61,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+
+# 요청 로그는 JSON 한 줄이므로 포맷 없이 그대로 내보낸다
+if REQUEST_LOG:
+    request_handler = logging.StreamHandler()
+    request_handler.setFormatter(logging.Formatter("%(message)s"))
+    request_logger.addHandler(request_handler)
+    request_logger.setLevel(logging.INFO)
+    request_logger.propagate = False
+
 app.include_router(api_router)
 
 validation_exception_handler(app)
@@ -1,17 +1,63 @@
+from datetime import date, timedelta
 from sqlalchemy import (
     Column,
+    Computed,
+    Date,
     Integer,
+    SmallInteger,
     String,
     Text,
     ForeignKey,
     TIMESTAMP,
     Boolean,
+    Index,
     func,
+    text,
 )
+from sqlalchemy.ext.hybrid import hybrid_method
 from sqlalchemy.orm import relationship
 
 from app.database.db import Base
 
+# repeat_days 문자열("0135")에서 요일 비트마스크를 DB 가 직접 계산한다
+REPEAT_MASK_EXPRESSION = "CAST({} AS SMALLINT)".format(
+    " + ".join(
+        f"CASE WHEN strpos(repeat_days, '{day}') > 0 "
+        f"THEN {1 << day} ELSE 0 END"
+        for day in range(7)
+    )
+)
+
+
+class RepeatDaysMixin:
+    repeat_mask = Column(
+        SmallInteger, Computed(REPEAT_MASK_EXPRESSION), nullable=False
+    )
+
+    @staticmethod
+    def repeat_days_to_string(repeat_days):
+        return "".join([str(day) for day in repeat_days])
+
+    def repeat_days_to_list(self):
+        return [int(day) for day in self.repeat_days]
+
+    @hybrid_method
+    def repeats_on(self, weekday: int) -> bool:
+        return str(weekday) in self.repeat_days
+
+    @repeats_on.inplace.expression
+    @classmethod
+    def _repeats_on_expression(cls, weekday: int):
+        return cls.repeat_mask.op("&")(1 << weekday) != 0
+
+    def previous_repeat_date(self, target: date) -> date | None:
+        for days in range(1, 8):
+            previous = target - timedelta(days=days)
+            if self.repeats_on(previous.weekday()):
+                return previous
+
+        return None
+
 
 class User(Base):
     __tablename__ = "user"
@@ -28,6 +74,33 @@ class User(Base):
 class Todo(Base):
     __tablename__ = "todo"
 
+    # 첫 인덱스는 /task 처럼 완료 여부를 가리지 않는 조회를, 아래 두 부분
+    # 인덱스는 목록의 키셋 페이지네이션을 맡는다
+    __table_args__ = (
+        Index(
+            "ix_todo_user_id_completed_at_target_date",
+            "user_id",
+            "completed_at",
+            "target_date",
+        ),
+        Index(
+            "ix_todo_open_user_id_target_date_order",
+            "user_id",
+            "target_date",
+            "order",
+            text("updated_at DESC"),
+            "id",
+            postgresql_where=text("completed_at IS NULL"),
+        ),
+        Index(
+            "ix_todo_completed_user_id_completed_at_id",
+            "user_id",
+            "completed_at",
+            "id",
+            postgresql_where=text("completed_at IS NOT NULL"),
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
     title = Column(String(200), nullable=False)
     order = Column(Integer, nullable=False)
@@ -46,9 +119,13 @@ class Todo(Base):
     )
 
 
-class Habit(Base):
+class Habit(RepeatDaysMixin, Base):
     __tablename__ = "habit"
 
+    __table_args__ = (
+        Index("ix_habit_user_id_activated_id", "user_id", "activated", "id"),
+    )
+
     id = Column(Integer, primary_key=True)
 
     title = Column(String(200), nullable=False)
@@ -68,17 +145,16 @@ class Habit(Base):
         Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
     )
 
-    @staticmethod
-    def repeat_days_to_string(repeat_days):
-        return "".join([str(day) for day in repeat_days])
-
-    def repeat_days_to_list(self):
-        return [int(day) for day in self.repeat_days]
-
 
 class HabitLog(Base):
     __tablename__ = "habit_log"
 
+    __table_args__ = (
+        Index(
+            "ix_habit_log_habit_id_completed_at", "habit_id", "completed_at"
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
     completed_at = Column(TIMESTAMP, default=func.now(), nullable=False)
 
@@ -87,9 +163,79 @@ class HabitLog(Base):
     )
 
 
-class Routine(Base):
+class HabitStats(Base):
+    __tablename__ = "habit_stats"
+
+    habit_id = Column(
+        Integer,
+        ForeignKey("habit.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    current_streak = Column(Integer, default=0, nullable=False)
+    best_streak = Column(Integer, default=0, nullable=False)
+    total_completions = Column(Integer, default=0, nullable=False)
+    last_completed_date = Column(Date)
+    # 연속 기록에 마지막으로 포함된 반복 요일 날짜
+    streak_last_date = Column(Date)
+
+    updated_at = Column(
+        TIMESTAMP, default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def record_completion(self, habit: Habit, completed_date: date):
+        self.total_completions = (self.total_completions or 0) + 1
+
+        if (
+            self.last_completed_date is None
+            or completed_date > self.last_completed_date
+        ):
+            self.last_completed_date = completed_date
+
+        # 반복 요일이 아닌 날의 달성은 연속 기록에 영향을 주지 않는다
+        if not habit.repeats_on(completed_date.weekday()):
+            return
+        if (
+            self.streak_last_date is not None
+            and completed_date <= self.streak_last_date
+        ):
+            return
+
+        if (
+            self.streak_last_date is not None
+            and self.streak_last_date
+            == habit.previous_repeat_date(completed_date)
+        ):
+            self.current_streak += 1
+        else:
+            self.current_streak = 1
+
+        self.streak_last_date = completed_date
+        self.best_streak = max(self.best_streak or 0, self.current_streak)
+
+    def current_streak_on(self, habit: Habit, today: date) -> int:
+        if self.streak_last_date is None:
+            return 0
+
+        # 직전 반복 요일까지 달성했다면 오늘은 아직 기록이 끊기지 않은 상태다
+        previous = habit.previous_repeat_date(today)
+        if previous is None or self.streak_last_date >= previous:
+            return self.current_streak
+
+        return 0
+
+
+class Routine(RepeatDaysMixin, Base):
     __tablename__ = "routine"
 
+    __table_args__ = (
+        Index(
+            "ix_routine_user_id_start_time_minutes",
+            "user_id",
+            "start_time_minutes",
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
 
     title = Column(String(200), nullable=False)
@@ -105,24 +251,36 @@ class Routine(Base):
         Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
     )
 
+    # 로딩 방식은 쿼리마다 options 로 정하고, 지정하지 않은 접근은 막는다
     routine_elements = relationship(
         "RoutineElement",
-        order_by="RoutineElement.order.asc()",
+        primaryjoin="and_(Routine.id == RoutineElement.routine_id, "
+        "RoutineElement.deleted_at.is_(None))",
+        order_by="[RoutineElement.order.asc(), RoutineElement.id.asc()]",
         cascade="all, delete",
-        lazy="joined",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
-    def repeat_days_to_list(self):
-        return [int(day) for day in self.repeat_days]
-
-    @staticmethod
-    def repeat_days_to_string(repeat_days):
-        return "".join([str(day) for day in repeat_days])
-
 
 class RoutineElement(Base):
     __tablename__ = "routine_element"
 
+    # 삭제된 요소는 deleted_at 만 채워 두고 기록은 그대로 남긴다
+    __table_args__ = (
+        Index(
+            "ix_routine_element_live_routine_id_order",
+            "routine_id",
+            "order",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_routine_element_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
 
     title = Column(String(200), nullable=False)
@@ -150,11 +308,27 @@ class RoutineElement(Base):
 class RoutineLog(Base):
     __tablename__ = "routine_log"
 
+    __table_args__ = (
+        Index(
+            "ix_routine_log_routine_id_completed_at",
+            "routine_id",
+            "completed_at",
+        ),
+        Index(
+            "ix_routine_log_routine_element_id_log_date",
+            "routine_element_id",
+            "log_date",
+            unique=True,
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
 
     duration_seconds = Column(Integer, nullable=False)
     completed_at = Column(TIMESTAMP, default=func.now(), nullable=False)
     is_skipped = Column(Boolean, default=False, nullable=False)
+    # 요소별로 하루에 한 건만 남도록 유니크 인덱스에 쓰인다
+    log_date = Column(Date, Computed("CAST(completed_at AS DATE)"))
 
     routine_id = Column(
         Integer,
@@ -166,3 +340,24 @@ class RoutineLog(Base):
         ForeignKey("routine_element.id", ondelete="CASCADE"),
         nullable=False,
     )
+
+
+class RoutineDailySummary(Base):
+    __tablename__ = "routine_daily_summary"
+
+    # (routine_id, log_date) 기본키 하나로 기간 조회가 인덱스 범위 스캔이 된다
+    routine_id = Column(
+        Integer,
+        ForeignKey("routine.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    log_date = Column(Date, primary_key=True)
+
+    log_count = Column(Integer, default=0, nullable=False)
+    completed_count = Column(Integer, default=0, nullable=False)
+    skipped_count = Column(Integer, default=0, nullable=False)
+    total_duration_seconds = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(
+        TIMESTAMP, default=func.now(), onupdate=func.now(), nullable=False
+    )
@@ -99,6 +99,14 @@ class HabitLogPublic(BaseModel):
         orm_mode = True
 
 
+class HabitStatsPublic(BaseModel):
+    habit_id: int
+    current_streak: int = 0
+    best_streak: int = 0
+    total_completions: int = 0
+    last_completed_date: date | None = None
+
+
 class HabitWithLog(HabitPublic):
     near_weekday: int
     log_list: List[HabitLogPublic]
@@ -118,6 +126,19 @@ class HabitWithLog(HabitPublic):
 
         return habit_with_log
 
+    @classmethod
+    def from_dict_with_weekday(cls, habit: dict, today_weekday: int):
+        habit_public = HabitPublic(**habit).dict()
+        habit_with_log = HabitWithLog(
+            **habit_public,
+            near_weekday=HabitWithLog.calculate_near_weekday(
+                habit_public["repeat_days"], today_weekday
+            ),
+            log_list=habit["log_list"]
+        )
+
+        return habit_with_log
+
     @classmethod
     def calculate_near_weekday(
         cls, repeat_days: list[int], curr_week: int
@@ -0,0 +1,14 @@
+from typing import List
+from pydantic import BaseModel
+
+
+class ImportRowError(BaseModel):
+    line: int
+    error_type: str
+    location: str = None
+
+
+class ImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[ImportRowError]
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from pydantic import BaseModel, validator
 from typing import List
 
@@ -95,6 +95,12 @@ class RoutineBase(BaseModel):
     start_time_minutes: int
     repeat_days: List[int]
 
+    @validator("repeat_days", pre=True)
+    def parsed_repeat_days(cls, v):
+        if isinstance(v, str):
+            return [int(day) for day in v]
+        return v
+
 
 class RoutinePublic(RoutineBase):
     routine_elements: List[RoutineItem]
@@ -154,3 +160,14 @@ class RoutineLogBase(BaseModel):
 
 class RoutineLogPutInput(BaseModel):
     logs: List[RoutineLogBase]
+
+
+class RoutineDailySummaryPublic(BaseModel):
+    log_date: date
+    log_count: int
+    completed_count: int
+    skipped_count: int
+    total_duration_seconds: int
+
+    class Config:
+        orm_mode = True
@@ -0,0 +1,40 @@
+"""
+Per-request cost of verify_access_token, with and without the token cache.
+
+    TSK_DB_URL=... JWT_SECRET_KEY=... python -m benchmarks.auth_overhead
+"""
+import argparse
+import timeit
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.auth import (
+    access_token_cache,
+    create_access_token,
+    verify_access_token,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=create_access_token(1)
+    )
+
+    def uncached():
+        access_token_cache.clear()
+        verify_access_token(credentials)
+
+    def cached():
+        verify_access_token(credentials)
+
+    for name, func in [("jwt.decode", uncached), ("cached", cached)]:
+        seconds = min(timeit.repeat(func, number=args.number, repeat=5))
+        print(f"{name:>10}: {seconds / args.number * 1e6:8.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
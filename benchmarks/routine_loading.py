@@ -0,0 +1,74 @@
+"""
+Rows transferred and latency of a user's routine list, loading
+Routine.routine_elements with joinedload vs selectinload.
+
+Seed the database with mock/create-mock.py first.
+
+    TSK_DB_URL=... python -m benchmarks.routine_loading
+"""
+import argparse
+import timeit
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.database.db import engine
+from app.models.models import Routine
+
+
+def busiest_user_id(session: Session) -> int:
+    return session.scalar(
+        select(Routine.user_id)
+        .group_by(Routine.user_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=200)
+    parser.add_argument("--user-id", type=int)
+    args = parser.parse_args()
+
+    counters = {"queries": 0, "rows": 0}
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def count_rows(conn, cursor, statement, parameters, context, many):
+        counters["queries"] += 1
+        counters["rows"] += max(cursor.rowcount, 0)
+
+    with Session(engine) as session:
+        user_id = args.user_id or busiest_user_id(session)
+
+        def load(option):
+            session.scalars(
+                select(Routine)
+                .options(option)
+                .where(Routine.user_id == user_id)
+                .order_by(Routine.start_time_minutes, Routine.id)
+            ).unique().all()
+            session.expunge_all()
+
+        print(f"user_id={user_id}")
+        for name, option in [
+            ("joined", joinedload(Routine.routine_elements)),
+            ("selectin", selectinload(Routine.routine_elements)),
+        ]:
+            counters.update(queries=0, rows=0)
+            load(option)
+            queries, rows = counters["queries"], counters["rows"]
+
+            seconds = min(
+                timeit.repeat(
+                    lambda: load(option), number=args.number, repeat=5
+                )
+            )
+            print(
+                f"{name:>10}: {queries} queries, {rows:6d} rows, "
+                f"{seconds / args.number * 1e3:8.3f} ms/request"
+            )
+
+
+if __name__ == "__main__":
+    main()
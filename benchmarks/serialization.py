@@ -0,0 +1,148 @@
+"""
+Serialization cost of a 100-item /todos list and a full /task payload:
+FastAPI's response_model validation + jsonable_encoder + json vs
+returning FastJSONResponse directly.
+
+    python -m benchmarks.serialization
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.core.responses import FastJSONResponse
+from app.schemas.habit import HabitLogPublic, HabitWithLog
+from app.schemas.routine import RoutineItem, RoutinePublic
+from app.schemas.task import TaskPublic
+from app.schemas.todo import TodoPublic
+
+NOW = datetime(2024, 6, 12, 9, 0, 0)
+
+
+def todo_list(count: int) -> list[TodoPublic]:
+    return [
+        TodoPublic(
+            id=index,
+            title=f"Todo {index}",
+            order=index,
+            target_date=NOW,
+            content="x" * 100,
+            created_at=NOW,
+            updated_at=NOW,
+            completed_at=None,
+        )
+        for index in range(count)
+    ]
+
+
+def task(todos: int, routines: int, habits: int) -> TaskPublic:
+    routine_list = [
+        RoutinePublic(
+            id=index,
+            title=f"Routine {index}",
+            start_time_minutes=480,
+            repeat_days=[0, 1, 2, 3, 4],
+            created_at=NOW,
+            updated_at=NOW,
+            routine_elements=[
+                RoutineItem(
+                    id=index * 10 + order,
+                    title=f"Element {order}",
+                    duration_minutes=10,
+                    created_at=NOW,
+                    updated_at=NOW,
+                    completed_at=NOW,
+                    completed_duration_seconds=600,
+                    is_skipped=False,
+                )
+                for order in range(6)
+            ],
+        )
+        for index in range(routines)
+    ]
+    habit_list = [
+        HabitWithLog(
+            id=index,
+            title=f"Habit {index}",
+            start_time_minutes=480,
+            end_time_minutes=1380,
+            repeat_time_minutes=30,
+            repeat_days=[0, 1, 2, 3, 4, 5, 6],
+            activated=True,
+            created_at=NOW,
+            updated_at=NOW,
+            near_weekday=0,
+            log_list=[
+                HabitLogPublic(id=day, completed_at=NOW - timedelta(day))
+                for day in range(10)
+            ],
+        )
+        for index in range(habits)
+    ]
+
+    return TaskPublic(
+        todo_list=todo_list(todos),
+        routine_list=routine_list,
+        habit_list=habit_list,
+    )
+
+
+async def response_model_path(field, content) -> bytes:
+    value = await serialize_response(
+        field=field, response_content=content, is_coroutine=True
+    )
+    return JSONResponse(value).body
+
+
+async def fast_path(field, content) -> bytes:
+    return FastJSONResponse(content).body
+
+
+async def measure(render, field, content, number: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(number):
+            await render(field, content)
+        best = min(best, time.perf_counter() - started)
+
+    return best / number
+
+
+async def run(number: int):
+    payloads = [
+        ("todos x100", List[TodoPublic], todo_list(100)),
+        ("task", TaskPublic, task(todos=30, routines=10, habits=10)),
+    ]
+
+    for name, model, content in payloads:
+        field = create_response_field(name="response", type_=model)
+        body = await response_model_path(field, content)
+        assert body == await fast_path(field, content)
+
+        for label, render in [
+            ("response_model", response_model_path),
+            ("FastJSONResponse", fast_path),
+        ]:
+            seconds = await measure(render, field, content, number)
+            print(
+                f"{name:>10} {label:>16}: {seconds * 1e6:9.1f} us/request, "
+                f"{len(body)} bytes"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.number))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,374 +1,423 @@
+"""
+테스트 DB 를 대량의 mock 데이터로 채운다.
+
+사용자를 고정 크기 파티션으로 나눠 프로세스 풀에서 병렬로 생성하고,
+각 파티션은 자기 연결에서 COPY FROM STDIN 으로 행을 바로 흘려보낸다.
+같은 --seed 와 --scale 이면 워커 수와 관계없이 같은 데이터가 만들어진다.
+
+    python mock/create-mock.py --scale 1 --seed 42 --workers 8
+
+COPY 는 원본 테이블만 채운다. habit_stats 와 routine_daily_summary 는 로그에서
+계산되는 파생 테이블이므로, 넣은 뒤에 TSK_DB_URL 을 같은 DB 로 두고 작업을
+돌려 다시 만든다.
+
+    TSK_DB_URL=... JWT_SECRET_KEY=... python -m app.jobs.backfill_habit_stats
+    TSK_DB_URL=... JWT_SECRET_KEY=... \
+        python -m app.jobs.rebuild_routine_daily_summary
+"""
+import argparse
 import os
-import psycopg2
-from psycopg2 import sql
-import csv
 import random
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 
-# 요일을 나타내는 숫자 리스트 (0: 월, 1: 화, ..., 6: 일)
-WEEK_DAYS = ["0", "1", "2", "3", "4", "5", "6"]
+import psycopg2
+from passlib.context import CryptContext
+from psycopg2 import sql
 
+# scale 1 의 사용자 수와 사용자 한 명이 가질 수 있는 최대 개수
+USERS_PER_SCALE = 10000
+PARTITION_USERS = 1000
+MAX_TODOS = 40
+MAX_HABITS = 8
+MAX_ROUTINES = 4
+MAX_ROUTINE_ELEMENTS = 6
+LOG_DAYS = 90
+
+MOCK_PASSWORD = "mock-password"
+BASE_TIME = datetime(2024, 1, 1, 9, 0, 0)
+# created_at, updated_at 은 NOT NULL 이고 서버 기본값이 없어 직접 채운다.
+# 같은 시드면 같은 데이터가 나오도록 현재 시각 대신 고정값을 쓴다.
+CREATED_AT = BASE_TIME.strftime("%Y-%m-%d %H:%M:%S")
 
-# 랜덤한 요일 문자열을 생성하는 함수
-def generate_random_days():
-    num_days = random.randint(1, 7)  # 1~7개의 요일을 선택
-    random_days = random.sample(WEEK_DAYS, num_days)
-    random_days.sort()  # 요일이 순서대로 정렬되도록
-    return "".join(random_days)  # 예: '012' -> 월, 화, 수
+# 요일을 나타내는 숫자 리스트 (0: 월, 1: 화, ..., 6: 일)
+WEEK_DAYS = "0123456"
+
+# 부모 테이블부터 넣어야 외래 키가 맞는다
+TABLES = {
+    "user": ["id", "username", "password", "email", "nickname"],
+    "todo": [
+        "title",
+        "order",
+        "target_date",
+        "content",
+        "completed_at",
+        "user_id",
+        "created_at",
+        "updated_at",
+    ],
+    "habit": [
+        "id",
+        "title",
+        "start_time_minutes",
+        "end_time_minutes",
+        "repeat_days",
+        "repeat_time_minutes",
+        "activated",
+        "user_id",
+        "created_at",
+        "updated_at",
+    ],
+    "habit_log": ["completed_at", "habit_id"],
+    "routine": [
+        "id",
+        "title",
+        "start_time_minutes",
+        "repeat_days",
+        "user_id",
+        "created_at",
+        "updated_at",
+    ],
+    "routine_element": [
+        "id",
+        "title",
+        "order",
+        "duration_minutes",
+        "routine_id",
+        "user_id",
+        "created_at",
+        "updated_at",
+    ],
+    "routine_log": [
+        "duration_seconds",
+        "completed_at",
+        "is_skipped",
+        "routine_id",
+        "routine_element_id",
+    ],
+}
+ID_TABLES = ["user", "habit", "routine", "routine_element"]
 
 
 # 데이터베이스 연결 설정
 def connect_to_db():
     conn = psycopg2.connect(
-        dbname="taskie_test_db",
-        user="testuser",
-        password="testpass",
-        host="127.0.0.1",
-        port="9000",
+        dbname=os.environ.get("MOCK_DB_NAME", "taskie_test_db"),
+        user=os.environ.get("MOCK_DB_USER", "testuser"),
+        password=os.environ.get("MOCK_DB_PASSWORD", "testpass"),
+        host=os.environ.get("MOCK_DB_HOST", "127.0.0.1"),
+        port=os.environ.get("MOCK_DB_PORT", "9000"),
     )
     return conn
 
 
-# CSV 파일로 대량의 랜덤 데이터 생성
-def generate_csv_for_user(file_name, row_count):
-    with open(file_name, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(
-            [
-                "username",
-                "password",
-                "email",
-                "profile_image",
-                "nickname",
-            ]  # id 및 created_at 제외
-        )
+# 랜덤한 요일 문자열을 생성하는 함수 (예: '012' -> 월, 화, 수)
+def generate_random_days(rng):
+    return "".join(sorted(rng.sample(WEEK_DAYS, rng.randint(1, 7))))
 
-        for i in range(1, row_count + 1):
-            username = f"user_{i}"
-            password = f"pass_{i}"
-            email = f"user_{i}@example.com"
-            profile_image = f"profile_{i}.png"
-            nickname = f"nick_{i}"
-            writer.writerow(
-                [username, password, email, profile_image, nickname]
-            )
 
-    print(f"Generated {row_count} rows of data into {file_name}.")
-
-
-def generate_csv_for_habit(file_name, row_count, user_count):
-    with open(file_name, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(
-            [
-                "title",
-                "end_time_minutes",
-                "start_time_minutes",
-                "repeat_days",
-                "repeat_time_minutes",
-                "activated",
-                "user_id",
-                "created_at",
-                "updated_at",
-            ]  # id 및 created_at 제외
-        )
+# 사용자마다 id 칸을 최대 개수만큼 미리 잡아 두므로, 다른 파티션을 보지
+# 않고도 부모 id 를 계산할 수 있다
+def habit_id(bases, user_number, index):
+    return bases["habit"] + user_number * MAX_HABITS + index
 
-        for i in range(1, row_count + 1):
-            title = f"Habit {i}"
-            end_time_minutes = random.randint(0, 1440)
-            start_time_minutes = random.randint(0, 1440)
-            repeat_days = generate_random_days()  # 랜덤한 요일 생성
-            repeat_time_minutes = random.randint(0, 1440)
-            activated = random.choice([True, False])
-            user_id = random.randint(1, user_count)
-            created_at = (datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
-            updated_at = (datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
-            writer.writerow(
-                [
-                    title,
-                    end_time_minutes,
-                    start_time_minutes,
-                    repeat_days,
-                    repeat_time_minutes,
-                    activated,
-                    user_id,
-                    created_at,
-                    updated_at,
-                ]
-            )
 
-    print(f"Generated {row_count} rows of data into {file_name}.")
+def routine_id(bases, user_number, index):
+    return bases["routine"] + user_number * MAX_ROUTINES + index
 
 
-def generate_csv_for_habit_log(file_name, row_count, habit_count):
-    with open(file_name, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(["completed_at", "habit_id"])  # id 제외
-
-        for i in range(1, row_count + 1):
-            completed_at = (
-                datetime.now() - timedelta(days=random.randint(0, 365))
-            ).strftime("%Y-%m-%d %H:%M:%S")
-            habit_id = random.randint(1, habit_count)
-            writer.writerow([completed_at, habit_id])
+def routine_element_id(bases, user_number, routine_index, index):
+    return (
+        bases["routine_element"]
+        + (user_number * MAX_ROUTINES + routine_index) * MAX_ROUTINE_ELEMENTS
+        + index
+    )
 
-    print(f"Generated {row_count} rows of data into {file_name}.")
 
+# 사용자가 가진 습관, 루틴, 루틴 요소 개수. 테이블마다 다시 계산해도 같은
+# 값이 나오도록 사용자별 시드로 만든다.
+def user_shape(seed, user_number):
+    rng = random.Random(f"{seed}:shape:{user_number}")
+    habit_count = rng.randint(0, MAX_HABITS)
+    element_counts = [
+        rng.randint(1, MAX_ROUTINE_ELEMENTS)
+        for _ in range(rng.randint(0, MAX_ROUTINES))
+    ]
+    return habit_count, element_counts
+
+
+def timestamp(value):
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def generate_users(rng, context, user_number):
+    user_id = context["bases"]["user"] + user_number
+    yield [
+        user_id,
+        f"user_{user_id}",
+        context["password"],
+        f"user_{user_id}@example.com",
+        f"nick_{user_id}",
+    ]
+
+
+def generate_todos(rng, context, user_number):
+    user_id = context["bases"]["user"] + user_number
+    for order in range(rng.randint(0, MAX_TODOS)):
+        target_date = BASE_TIME + timedelta(days=rng.randint(0, LOG_DAYS))
+        completed = rng.random() < 0.4
+        yield [
+            f"Todo {order}",
+            order,
+            timestamp(target_date),
+            "x" * rng.randint(0, 200),
+            timestamp(target_date) if completed else None,
+            user_id,
+            CREATED_AT,
+            CREATED_AT,
+        ]
+
+
+def generate_habits(rng, context, user_number):
+    bases = context["bases"]
+    habit_count, _ = user_shape(context["seed"], user_number)
+    for index in range(habit_count):
+        start_time_minutes = rng.randint(0, 1200)
+        yield [
+            habit_id(bases, user_number, index),
+            f"Habit {index}",
+            start_time_minutes,
+            start_time_minutes + rng.randint(30, 240),
+            generate_random_days(rng),
+            rng.choice([30, 60, 120]),
+            rng.random() < 0.9,
+            bases["user"] + user_number,
+            CREATED_AT,
+            CREATED_AT,
+        ]
+
+
+def generate_habit_logs(rng, context, user_number):
+    bases = context["bases"]
+    habit_count, _ = user_shape(context["seed"], user_number)
+    for index in range(habit_count):
+        for day in range(LOG_DAYS):
+            if rng.random() < 0.5:
+                yield [
+                    timestamp(BASE_TIME + timedelta(days=day)),
+                    habit_id(bases, user_number, index),
+                ]
 
-def generate_csv_for_routine(file_name, row_count, user_count):
-    with open(file_name, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(
-            [
-                "title",
-                "start_time_minutes",
-                "repeat_days",
-                "user_id",
-                "created_at",
-                "updated_at",
-            ]  # id 및 created_at 제외
-        )
 
-        for i in range(1, row_count + 1):
-            title = f"Routine {i}"
-            start_time_minutes = random.randint(0, 1440)
-            repeat_days = generate_random_days()  # 랜덤한 요일 생성
-            user_id = random.randint(1, user_count)
-            created_at = (datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
-            updated_at = (datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
-            writer.writerow(
-                [
-                    title,
-                    start_time_minutes,
-                    repeat_days,
-                    user_id,
-                    created_at,
-                    updated_at,
+def generate_routines(rng, context, user_number):
+    bases = context["bases"]
+    _, element_counts = user_shape(context["seed"], user_number)
+    for index in range(len(element_counts)):
+        yield [
+            routine_id(bases, user_number, index),
+            f"Routine {index}",
+            rng.randint(0, 1400),
+            generate_random_days(rng),
+            bases["user"] + user_number,
+            CREATED_AT,
+            CREATED_AT,
+        ]
+
+
+def generate_routine_elements(rng, context, user_number):
+    bases = context["bases"]
+    _, element_counts = user_shape(context["seed"], user_number)
+    for routine_index, element_count in enumerate(element_counts):
+        for index in range(element_count):
+            yield [
+                routine_element_id(bases, user_number, routine_index, index),
+                f"Routine Element {index}",
+                index,
+                rng.randint(1, 120),
+                routine_id(bases, user_number, routine_index),
+                bases["user"] + user_number,
+                CREATED_AT,
+                CREATED_AT,
+            ]
+
+
+# 로그는 같은 루틴의 요소만 가리키고, 요소마다 하루에 한 건만 남긴다
+def generate_routine_logs(rng, context, user_number):
+    bases = context["bases"]
+    _, element_counts = user_shape(context["seed"], user_number)
+    for routine_index, element_count in enumerate(element_counts):
+        for day in range(LOG_DAYS):
+            if rng.random() < 0.5:
+                continue
+
+            completed_at = BASE_TIME + timedelta(days=day)
+            for index in range(element_count):
+                completed_at += timedelta(minutes=rng.randint(1, 30))
+                yield [
+                    rng.randint(30, 1800),
+                    timestamp(completed_at),
+                    rng.random() < 0.1,
+                    routine_id(bases, user_number, routine_index),
+                    routine_element_id(
+                        bases, user_number, routine_index, index
+                    ),
                 ]
-            )
 
-    print(f"Generated {row_count} rows of data into {file_name}.")
-
-
-def generate_csv_for_routine_element(
-    file_name, row_count, routine_count, user_count
-):
-    with open(file_name, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(
-            [
-                "title",
-                "order",
-                "duration_minutes",
-                "routine_id",
-                "created_at",
-                "updated_at",
-                "user_id",
-            ]  # id 및 created_at 제외
-        )
 
-        for i in range(1, row_count + 1):
-            title = f"Routine Element {i}"
-            order = random.randint(1, 10)
-            duration_minutes = random.randint(1, 120)
-            routine_id = random.randint(1, routine_count)
-            created_at = (datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
-            updated_at = (datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
-            user_id = random.randint(1, user_count)
-
-            writer.writerow(
-                [
-                    title,
-                    order,
-                    duration_minutes,
-                    routine_id,
-                    created_at,
-                    updated_at,
-                    user_id,
-                ]
-            )
+GENERATORS = {
+    "user": generate_users,
+    "todo": generate_todos,
+    "habit": generate_habits,
+    "habit_log": generate_habit_logs,
+    "routine": generate_routines,
+    "routine_element": generate_routine_elements,
+    "routine_log": generate_routine_logs,
+}
 
-    print(f"Generated {row_count} rows of data into {file_name}.")
 
+# COPY text 형식의 한 줄. 생성하는 값에는 탭, 줄바꿈, 역슬래시가 없다.
+def copy_line(row):
+    return (
+        "\t".join(r"\N" if value is None else str(value) for value in row)
+        + "\n"
+    )
 
-def prepare_file(file_name):
-    if os.path.exists(file_name):
-        os.remove(file_name)
-    print(f"Preparing file: {file_name}")
 
+# copy_expert 가 read() 로 당겨 가는 만큼만 행을 만들어 흘려보낸다
+class RowStream:
+    def __init__(self, rows):
+        self.rows = rows
+        self.buffer = b""
 
-def generate_csv_for_routine_log(
-    file_name, row_count, routine_count, routine_element_count
-):
-    prepare_file(file_name)
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = 1 << 16
 
-    with open(file_name, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(
-            [
-                "duration_seconds",
-                "completed_at",
-                "is_skipped",
-                "routine_id",
-                "routine_element_id",
-            ]  # id 제외
-        )
+        chunks = [self.buffer]
+        length = len(self.buffer)
+        for row in self.rows:
+            line = copy_line(row).encode()
+            chunks.append(line)
+            length += len(line)
+            if length >= size:
+                break
+
+        data = b"".join(chunks)
+        self.buffer = data[size:]
+        return data[:size]
 
-        for i in range(1, row_count + 1):
-            duration_seconds = random.randint(30, 3600)
-            completed_at = (
-                datetime.now() - timedelta(days=random.randint(0, 365))
-            ).strftime("%Y-%m-%d %H:%M:%S")
-            is_skipped = random.choice([True, False])
-            routine_id = random.randint(1, routine_count)
-            routine_element_id = random.randint(1, routine_element_count)
-            writer.writerow(
-                [
-                    duration_seconds,
-                    completed_at,
-                    is_skipped,
-                    routine_element_id,
-                    routine_id,
-                ]
-            )
 
-    print(f"Generated {row_count} rows of data into {file_name}.")
+def partition_rows(table, context, partition, user_numbers):
+    # 테이블과 파티션마다 난수열을 따로 두어 생성 순서와 무관하게 만든다
+    rng = random.Random(f"{context['seed']}:{table}:{partition}")
+    generate = GENERATORS[table]
+    for user_number in user_numbers:
+        yield from generate(rng, context, user_number)
 
 
-# PostgreSQL에 CSV 파일을 사용해 대량 데이터 삽입
-def copy_from_csv(conn, table_name, file_name, columns):
+def copy_rows(conn, table_name, columns, stream):
     cursor = conn.cursor()
-    with open(file_name, "r") as file:
-        cursor.copy_expert(
-            sql.SQL(
-                """
-            COPY {} ({}) FROM STDIN WITH CSV HEADER
-        """
-            ).format(
-                sql.Identifier(table_name),
-                sql.SQL(", ").join(map(sql.Identifier, columns)),
-            ),
-            file,
+    cursor.copy_expert(
+        sql.SQL("COPY {} ({}) FROM STDIN")
+        .format(
+            sql.Identifier(table_name),
+            sql.SQL(", ").join(map(sql.Identifier, columns)),
         )
-    conn.commit()
+        .as_string(conn),
+        stream,
+    )
     cursor.close()
 
 
-# 데이터베이스 테이블에 대량 데이터 삽입
-def insert_large_data():
+# 한 파티션의 모든 테이블을 한 트랜잭션으로 넣는다
+def insert_partition(context, partition, user_count):
+    start = partition * PARTITION_USERS
+    user_numbers = range(start, min(start + PARTITION_USERS, user_count))
+
     conn = connect_to_db()
+    try:
+        for table_name, columns in TABLES.items():
+            rows = partition_rows(table_name, context, partition, user_numbers)
+            copy_rows(conn, table_name, columns, RowStream(rows))
+        conn.commit()
+    finally:
+        conn.close()
 
-    # 각 테이블에 대한 CSV 파일 생성 및 데이터 삽입
-    user_count = 1000000
-    habit_count = 1000000
-    habit_log_count = 500000
-    routine_count = 5000000
-    routine_element_count = 200000
-    routine_element_log_count = 100000
-
-    # 사용자 데이터 생성 및 삽입
-    generate_csv_for_user("mock/user_data.csv", user_count)
-    copy_from_csv(
-        conn,
-        "user",
-        "mock/user_data.csv",
-        ["username", "password", "email", "profile_image", "nickname"],
-    )
+    return partition
 
-    # 습관 데이터 생성 및 삽입
-    generate_csv_for_habit("mock/habit_data.csv", habit_count, user_count)
-    copy_from_csv(
-        conn,
-        "habit",
-        "mock/habit_data.csv",
-        [
-            "title",
-            "end_time_minutes",
-            "start_time_minutes",
-            "repeat_days",
-            "repeat_time_minutes",
-            "activated",
-            "user_id",
-            "created_at",
-            "updated_at",
-        ],
-    )
 
-    # 습관 로그 데이터 생성 및 삽입
-    generate_csv_for_habit_log(
-        "mock/habit_log_data.csv", habit_log_count, habit_count
-    )
-    copy_from_csv(
-        conn,
-        "habit_log",
-        "mock/habit_log_data.csv",
-        ["completed_at", "habit_id"],
-    )
+# 기존 데이터 뒤에 이어 붙일 수 있도록 id 시작값을 정한다
+def id_bases(conn):
+    cursor = conn.cursor()
+    bases = {}
+    for table_name in ID_TABLES:
+        cursor.execute(
+            sql.SQL("SELECT coalesce(max(id), 0) + 1 FROM {}").format(
+                sql.Identifier(table_name)
+            )
+        )
+        bases[table_name] = cursor.fetchone()[0]
+    cursor.close()
+    return bases
 
-    # 루틴 데이터 생성 및 삽입
-    generate_csv_for_routine(
-        "mock/routine_data.csv", routine_count, user_count
-    )
-    copy_from_csv(
-        conn,
-        "routine",
-        "mock/routine_data.csv",
-        [
-            "title",
-            "start_time_minutes",
-            "repeat_days",
-            "user_id",
-            "created_at",
-            "updated_at",
-        ],
-    )
 
-    # 루틴 요소 데이터 생성 및 삽입
-    generate_csv_for_routine_element(
-        "mock/routine_element_data.csv",
-        routine_element_count,
-        routine_count,
-        user_count,
-    )
-    copy_from_csv(
-        conn,
-        "routine_element",
-        "mock/routine_element_data.csv",
-        [
-            "title",
-            "order",
-            "duration_minutes",
-            "routine_id",
-            "created_at",
-            "updated_at",
-            "user_id",
-        ],
-    )
+def reset_sequences(conn):
+    cursor = conn.cursor()
+    for table_name in ID_TABLES:
+        cursor.execute(
+            sql.SQL(
+                "SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+                "(SELECT max(id) FROM {}))"
+            ).format(sql.Identifier(table_name)),
+            [f'"{table_name}"'],
+        )
+    conn.commit()
+    cursor.close()
 
-    # 루틴 로그 데이터 생성 및 삽입
-    generate_csv_for_routine_log(
-        "mock/routine_log_data.csv",
-        routine_element_log_count,
-        routine_count,
-        routine_element_count,
-    )
-    copy_from_csv(
-        conn,
-        "routine_log",
-        "mock/routine_log_data.csv",
-        [
-            "duration_seconds",
-            "completed_at",
-            "is_skipped",
-            "routine_element_id",
-            "routine_id",
-        ],
+
+# 데이터베이스 테이블에 대량 데이터 삽입
+def insert_large_data(scale, seed, workers):
+    user_count = int(USERS_PER_SCALE * scale)
+    partitions = (user_count + PARTITION_USERS - 1) // PARTITION_USERS
+    # 해시는 비싸므로 한 번만 만들어 모든 사용자가 같이 쓴다
+    password = CryptContext(schemes=["bcrypt"]).hash(MOCK_PASSWORD)
+
+    conn = connect_to_db()
+    try:
+        context = {"seed": seed, "bases": id_bases(conn), "password": password}
+
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    insert_partition, context, partition, user_count
+                )
+                for partition in range(partitions)
+            ]
+            for future in futures:
+                partition = future.result()
+                print(f"Inserted partition {partition + 1}/{partitions}")
+
+        reset_sequences(conn)
+    finally:
+        conn.close()
+
+    print(
+        f"Inserted {user_count} users in "
+        f"{time.perf_counter() - started:.1f}s."
     )
 
-    # 연결 종료
-    conn.close()
-    print("Data inserted successfully.")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    insert_large_data(args.scale, args.seed, args.workers)
 
 
 if __name__ == "__main__":
-    insert_large_data()
+    main()
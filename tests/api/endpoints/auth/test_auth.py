@@ -1,5 +1,13 @@
+import anyio
+import pytest
+import time
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from sqlalchemy import text
 from sqlalchemy.orm import Session
+from app.api.dao.auth_dao import AuthDAO
+from app.api.errors import TOO_MANY_REQUESTS
+from app.core.auth import password_hasher
 from app.models.models import User
 
 from app.schemas.auth import (
@@ -111,6 +119,25 @@ def test_login_invalid_data(
     assert response.status_code == 401
 
 
+def test_login_password_hasher_saturated(
+    client: TestClient,
+    user_data: UserBase,
+    add_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+    data = dict(
+        username=add_user.username,
+        password=user_data.password,
+    )
+
+    response = client.post("/auth/login", json=data)
+
+    assert response.status_code == 429
+    assert response.json().get("error_type") == TOO_MANY_REQUESTS
+    assert response.headers.get("Retry-After") == "1"
+
+
 def test_logout(client: TestClient, add_user: User):
     response = client.post("/auth/logout")
 
@@ -183,3 +210,45 @@ def test_null_refresh(client: TestClient):
 
     assert response.status_code == 401
     assert response.cookies.get("refresh_token") is None
+
+
+@pytest.mark.anyio
+async def test_refresh_does_not_block_event_loop(
+    async_client: AsyncClient,
+    refresh_token: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    get_user_by_id = AuthDAO.get_user_by_id
+
+    async def slow_get_user_by_id(self: AuthDAO, id: int):
+        await self.db.execute(text("SELECT pg_sleep(0.2)"))
+        return await get_user_by_id(self, id)
+
+    monkeypatch.setattr(AuthDAO, "get_user_by_id", slow_get_user_by_id)
+
+    lags = []
+
+    async def measure_lag():
+        while True:
+            started_at = time.perf_counter()
+            await anyio.sleep(0.01)
+            lags.append(time.perf_counter() - started_at - 0.01)
+
+    async def refresh():
+        response = await async_client.post(
+            "/auth/refresh?include_user_info=true",
+            cookies={"refresh_token": refresh_token},
+        )
+        assert response.status_code == 200
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(measure_lag)
+
+        async with anyio.create_task_group() as refreshes:
+            for _ in range(4):
+                refreshes.start_soon(refresh)
+
+        tg.cancel_scope.cancel()
+
+    assert len(lags) > 10
+    assert max(lags) < 0.1
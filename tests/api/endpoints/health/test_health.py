@@ -5,3 +5,52 @@ def test_health_check(client: TestClient):
     response = client.get("/health/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+def test_pool_stats(client: TestClient):
+    response = client.get("/health/pool")
+    assert response.status_code == 200
+
+    response_data = response.json()
+    for name in ("sync", "async"):
+        assert response_data[name]["pool_size"] >= 1
+        assert response_data[name]["checked_out"] >= 0
+        assert "wait_seconds_max" in response_data[name]
+
+
+def test_cache_stats(client: TestClient):
+    response = client.get("/health/cache")
+    assert response.status_code == 200
+
+    response_data = response.json()
+    assert response_data["backend"] == "LRUCacheBackend"
+    assert response_data["hits"] == 0
+    assert response_data["misses"] == 0
+
+
+def test_metrics(client: TestClient):
+    client.get("/health/health")
+    client.get("/not-found")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(
+        "text/plain; version=0.0.4"
+    )
+
+    lines = response.text.splitlines()
+    assert (
+        'taskie_http_request_duration_seconds_count{method="GET",'
+        'route="/health/health",operation_id="health_check_health_health_get",'
+        'status="200"} 1'
+    ) in lines
+    assert (
+        'taskie_http_request_duration_seconds_bucket{method="GET",'
+        'route="unmatched",operation_id="",status="404",le="+Inf"} 1'
+    ) in lines
+    assert "taskie_http_requests_in_flight 1" in lines
+    assert any(
+        line.startswith('taskie_db_pool_size{engine="sync"} ')
+        for line in lines
+    )
+    assert 'taskie_cache_hits_total{cache="task"} 0' in lines
@@ -261,3 +261,48 @@ def test_achieve_habit(
     assert data["completed_at"] is not None
     assert data["id"] == 1
     assert habit.habit_id == 1
+
+
+def test_achieve_habit_updates_stats(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_habit_list: list[Habit],
+):
+    for _ in range(2):
+        client.post("/habits/achieve/1", headers=access_token_headers)
+
+    response = client.get("/habits/1/stats", headers=access_token_headers)
+
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["habit_id"] == 1
+    assert data["total_completions"] == 2
+    assert data["last_completed_date"] is not None
+
+
+def test_get_habit_stats_without_log(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_habit_list: list[Habit],
+):
+    response = client.get("/habits/2/stats", headers=access_token_headers)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "habit_id": 2,
+        "current_streak": 0,
+        "best_streak": 0,
+        "total_completions": 0,
+        "last_completed_date": None,
+    }
+
+
+def test_get_habit_stats_not_found(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_habit_list: list[Habit],
+):
+    response = client.get("/habits/100/stats", headers=access_token_headers)
+
+    assert response.status_code == 404
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def todo_ndjson() -> str:
+    rows = [
+        {"title": "todo 1", "order": 0, "target_date": "2024-07-24T09:00:00"},
+        {
+            "title": "todo 2",
+            "order": "first",
+            "target_date": "2024-07-24T09:00:00",
+        },
+        {
+            "title": "todo\t3",
+            "order": 1,
+            "target_date": "2024-07-25T09:00:00",
+            "content": "line 1\nline 2",
+        },
+    ]
+
+    return "\n".join(json.dumps(row) for row in rows) + "\nnot json\n"
+
+
+@pytest.fixture
+def habit_csv() -> str:
+    return (
+        "title,start_time_minutes,end_time_minutes,"
+        "repeat_time_minutes,repeat_days\n"
+        'habit 1,540,1260,60,"[2, 0, 1]"\n'
+        "habit 2,540,1260,60,[]\n"
+        'habit 3,600,1200,30,"[6]"\n'
+    )
+
+
+@pytest.fixture
+def routine_ndjson() -> str:
+    rows = [
+        {
+            "title": "morning",
+            "start_time_minutes": 420,
+            "repeat_days": [0, 1, 2, 3, 4],
+            "routine_elements": [
+                {"title": "water", "duration_minutes": 1},
+                {"title": "stretch", "duration_minutes": 10},
+            ],
+        },
+        {
+            "title": "evening",
+            "start_time_minutes": 1320,
+            "repeat_days": [5, 6],
+            "routine_elements": [{"title": "read", "duration_minutes": 30}],
+        },
+    ]
+
+    return "\n".join(json.dumps(row) for row in rows)
@@ -0,0 +1,126 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.models import Habit, Routine, RoutineElement, Todo, User
+from app.schemas.imports import ImportResult, ImportRowError
+
+
+def test_import_todos_ndjson(
+    client: TestClient,
+    session: Session,
+    add_user: User,
+    access_token_headers: dict[str, str],
+    todo_ndjson: str,
+):
+    response = client.post(
+        "/import/todos",
+        headers={
+            **access_token_headers,
+            "Content-Type": "application/x-ndjson",
+        },
+        content=todo_ndjson,
+    )
+
+    result = ImportResult(**response.json())
+    todos = session.query(Todo).order_by(Todo.id).all()
+
+    assert response.status_code == 200
+    assert result.imported == 2
+    assert result.failed == 2
+    assert result.errors == [
+        ImportRowError(
+            line=2, error_type="TYPE_ERROR_INTEGER", location="order"
+        ),
+        ImportRowError(line=4, error_type="INVALID_ROW_FORMAT"),
+    ]
+    assert [todo.title for todo in todos] == ["todo 1", "todo\t3"]
+    assert todos[1].content == "line 1\nline 2"
+    assert todos[0].content is None
+    assert all(todo.user_id == add_user.id for todo in todos)
+
+
+def test_import_habits_csv(
+    client: TestClient,
+    session: Session,
+    add_user: User,
+    access_token_headers: dict[str, str],
+    habit_csv: str,
+):
+    response = client.post(
+        "/import/habits",
+        headers={**access_token_headers, "Content-Type": "text/csv"},
+        content=habit_csv,
+    )
+
+    result = ImportResult(**response.json())
+    habits = session.query(Habit).order_by(Habit.id).all()
+
+    assert response.status_code == 200
+    assert result.imported == 2
+    assert result.errors == [
+        ImportRowError(
+            line=3,
+            error_type="VALUE_MUST_NOT_BE_EMPTY",
+            location="repeat_days",
+        )
+    ]
+    assert [habit.repeat_days for habit in habits] == ["012", "6"]
+    assert all(habit.activated for habit in habits)
+    assert all(habit.user_id == add_user.id for habit in habits)
+
+
+def test_import_routines_ndjson(
+    client: TestClient,
+    session: Session,
+    add_user: User,
+    access_token_headers: dict[str, str],
+    routine_ndjson: str,
+):
+    response = client.post(
+        "/import/routines",
+        headers={
+            **access_token_headers,
+            "Content-Type": "application/x-ndjson",
+        },
+        content=routine_ndjson,
+    )
+
+    routines = session.query(Routine).order_by(Routine.id).all()
+    elements = (
+        session.query(RoutineElement)
+        .order_by(RoutineElement.routine_id, RoutineElement.order)
+        .all()
+    )
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 2
+    assert [routine.title for routine in routines] == ["morning", "evening"]
+    assert [
+        (element.routine_id, element.order, element.title)
+        for element in elements
+    ] == [
+        (routines[0].id, 0, "water"),
+        (routines[0].id, 1, "stretch"),
+        (routines[1].id, 0, "read"),
+    ]
+    assert all(element.user_id == add_user.id for element in elements)
+
+    response = client.get(
+        f"/routines/{routines[0].id}", headers=access_token_headers
+    )
+
+    assert response.status_code == 200
+
+
+def test_import_unsupported_media_type(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+):
+    response = client.post(
+        "/import/todos",
+        headers={**access_token_headers, "Content-Type": "application/json"},
+        content="[]",
+    )
+
+    assert response.status_code == 415
+    assert response.json()["error_type"] == "UNSUPPORTED_MEDIA_TYPE"
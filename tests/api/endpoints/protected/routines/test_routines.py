@@ -1,18 +1,25 @@
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timedelta
 from pytz import timezone
 from typing import List
 from fastapi.testclient import TestClient
-from sqlalchemy import func
+from sqlalchemy import event, func
 from sqlalchemy.orm import Session
+from app.jobs.purge_routine_elements import purge_routine_elements
+from app.jobs.rebuild_routine_daily_summary import (
+    rebuild_routine_daily_summary,
+)
 from app.models.models import Routine, RoutineElement, RoutineLog
 
 from app.schemas.routine import (
     RoutineCreateInput,
+    RoutineItemUpdate,
     RoutinePublic,
     RoutineLogBase,
     RoutineLogPutInput,
     RoutineUpdateInput,
 )
+from tests.conftest import engine
 
 
 def test_create_routine(
@@ -94,6 +101,7 @@ def test_delete_routine_valid_id(
     assert response.status_code == 204
 
     assert session.query(Routine).first() is None
+    assert session.query(RoutineElement).first() is None
 
 
 def test_delete_routine_invalid_id(
@@ -184,6 +192,81 @@ def test_update_routine_only_elements_data(
     )
 
 
+def test_update_routine_elements_keeps_empty_values(
+    client: TestClient,
+    add_routine: RoutinePublic,
+    access_token_headers: dict[str, str],
+):
+    elements = add_routine.routine_elements
+    update_data = RoutineUpdateInput(
+        routine_elements=[
+            RoutineItemUpdate(id=elements[0].id, title="", duration_minutes=0),
+            RoutineItemUpdate(
+                id=elements[1].id, title="new title", duration_minutes=5
+            ),
+        ]
+    )
+
+    response = client.put(
+        "/routines/1",
+        headers=access_token_headers,
+        json=update_data.dict(),
+    )
+
+    response_data = RoutinePublic(**response.json())
+
+    assert response.status_code == 200
+    assert response_data.routine_elements[0].title == elements[0].title
+    assert (
+        response_data.routine_elements[0].duration_minutes
+        == elements[0].duration_minutes
+    )
+    assert response_data.routine_elements[1].title == "new title"
+    assert response_data.routine_elements[1].duration_minutes == 5
+
+
+def test_update_routine_elements_bulk_sync(
+    client: TestClient,
+    session: Session,
+    add_routine: RoutinePublic,
+    update_routine_only_elements_data: RoutineUpdateInput,
+    access_token_headers: dict[str, str],
+):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if "routine_element" in statement:
+            statements.append(statement.lstrip().split()[0])
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.put(
+            "/routines/1",
+            headers=access_token_headers,
+            json=update_routine_only_elements_data.dict(),
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    response_data = RoutinePublic(**response.json())
+    routine_elements = (
+        session.query(RoutineElement)
+        .filter(
+            RoutineElement.routine_id == 1,
+            RoutineElement.deleted_at.is_(None),
+        )
+        .order_by(RoutineElement.order)
+        .all()
+    )
+
+    assert response.status_code == 200
+    assert statements == ["SELECT", "UPDATE", "INSERT", "UPDATE"]
+    assert [item.id for item in response_data.routine_elements] == [
+        element.id for element in routine_elements
+    ]
+    assert [element.order for element in routine_elements] == [0, 1, 2, 3]
+
+
 def test_update_routine_only_routine_data(
     client: TestClient,
     add_routine: RoutinePublic,
@@ -240,6 +323,85 @@ def test_update_routine_empty_routine_elements(
     assert len(response_data.routine_elements) == 0
 
 
+def test_update_routine_soft_deletes_removed_elements(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    add_routine_list_with_log: List[Routine],
+):
+    log_count = session.query(RoutineLog).count()
+    body = RoutineUpdateInput(
+        routine_elements=[
+            RoutineItemUpdate(id=1, title="남은 요소 1", duration_minutes=10),
+            RoutineItemUpdate(id=2, title="남은 요소 2", duration_minutes=10),
+        ]
+    ).dict()
+
+    response = client.put(
+        "/routines/1", headers=access_token_headers, json=body
+    )
+    deleted_ids = [
+        element.id
+        for element in session.query(RoutineElement).filter(
+            RoutineElement.deleted_at.isnot(None)
+        )
+    ]
+
+    element_ids = [item["id"] for item in response.json()["routine_elements"]]
+
+    assert response.status_code == 200
+    assert element_ids == [1, 2]
+    assert sorted(deleted_ids) == [3, 4]
+    assert session.query(RoutineLog).count() == log_count
+
+    response = client.get("/routines/1", headers=access_token_headers)
+    element_ids = [item["id"] for item in response.json()["routine_elements"]]
+
+    assert element_ids == [1, 2]
+
+    log_body = RoutineLogPutInput(
+        logs=[RoutineLogBase(routine_item_id=3, duration_seconds=60)]
+    ).dict()
+    response = client.put(
+        "routines/log/1", headers=access_token_headers, json=log_body
+    )
+
+    assert response.status_code == 404
+
+
+def test_purge_routine_elements(
+    session: Session,
+    add_routine_list_with_log: List[Routine],
+):
+    element_without_log = RoutineElement(
+        routine_id=1,
+        user_id=add_routine_list_with_log[0].user_id,
+        title="test_routine_element",
+        duration_minutes=10,
+        order=5,
+        deleted_at=datetime(2024, 1, 1),
+    )
+    session.add(element_without_log)
+    session.query(RoutineElement).filter(RoutineElement.id.in_([3, 4])).update(
+        {"deleted_at": datetime(2024, 1, 1)}
+    )
+    session.query(RoutineElement).filter(RoutineElement.id == 5).update(
+        {"deleted_at": func.now()}
+    )
+    session.commit()
+    element_without_log_id = element_without_log.id
+    log_count = session.query(RoutineLog).count()
+
+    purged = purge_routine_elements(session, retention_days=30, batch_size=1)
+
+    remaining_ids = [element.id for element in session.query(RoutineElement)]
+
+    assert purged == 1
+    assert element_without_log_id not in remaining_ids
+    assert all(element_id in remaining_ids for element_id in [3, 4, 5])
+    assert session.query(RoutineLog).count() == log_count
+
+
 def is_timestamp_on_today(timestamp) -> bool:
     today_date = datetime.now(timezone("Asia/Seoul")).date()
 
@@ -302,20 +464,191 @@ def test_put_routine_log(
     )
 
 
+def test_put_routine_log_upserts(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    add_routine: RoutinePublic,
+    routine_log_data: List[RoutineLogBase],
+):
+    body = RoutineLogPutInput(logs=routine_log_data).dict()
+    client.put("routines/log/1", headers=access_token_headers, json=body)
+
+    body = RoutineLogPutInput(
+        logs=[
+            RoutineLogBase(routine_item_id=1, duration_seconds=60),
+            RoutineLogBase(routine_item_id=1, duration_seconds=90),
+        ]
+    ).dict()
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.lstrip().startswith("INSERT INTO routine_log"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.put(
+            "routines/log/1", headers=access_token_headers, json=body
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert response.status_code == 204
+    assert len(statements) == 1
+
+    logs = (
+        session.query(RoutineLog)
+        .filter(RoutineLog.routine_element_id == 1)
+        .all()
+    )
+
+    assert len(logs) == 1
+    assert logs[0].duration_seconds == 90
+    assert session.query(RoutineLog).count() == 4
+
+
+def test_put_routine_log_invalid_element(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    add_routine_list_with_log: List[Routine],
+):
+    log_count = session.query(RoutineLog).count()
+    body = RoutineLogPutInput(
+        logs=[
+            RoutineLogBase(routine_item_id=1, duration_seconds=60),
+            RoutineLogBase(routine_item_id=5, duration_seconds=60),
+        ]
+    ).dict()
+
+    response = client.put(
+        "routines/log/1", headers=access_token_headers, json=body
+    )
+
+    assert response.status_code == 404
+    assert session.query(RoutineLog).count() == log_count
+
+
 def test_get_routine_list(
     client: TestClient,
     access_token_headers: dict[str, str],
     add_routine_list_with_log: list[RoutinePublic],
     target_date: datetime,
+    query_budget,
 ):
-    response = client.get(
-        "/routines/",
-        headers=access_token_headers,
-    )
+    # 루틴, 요소(selectin), 기록을 각각 한 번씩만 읽는다
+    with query_budget(3):
+        response = client.get(
+            "/routines/",
+            headers=access_token_headers,
+        )
 
     assert response.status_code == 200
+    assert 'desc="queries=3 ' in response.headers["server-timing"]
 
     routine_list = response.json()
 
     assert len(routine_list) == 4
     assert len(routine_list[0].get("routine_elements")) == 4
+
+
+def test_put_routine_log_updates_history(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_routine: RoutinePublic,
+    routine_log_data: List[RoutineLogBase],
+):
+    body = RoutineLogPutInput(logs=routine_log_data).dict()
+    for _ in range(2):
+        client.put("routines/log/1", headers=access_token_headers, json=body)
+
+    today = datetime.now(timezone("Asia/Seoul")).date()
+    response = client.get(
+        "routines/1/history",
+        headers=access_token_headers,
+        params={"from": str(today - timedelta(days=89)), "to": str(today)},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "log_date": str(today),
+            "log_count": 4,
+            "completed_count": 3,
+            "skipped_count": 1,
+            "total_duration_seconds": 95 * 60,
+        }
+    ]
+
+
+def test_get_routine_history_invalid_range(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_routine: RoutinePublic,
+):
+    response = client.get(
+        "routines/1/history",
+        headers=access_token_headers,
+        params={"from": "2024-07-02", "to": "2024-07-01"},
+    )
+
+    assert response.status_code == 400
+
+    response = client.get(
+        "routines/1/history",
+        headers=access_token_headers,
+        params={"from": "2023-01-01", "to": "2024-07-01"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_get_routine_history_invalid_id(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_routine: RoutinePublic,
+):
+    response = client.get(
+        "routines/100/history",
+        headers=access_token_headers,
+        params={"from": "2024-07-01", "to": "2024-07-31"},
+    )
+
+    assert response.status_code == 404
+
+
+def test_rebuild_routine_daily_summary(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    add_routine_list_with_log: List[Routine],
+):
+    rebuild_routine_daily_summary(session)
+
+    expected = Counter()
+    for log in session.query(RoutineLog).filter(RoutineLog.routine_id == 2):
+        log_date = str(log.completed_at.date())
+        expected[(log_date, "log_count")] += 1
+        expected[(log_date, "skipped_count")] += log.is_skipped
+        expected[(log_date, "total_duration_seconds")] += log.duration_seconds
+
+    response = client.get(
+        "routines/2/history",
+        headers=access_token_headers,
+        params={"from": "2024-07-01", "to": "2024-07-31"},
+    )
+
+    history = response.json()
+
+    assert response.status_code == 200
+    assert len(history) == 2
+    for summary in history:
+        log_date = summary["log_date"]
+        assert summary["log_count"] == expected[(log_date, "log_count")]
+        assert (
+            summary["skipped_count"] == expected[(log_date, "skipped_count")]
+        )
+        assert summary["total_duration_seconds"] == (
+            expected[(log_date, "total_duration_seconds")]
+        )
@@ -386,75 +386,51 @@ def add_routine_list_with_log(
         ),
         RoutineLog(
             routine_id=2,
-            routine_element_id=1,
-            completed_at=target_date,
-            duration_seconds=5 * 60,
-        ),
-        RoutineLog(
-            routine_id=2,
-            routine_element_id=2,
-            completed_at=target_date,
-            duration_seconds=5 * 60,
-        ),
-        RoutineLog(
-            routine_id=2,
-            routine_element_id=3,
-            completed_at=target_date,
-            duration_seconds=5 * 60,
-        ),
-        RoutineLog(
-            routine_id=2,
-            routine_element_id=4,
-            completed_at=target_date,
-            duration_seconds=5 * 60,
-        ),
-        RoutineLog(
-            routine_id=2,
-            routine_element_id=1,
+            routine_element_id=5,
             completed_at=target_date,
             duration_seconds=15 * 60,
         ),
         RoutineLog(
             routine_id=2,
-            routine_element_id=2,
+            routine_element_id=6,
             completed_at=target_date,
             duration_seconds=15 * 60,
         ),
         RoutineLog(
             routine_id=2,
-            routine_element_id=3,
+            routine_element_id=7,
             completed_at=target_date,
             duration_seconds=15 * 60,
             is_skipped=True,
         ),
         RoutineLog(
             routine_id=2,
-            routine_element_id=4,
+            routine_element_id=8,
             completed_at=target_date,
             duration_seconds=15 * 60,
         ),
         RoutineLog(
             routine_id=2,
-            routine_element_id=1,
+            routine_element_id=5,
             completed_at=non_target_date,
             duration_seconds=15 * 60,
         ),
         RoutineLog(
             routine_id=2,
-            routine_element_id=2,
+            routine_element_id=6,
             completed_at=non_target_date,
             duration_seconds=15 * 60,
         ),
         RoutineLog(
             routine_id=2,
-            routine_element_id=3,
+            routine_element_id=7,
             completed_at=non_target_date,
             duration_seconds=15 * 60,
             is_skipped=True,
         ),
         RoutineLog(
             routine_id=2,
-            routine_element_id=4,
+            routine_element_id=8,
             completed_at=non_target_date,
             duration_seconds=15 * 60,
         ),
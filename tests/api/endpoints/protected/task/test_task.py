@@ -1,6 +1,9 @@
 from datetime import datetime
+import pytest
 from fastapi.testclient import TestClient
 
+from app.api.controllers import task
+
 from app.models.models import Todo
 from app.schemas.habit import HabitWithLog
 from app.schemas.routine import RoutinePublic
@@ -66,14 +69,16 @@ def test_get_all_daily_task(
     add_habit_list_with_log: list[HabitWithLog],
     add_routine_list_with_log: list[RoutinePublic],
     target_date: datetime,
+    query_budget,
 ):
     params = dict(date=target_date.strftime("%Y-%m-%d"))
 
-    response = client.get(
-        "/task",
-        params=params,
-        headers=access_token_headers,
-    )
+    with query_budget(1):
+        response = client.get(
+            "/task",
+            params=params,
+            headers=access_token_headers,
+        )
 
     assert response.status_code == 200
 
@@ -138,3 +143,76 @@ def test_get_uncompleted_todo_task(
         assert todo["completed_at"] is not None
         if isinstance(todo["completed_at"], str):
             assert todo["completed_at"].strip() != ""
+
+
+@pytest.mark.parametrize("date", ["2024-07-24", "2024-07-27", "2024-07-30"])
+def test_get_all_daily_task_aggregated_matches(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list_with_previous_todo: list[Todo],
+    add_habit_list_with_log: list[HabitWithLog],
+    add_routine_list_with_log: list[RoutinePublic],
+    monkeypatch: pytest.MonkeyPatch,
+    date: str,
+):
+    params = dict(date=date)
+    monkeypatch.setattr(task, "task_cache", None)
+
+    monkeypatch.setattr(task, "TASK_AGGREGATED_QUERY", False)
+    response = client.get("/task", params=params, headers=access_token_headers)
+
+    monkeypatch.setattr(task, "TASK_AGGREGATED_QUERY", True)
+    aggregated_response = client.get(
+        "/task", params=params, headers=access_token_headers
+    )
+
+    assert response.status_code == 200
+    assert aggregated_response.status_code == 200
+    assert aggregated_response.content == response.content
+
+
+def test_get_all_daily_task_cached(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list: list[Todo],
+    target_date: datetime,
+):
+    params = dict(date=target_date.strftime("%Y-%m-%d"))
+
+    response = client.get("/task", params=params, headers=access_token_headers)
+    cached_response = client.get(
+        "/task", params=params, headers=access_token_headers
+    )
+
+    assert cached_response.status_code == 200
+    assert cached_response.content == response.content
+    assert task.task_cache.hits == 1
+    assert task.task_cache.misses == 1
+
+
+def test_get_all_daily_task_cache_invalidated(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list: list[Todo],
+    target_date: datetime,
+):
+    params = dict(date=target_date.strftime("%Y-%m-%d"))
+
+    response = client.get("/task", params=params, headers=access_token_headers)
+    assert len(response.json()["todo_list"]) == 5
+
+    client.post(
+        "/todos",
+        json=dict(
+            title="new_todo",
+            order=7,
+            target_date=target_date.isoformat(),
+        ),
+        headers=access_token_headers,
+    )
+
+    response = client.get("/task", params=params, headers=access_token_headers)
+
+    assert len(response.json()["todo_list"]) == 6
+    assert task.task_cache.hits == 0
+    assert task.task_cache.invalidations == 1
@@ -1,12 +1,17 @@
 from typing import List
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from app.api.errors import INVALID_CURSOR
 from app.models.models import Todo
 from app.schemas.todo import (
     TodoPublic,
+    TodoOrderUpdate,
     TodoOrderUpdateInput,
 )
+from tests.conftest import engine
 
 
 def test_get_todo(
@@ -145,19 +150,79 @@ def test_update_todo_list_order(
     )
 
 
+def test_update_todo_list_order_single_statement(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    add_todo_list: List[Todo],
+    todo_order_update_data: TodoOrderUpdateInput,
+):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.lstrip().startswith("UPDATE todo"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.put(
+            "/todos/order",
+            json=todo_order_update_data.dict(),
+            headers=access_token_headers,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert response.status_code == 204
+    assert len(statements) == 1
+
+
+def test_update_todo_list_order_missing_todo(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    add_todo_list: List[Todo],
+):
+    data = TodoOrderUpdateInput(
+        todo_list=[
+            TodoOrderUpdate(id=add_todo_list[0].id, order=3),
+            TodoOrderUpdate(id=999, order=1),
+        ]
+    )
+
+    response = client.put(
+        "/todos/order",
+        json=data.dict(),
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 404
+
+    session.expire_all()
+    assert (
+        session.query(Todo)
+        .filter(Todo.id == add_todo_list[0].id)
+        .first()
+        .order
+        == 1
+    )
+
+
 def test_get_todo_list__valid_page_and_offset__1_page(
     client: TestClient,
     session: Session,
     access_token_headers: dict[str, str],
     add_todo_list_with_date: List[Todo],
+    query_budget,
 ):
     params = dict(limit=3, offset=0, completed=False)
 
-    response = client.get(
-        "/todos",
-        params=params,
-        headers=access_token_headers,
-    )
+    with query_budget(1):
+        response = client.get(
+            "/todos",
+            params=params,
+            headers=access_token_headers,
+        )
 
     assert response.status_code == 200
 
@@ -243,3 +308,115 @@ def test_get_todo_list__complete(
     assert len(response_data) == 2
     assert response_data[0].get("id") == 9
     assert response_data[1].get("id") == 8
+
+
+@pytest.mark.parametrize(
+    "completed,expected_ids",
+    [
+        (False, [[1, 2, 3], [4, 5, 6], [7]]),
+        (True, [[9], [8]]),
+    ],
+)
+def test_get_todo_list__cursor(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list_with_date: List[Todo],
+    completed: bool,
+    expected_ids: List[List[int]],
+):
+    limit = len(expected_ids[0])
+    params = dict(limit=limit, completed=completed)
+    pages = []
+
+    while True:
+        response = client.get(
+            "/todos", params=params, headers=access_token_headers
+        )
+        assert response.status_code == 200
+
+        pages.append([todo.get("id") for todo in response.json()])
+
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params["cursor"] = next_cursor
+
+    assert [page for page in pages if page] == expected_ids
+
+
+@pytest.mark.parametrize("limit", [0, 101])
+def test_get_todo_list__invalid_limit(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list_with_date: List[Todo],
+    limit: int,
+):
+    params = dict(limit=limit, completed=False)
+
+    response = client.get(
+        "/todos", params=params, headers=access_token_headers
+    )
+
+    assert response.status_code == 422
+
+
+def test_get_todo_list__empty_last_page(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list_with_date: List[Todo],
+):
+    params = dict(limit=2, completed=True)
+
+    response = client.get(
+        "/todos", params=params, headers=access_token_headers
+    )
+    assert len(response.json()) == 2
+
+    params["cursor"] = response.headers.get("X-Next-Cursor")
+    response = client.get(
+        "/todos", params=params, headers=access_token_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "e30", "WzEsMl0"])
+def test_get_todo_list__invalid_cursor(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list_with_date: List[Todo],
+    cursor: str,
+):
+    params = dict(limit=3, completed=False, cursor=cursor)
+
+    response = client.get(
+        "/todos", params=params, headers=access_token_headers
+    )
+
+    assert response.status_code == 422
+    assert response.json().get("error_type") == INVALID_CURSOR
+
+
+def test_get_todo_list__cursor_of_other_ordering(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list_with_date: List[Todo],
+):
+    params = dict(limit=1, completed=True)
+
+    response = client.get(
+        "/todos", params=params, headers=access_token_headers
+    )
+    params = dict(
+        limit=1,
+        completed=False,
+        cursor=response.headers.get("X-Next-Cursor"),
+    )
+    response = client.get(
+        "/todos", params=params, headers=access_token_headers
+    )
+
+    assert response.status_code == 422
+    assert response.json().get("error_type") == INVALID_CURSOR
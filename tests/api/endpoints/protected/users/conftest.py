@@ -1 +1,66 @@
 import pytest
+from sqlalchemy.orm import Session
+
+from app.models.models import (
+    Habit,
+    HabitLog,
+    Routine,
+    RoutineElement,
+    RoutineLog,
+    Todo,
+    User,
+)
+
+
+@pytest.fixture
+def add_export_data(session: Session, add_user: User) -> User:
+    other_user = User(
+        username="other", password="other123", email="other@test.com"
+    )
+    session.add(other_user)
+    session.commit()
+
+    for user in [add_user, other_user]:
+        session.add_all(
+            [
+                Todo(title=f"todo {index}", order=index, user_id=user.id)
+                for index in range(3)
+            ]
+        )
+        habit = Habit(
+            title="habit",
+            start_time_minutes=540,
+            end_time_minutes=1260,
+            repeat_days="0123456",
+            repeat_time_minutes=60,
+            user_id=user.id,
+        )
+        routine = Routine(
+            title="routine",
+            start_time_minutes=540,
+            repeat_days="0123456",
+            user_id=user.id,
+        )
+        session.add_all([habit, routine])
+        session.commit()
+
+        element = RoutineElement(
+            title="element",
+            order=0,
+            duration_minutes=10,
+            routine_id=routine.id,
+            user_id=user.id,
+        )
+        session.add_all([element, HabitLog(habit_id=habit.id)])
+        session.commit()
+
+        session.add(
+            RoutineLog(
+                routine_id=routine.id,
+                routine_element_id=element.id,
+                duration_seconds=600,
+            )
+        )
+        session.commit()
+
+    return add_user
@@ -1,3 +1,7 @@
+import gzip
+import json
+from collections import Counter
+
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from app.models.models import User
@@ -46,8 +50,56 @@ def test_update_me(
     assert response.status_code == 200
     assert response.json() == excepted_output.dict()
 
+    session.expire_all()
     user = session.query(User).filter_by(username=data.username).first()
 
     assert user.username == excepted_output.username
     assert user.email == excepted_output.email
     assert user.nickname == excepted_output.nickname
+
+
+def test_export_me(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_export_data: User,
+):
+    response = client.get("/users/me/export", headers=access_token_headers)
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    counts = Counter(record["type"] for record in records)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert counts == {
+        "user": 1,
+        "todo": 3,
+        "habit": 1,
+        "habit_log": 1,
+        "routine": 1,
+        "routine_element": 1,
+        "routine_log": 1,
+    }
+    assert records[0]["data"]["id"] == add_export_data.id
+    assert "password" not in records[0]["data"]
+    assert all(
+        record["data"]["user_id"] == add_export_data.id
+        for record in records
+        if "user_id" in record["data"]
+    )
+
+
+def test_export_me_gzip(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_export_data: User,
+):
+    plain = client.get("/users/me/export", headers=access_token_headers)
+    response = client.get(
+        "/users/me/export",
+        headers=access_token_headers,
+        params={"gzip": True},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert gzip.decompress(response.content) == plain.content
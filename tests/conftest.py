@@ -1,17 +1,25 @@
+from contextlib import contextmanager
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from passlib.context import CryptContext
 
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 
-from app.core.config import DATABASE_URI
+from app.core.config import ASYNC_DATABASE_URI, DATABASE_URI
 from app.schemas.auth import UserBase
-from app.database.db import Base, get_db
+from app.database.db import Base, get_async_db, get_db
+from app.database.query_stats import listen_query_stats
 from app.models.models import User
-from app.core.auth import create_access_token
+from app.core.auth import access_token_cache, create_access_token
+from app.core.cache import task_cache
+from app.core.metrics import request_metrics
 from app.main import app as client_app
 
 engine = create_engine(DATABASE_URI, echo=True)
@@ -19,13 +27,36 @@ TestingSessionLocal = sessionmaker(
     bind=engine, autocommit=False, autoflush=False
 )
 
+# TestClient는 블록마다 새 이벤트 루프를 쓰므로 커넥션을 재사용하지 않는다.
+async_engine = create_async_engine(ASYNC_DATABASE_URI, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+listen_query_stats(engine)
+listen_query_stats(async_engine.sync_engine)
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+async def get_async_db_override():
+    async with TestingAsyncSessionLocal() as async_session:
+        yield async_session
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
 @pytest.fixture(autouse=True)
 def app():
     Base.metadata.drop_all(engine)
     Base.metadata.create_all(engine)
+    if task_cache is not None:
+        task_cache.clear()
+    access_token_cache.clear()
+    request_metrics.clear()
 
     yield client_app
 
@@ -50,11 +81,20 @@ def client(app: FastAPI, session: Session):
             pass
 
     app.dependency_overrides[get_db] = get_db_override
+    app.dependency_overrides[get_async_db] = get_async_db_override
 
     with TestClient(app) as client:
         yield client
 
 
+@pytest.fixture
+async def async_client(app: FastAPI):
+    app.dependency_overrides[get_async_db] = get_async_db_override
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+
+
 @pytest.fixture
 def user_data() -> UserBase:
     user = UserBase(
@@ -91,3 +131,31 @@ def access_token(add_user: User) -> str:
 def access_token_headers(access_token: str) -> dict[str, str]:
     headers = {"Authorization": f"Bearer {access_token}"}
     return headers
+
+
+@pytest.fixture
+def query_budget():
+    # 블록 안에서 실행된 쿼리가 max_queries 를 넘으면 실패해 N+1 회귀를 잡는다
+    @contextmanager
+    def budget(max_queries: int):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engines = [engine, async_engine.sync_engine]
+        for target in engines:
+            event.listen(
+                target, "before_cursor_execute", before_cursor_execute
+            )
+        try:
+            yield statements
+        finally:
+            for target in engines:
+                event.remove(
+                    target, "before_cursor_execute", before_cursor_execute
+                )
+
+        assert len(statements) <= max_queries, "\n\n".join(statements)
+
+    return budget
@@ -0,0 +1,76 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.core.cache import LRUCacheBackend, RedisCacheBackend, TaskCache
+
+
+def test_lru_cache_backend_evicts_least_recently_used():
+    backend = LRUCacheBackend(max_size=2)
+
+    backend.set("a", b"a", ttl=60)
+    backend.set("b", b"b", ttl=60)
+    backend.get("a")
+    backend.set("c", b"c", ttl=60)
+
+    assert backend.get("a") == b"a"
+    assert backend.get("b") is None
+    assert backend.get("c") == b"c"
+
+
+def test_lru_cache_backend_expires_items():
+    backend = LRUCacheBackend(max_size=2)
+
+    backend.set("a", b"a", ttl=0)
+
+    assert backend.get("a") is None
+
+
+def test_task_cache_invalidate_only_affects_user():
+    cache = TaskCache(LRUCacheBackend(max_size=10), ttl=60)
+    target = date(2024, 7, 24)
+
+    cache.set(1, target, cache.generation(1), b"user_1")
+    cache.set(2, target, cache.generation(2), b"user_2")
+    cache.invalidate(1)
+
+    assert cache.get(1, target, cache.generation(1)) is None
+    assert cache.get(2, target, cache.generation(2)) == b"user_2"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_task_cache_set_after_invalidate_is_not_served():
+    cache = TaskCache(LRUCacheBackend(max_size=10), ttl=60)
+    target = date(2024, 7, 24)
+
+    # 조회 도중 다른 요청의 쓰기가 커밋된 경우
+    generation = cache.generation(1)
+    cache.invalidate(1)
+    cache.set(1, target, generation, b"stale")
+
+    assert cache.get(1, target, cache.generation(1)) is None
+
+
+def test_task_cache_lookup():
+    cache = TaskCache(LRUCacheBackend(max_size=10), ttl=60)
+    target = date(2024, 7, 24)
+
+    assert asyncio.run(cache.run(cache.lookup, 1, target)) == (0, None)
+
+    asyncio.run(cache.run(cache.set, 1, target, 0, b"user_1"))
+
+    assert asyncio.run(cache.run(cache.lookup, 1, target)) == (0, b"user_1")
+
+
+def test_redis_cache_backend_unavailable():
+    pytest.importorskip("redis")
+    cache = TaskCache(
+        RedisCacheBackend("redis://127.0.0.1:1/0", timeout=0.1), ttl=60
+    )
+    target = date(2024, 7, 24)
+
+    cache.set(1, target, 0, b"user_1")
+
+    assert cache.lookup(1, target) == (None, None)
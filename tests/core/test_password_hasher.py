@@ -0,0 +1,38 @@
+import pytest
+from fastapi import HTTPException
+
+from app.api.errors import TOO_MANY_REQUESTS
+from app.core.auth import PasswordHasher
+
+
+@pytest.fixture
+def password_hasher():
+    password_hasher = PasswordHasher(max_workers=1, max_pending=2)
+
+    yield password_hasher
+
+    password_hasher.shutdown()
+
+
+@pytest.mark.anyio
+async def test_password_hasher_hash_and_verify(
+    password_hasher: PasswordHasher,
+):
+    password_hash = await password_hasher.hash("test123")
+
+    assert await password_hasher.verify("test123", password_hash)
+    assert not await password_hasher.verify("wrong", password_hash)
+    assert password_hasher.pending == 0
+
+
+@pytest.mark.anyio
+async def test_password_hasher_rejects_when_saturated(
+    password_hasher: PasswordHasher,
+):
+    password_hasher.pending = password_hasher.max_pending
+
+    with pytest.raises(HTTPException) as exc_info:
+        await password_hasher.hash("test123")
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.detail == TOO_MANY_REQUESTS
@@ -0,0 +1,28 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.responses import FastJSONResponse
+from app.schemas.todo import TodoPublic
+
+
+def test_fast_json_response_matches_json_response():
+    now = datetime(2024, 6, 12, 7, 0, 0, 123456)
+    todo_list = [
+        TodoPublic(
+            id=1,
+            title="할 일",
+            order=0,
+            target_date=now,
+            content=None,
+            created_at=now.replace(tzinfo=timezone(timedelta(hours=9))),
+            updated_at=now.replace(microsecond=0),
+            completed_at=None,
+        )
+    ]
+
+    assert (
+        FastJSONResponse(todo_list).body
+        == JSONResponse(jsonable_encoder(todo_list)).body
+    )
@@ -0,0 +1,76 @@
+from datetime import timedelta
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.testclient import TestClient
+
+from app.api.errors import EXPIRED_TOKEN
+from app.core import auth
+from app.core.auth import (
+    TokenData,
+    access_token_cache,
+    create_access_token,
+    create_jwt_token,
+    verify_access_token,
+)
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.fixture
+def decode_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(token, *args, **kwargs):
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+
+    return calls
+
+
+def test_verify_access_token_cached(decode_calls: list[str]):
+    token = create_access_token(1)
+
+    assert verify_access_token(bearer(token)) == 1
+    assert verify_access_token(bearer(token)) == 1
+    assert len(decode_calls) == 1
+
+
+def test_verify_access_token_cache_expires(decode_calls: list[str]):
+    token = create_access_token(1)
+    access_token_cache.set(token, 1, ttl=0)
+
+    assert verify_access_token(bearer(token)) == 1
+    assert len(decode_calls) == 1
+
+
+def test_verify_access_token_expired_not_cached():
+    token = create_jwt_token(
+        data=TokenData(id=1, type="access").dict(),
+        expires_delta=timedelta(seconds=-1),
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        verify_access_token(bearer(token))
+
+    assert exc_info.value.detail == EXPIRED_TOKEN
+    assert access_token_cache.get(token) is None
+
+
+def test_verify_access_token_once_per_request(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    decode_calls: list[str],
+):
+    response = client.get(
+        "/task", params=dict(date="2024-07-24"), headers=access_token_headers
+    )
+
+    assert response.status_code == 200
+    assert len(decode_calls) == 1
@@ -0,0 +1,26 @@
+from datetime import date, datetime
+
+from pytz import timezone
+
+from app.core.utils import get_date_range
+
+
+def test_get_date_range():
+    start, end = get_date_range(date(2024, 7, 24))
+
+    assert start == datetime(2024, 7, 24)
+    assert end == datetime(2024, 7, 25)
+
+
+def test_get_date_range_other_timezone():
+    start, end = get_date_range(date(2024, 7, 24), timezone("UTC"))
+
+    assert start == datetime(2024, 7, 24, 9)
+    assert end == datetime(2024, 7, 25, 9)
+
+
+def test_get_date_range_dst_timezone():
+    start, end = get_date_range(date(2024, 3, 10), timezone("US/Eastern"))
+
+    assert start == datetime(2024, 3, 10, 14)
+    assert end == datetime(2024, 3, 11, 13)
@@ -0,0 +1,115 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.jobs.backfill_habit_stats import backfill_habit_stats
+from app.models.models import Habit, HabitLog, HabitStats, User
+
+
+def make_habit(repeat_days: str) -> Habit:
+    return Habit(
+        title="habit",
+        start_time_minutes=540,
+        end_time_minutes=1260,
+        repeat_time_minutes=60,
+        repeat_days=repeat_days,
+    )
+
+
+def make_stats() -> HabitStats:
+    return HabitStats(current_streak=0, best_streak=0, total_completions=0)
+
+
+# 2024-06-10 은 월요일
+@pytest.mark.parametrize(
+    "repeat_days,completed_dates,current_streak,best_streak",
+    [
+        ("0123456", [date(2024, 6, 10), date(2024, 6, 11)], 2, 2),
+        ("0123456", [date(2024, 6, 10), date(2024, 6, 12)], 1, 1),
+        (
+            "024",
+            [date(2024, 6, 10), date(2024, 6, 12), date(2024, 6, 14)],
+            3,
+            3,
+        ),
+        (
+            "024",
+            [date(2024, 6, 10), date(2024, 6, 11), date(2024, 6, 12)],
+            2,
+            2,
+        ),
+        ("0", [date(2024, 6, 3), date(2024, 6, 10), date(2024, 6, 10)], 2, 2),
+        (
+            "0123456",
+            [date(2024, 6, 1), date(2024, 6, 2), date(2024, 6, 10)],
+            1,
+            2,
+        ),
+    ],
+)
+def test_record_completion(
+    repeat_days: str,
+    completed_dates: list[date],
+    current_streak: int,
+    best_streak: int,
+):
+    habit = make_habit(repeat_days)
+    stats = make_stats()
+
+    for completed_date in completed_dates:
+        stats.record_completion(habit, completed_date)
+
+    assert stats.current_streak == current_streak
+    assert stats.best_streak == best_streak
+    assert stats.total_completions == len(completed_dates)
+    assert stats.last_completed_date == max(completed_dates)
+
+
+def test_current_streak_on():
+    habit = make_habit("024")
+    stats = make_stats()
+
+    stats.record_completion(habit, date(2024, 6, 10))
+    stats.record_completion(habit, date(2024, 6, 12))
+
+    assert stats.current_streak_on(habit, date(2024, 6, 13)) == 2
+    assert stats.current_streak_on(habit, date(2024, 6, 14)) == 2
+    assert stats.current_streak_on(habit, date(2024, 6, 15)) == 0
+
+
+def test_backfill_habit_stats(session: Session, add_user: User):
+    habits = [make_habit("0123456") for _ in range(3)]
+    for habit in habits:
+        habit.user_id = add_user.id
+    session.add_all(habits)
+    session.flush()
+
+    session.add_all(
+        HabitLog(habit_id=habits[0].id, completed_at=completed_at)
+        for completed_at in [
+            datetime(2024, 6, 10, 9),
+            datetime(2024, 6, 10, 18),
+            datetime(2024, 6, 11, 9),
+            datetime(2024, 6, 13, 9),
+            datetime(2024, 6, 14, 9),
+            datetime(2024, 6, 15, 9),
+        ]
+    )
+    session.add(HabitStats(habit_id=habits[1].id, total_completions=99))
+    session.commit()
+
+    assert backfill_habit_stats(session, batch_size=2) == 3
+
+    session.expire_all()
+    first, second, third = (
+        session.get(HabitStats, habit.id) for habit in habits
+    )
+
+    assert first.total_completions == 6
+    assert first.current_streak == 3
+    assert first.best_streak == 3
+    assert first.last_completed_date == date(2024, 6, 15)
+    assert second.total_completions == 0
+    assert second.last_completed_date is None
+    assert third.best_streak == 0
@@ -0,0 +1,192 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+USER_COUNT = 200
+
+MOCK_DATA_SQL = [
+    f"""
+    INSERT INTO "user" (username, password, email)
+    SELECT 'user_' || i, 'pass_' || i, 'user_' || i || '@example.com'
+    FROM generate_series(1, {USER_COUNT}) AS i
+    """,
+    f"""
+    INSERT INTO todo (
+        title, "order", target_date, created_at, updated_at,
+        completed_at, user_id
+    )
+    SELECT
+        'Todo ' || i,
+        i % 10,
+        now() - (i % 365) * interval '1 day',
+        now(),
+        now(),
+        CASE WHEN i % 3 = 0 THEN now() - (i % 365) * interval '1 day' END,
+        i % {USER_COUNT} + 1
+    FROM generate_series(1, 40000) AS i
+    """,
+    f"""
+    INSERT INTO habit (
+        title, end_time_minutes, start_time_minutes, repeat_days,
+        repeat_time_minutes, activated, created_at, updated_at, user_id
+    )
+    SELECT
+        'Habit ' || i, 1260, 540, '0123456', 60, i % 5 <> 0, now(), now(),
+        i % {USER_COUNT} + 1
+    FROM generate_series(1, 4000) AS i
+    """,
+    """
+    INSERT INTO habit_log (completed_at, habit_id)
+    SELECT now() - (i % 365) * interval '1 day', i % 4000 + 1
+    FROM generate_series(1, 80000) AS i
+    """,
+    f"""
+    INSERT INTO routine (
+        title, start_time_minutes, repeat_days, created_at, updated_at,
+        user_id
+    )
+    SELECT 'Routine ' || i, i % 1440, '0123456', now(), now(),
+        i % {USER_COUNT} + 1
+    FROM generate_series(1, 4000) AS i
+    """,
+    f"""
+    INSERT INTO routine_element (
+        title, "order", duration_minutes, created_at, updated_at,
+        routine_id, user_id
+    )
+    SELECT 'Routine Element ' || i, i / 4000, 10, now(), now(),
+        i % 4000 + 1, i % 4000 % {USER_COUNT} + 1
+    FROM generate_series(1, 16000) AS i
+    """,
+    """
+    INSERT INTO routine_log (
+        duration_seconds, completed_at, is_skipped, routine_id,
+        routine_element_id
+    )
+    SELECT 300, now() - (i / 16000) * interval '1 day', false,
+        i % 16000 % 4000 + 1, i % 16000 + 1
+    FROM generate_series(1, 80000) AS i
+    """,
+    """
+    INSERT INTO routine_daily_summary (
+        routine_id, log_date, log_count, completed_count, skipped_count,
+        total_duration_seconds, updated_at
+    )
+    SELECT r.id, d::date, 4, 4, 0, 1200, now()
+    FROM routine AS r,
+        generate_series(now() - interval '59 days', now(), '1 day') AS d
+    """,
+    "ANALYZE",
+]
+
+
+@pytest.fixture
+def mock_dataset(session: Session):
+    for statement in MOCK_DATA_SQL:
+        session.execute(text(statement))
+    session.commit()
+
+
+def explain(session: Session, query: str) -> str:
+    rows = session.execute(text(f"EXPLAIN {query}")).scalars().all()
+    return "\n".join(rows)
+
+
+@pytest.mark.parametrize(
+    "index_name,query",
+    [
+        (
+            "ix_todo_user_id_completed_at_target_date",
+            """
+            SELECT * FROM todo
+            WHERE user_id = 7 AND completed_at IS NULL
+            ORDER BY target_date
+            """,
+        ),
+        (
+            "ix_habit_user_id_activated_id",
+            """
+            SELECT * FROM habit
+            WHERE user_id = 7 AND activated AND repeat_mask & 8 <> 0
+            ORDER BY id DESC
+            """,
+        ),
+        (
+            "ix_habit_log_habit_id_completed_at",
+            """
+            SELECT * FROM habit_log
+            WHERE habit_id IN (7, 8, 9)
+            AND completed_at >= now() - interval '1 day'
+            """,
+        ),
+        (
+            "ix_routine_user_id_start_time_minutes",
+            """
+            SELECT * FROM routine
+            WHERE user_id = 7
+            ORDER BY start_time_minutes
+            """,
+        ),
+        (
+            "ix_routine_element_live_routine_id_order",
+            """
+            SELECT * FROM routine_element
+            WHERE routine_id IN (7, 8, 9) AND deleted_at IS NULL
+            ORDER BY routine_id, "order"
+            """,
+        ),
+        (
+            "ix_routine_element_deleted_at",
+            """
+            SELECT id FROM routine_element
+            WHERE deleted_at < now() - interval '30 days'
+            ORDER BY deleted_at
+            LIMIT 1000
+            """,
+        ),
+        (
+            "ix_routine_log_routine_id_completed_at",
+            """
+            SELECT * FROM routine_log
+            WHERE routine_id IN (7, 8, 9)
+            AND completed_at >= now() - interval '1 day'
+            """,
+        ),
+        (
+            "ix_todo_open_user_id_target_date_order",
+            """
+            SELECT * FROM todo
+            WHERE user_id = 7 AND completed_at IS NULL
+            AND (target_date, "order") >= (now() - interval '30 days', 3)
+            ORDER BY target_date, "order", updated_at DESC, id
+            LIMIT 30
+            """,
+        ),
+        (
+            "ix_todo_completed_user_id_completed_at_id",
+            """
+            SELECT * FROM todo
+            WHERE user_id = 7 AND completed_at IS NOT NULL
+            AND (completed_at, id) < (now() - interval '30 days', 100)
+            ORDER BY completed_at DESC, id DESC
+            LIMIT 30
+            """,
+        ),
+        (
+            "routine_daily_summary_pkey",
+            """
+            SELECT * FROM routine_daily_summary
+            WHERE routine_id = 7
+            AND log_date BETWEEN current_date - 29 AND current_date
+            ORDER BY log_date
+            """,
+        ),
+    ],
+)
+def test_hot_queries_use_index(
+    session: Session, mock_dataset: None, index_name: str, query: str
+):
+    plan = explain(session, query)
+
+    assert "Seq Scan" not in plan
+    assert index_name in plan
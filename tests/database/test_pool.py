@@ -0,0 +1,54 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from app.database.pool import instrumented_pool_class
+
+
+def slow_connect():
+    time.sleep(0.2)
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+@pytest.fixture
+def pool() -> QueuePool:
+    return instrumented_pool_class(QueuePool)(
+        slow_connect, pool_size=1, max_overflow=0, timeout=1
+    )
+
+
+def test_wait_excludes_connect_time(pool: QueuePool):
+    pool.connect().close()
+
+    snapshot = pool.stats.snapshot(pool)
+    assert snapshot["wait_count"] == 1
+    assert snapshot["wait_seconds_max"] < 0.1
+
+
+def test_wait_counts_queue_time(pool: QueuePool):
+    connection = pool.connect()
+    timer = threading.Timer(0.3, connection.close)
+    timer.start()
+
+    pool.connect().close()
+    timer.join()
+
+    snapshot = pool.stats.snapshot(pool)
+    assert snapshot["wait_count"] == 2
+    assert 0.25 < snapshot["wait_seconds_max"] < 1
+
+
+def test_timeout(pool: QueuePool):
+    connection = pool.connect()
+
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+    connection.close()
+
+    snapshot = pool.stats.snapshot(pool)
+    assert snapshot["timeouts"] == 1
+    assert snapshot["wait_count"] == 1
@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.models import Habit, User
+
+
+@pytest.fixture
+def add_habits(session: Session, add_user: User) -> list[Habit]:
+    habits = [
+        Habit(
+            title=f"habit_{repeat_days}",
+            start_time_minutes=540,
+            end_time_minutes=1260,
+            repeat_time_minutes=60,
+            repeat_days=repeat_days,
+            user_id=add_user.id,
+        )
+        for repeat_days in ["0", "0135", "246", "0123456"]
+    ]
+
+    session.add_all(habits)
+    session.commit()
+
+    return habits
+
+
+def test_repeat_mask_computed(session: Session, add_habits: list[Habit]):
+    masks = session.scalars(select(Habit.repeat_mask).order_by(Habit.id)).all()
+
+    assert masks == [0b1, 0b101011, 0b1010100, 0b1111111]
+
+
+@pytest.mark.parametrize("weekday", range(7))
+def test_repeats_on(session: Session, add_habits: list[Habit], weekday: int):
+    ids = session.scalars(
+        select(Habit.id).where(Habit.repeats_on(weekday)).order_by(Habit.id)
+    ).all()
+
+    assert ids == [
+        habit.id for habit in add_habits if habit.repeats_on(weekday)
+    ]